@@ -1968,7 +1968,47 @@ def show_templates_forms():
                                 )
                         except Exception as e:
                             st.error(f"Error loading template: {str(e)}")
-    
+
+            # Entity-wide report assembled from cached per-control sections
+            st.markdown("---")
+            st.markdown("### Entity Compliance Report (All Controls)")
+            st.caption("Only controls whose specifications or compliance measurements changed since the last run are re-rendered.")
+
+            if st.button("📥 Generate Entity Compliance Report", use_container_width=True, key="generate_entity_compliance_report"):
+                try:
+                    with st.spinner("🔄 Assembling entity report from control sections..."):
+                        from professional_templates import create_entity_compliance_report
+                        from sans_data_loader import get_all_specifications
+
+                        specifications_by_control = {}
+                        for spec in get_all_specifications():
+                            specifications_by_control.setdefault(spec.get('control_id'), []).append(spec)
+
+                        filename, rendered_control_ids = create_entity_compliance_report(
+                            all_controls,
+                            specifications_by_control,
+                            st.session_state.get('compliance_data', {})
+                        )
+
+                        st.session_state.entity_compliance_report = filename
+                        st.success(f"✅ Entity report generated! {len(rendered_control_ids)} of {len(all_controls)} control sections re-rendered.")
+                except Exception as e:
+                    st.error(f"❌ Error: {str(e)}")
+                    import traceback
+                    with st.expander("Error Details"):
+                        st.code(traceback.format_exc())
+
+            if st.session_state.get('entity_compliance_report') and os.path.exists(st.session_state.entity_compliance_report):
+                with open(st.session_state.entity_compliance_report, 'rb') as f:
+                    st.download_button(
+                        "📥 Download Entity Compliance Report (PDF)",
+                        f.read(),
+                        file_name=os.path.basename(st.session_state.entity_compliance_report),
+                        mime="application/pdf",
+                        use_container_width=True,
+                        key="download_entity_compliance_report"
+                    )
+
     # ============================================
     # AUDIT CHECKLISTS SECTION
     # ============================================
@@ -2836,10 +2876,9 @@ def show_templates_forms():
                             image_path = saved_image_path
                             if product_image:
                                 try:
-                                    os.makedirs("uploaded_images", exist_ok=True)
-                                    image_path = f"uploaded_images/product_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{product_image.name}"
-                                    with open(image_path, "wb") as f:
-                                        f.write(product_image.getbuffer())
+                                    # Normalize once on ingest; re-uploads of the same image hit the cache
+                                    from image_pipeline import ingest_uploaded_image
+                                    image_path = ingest_uploaded_image(product_image.getvalue(), product_image.name)
                                 except Exception as e:
                                     st.warning(f"Could not save image: {str(e)}")
                                     image_path = None
@@ -3936,6 +3975,201 @@ def show_compliance_measurement():
                 mime="application/json"
             )
 
+def show_schema_workbook_browser(workbook):
+    """Workbook summary and per-table browser for multi-sheet schema analysis"""
+    summary = workbook.get('summary', {})
+    st.markdown("---")
+    st.markdown(f"### 📚 Workbook: {workbook.get('file_name', '')}")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Tables", f"{summary.get('total_tables', 0)}/{workbook.get('sheet_count', 0)}")
+    with col2:
+        st.metric("Total Columns", summary.get('total_columns', 0))
+    with col3:
+        st.metric("NDMO Compliant Columns", f"{summary.get('compliance_percentage', 0):.1f}%")
+    with col4:
+        st.metric("Issues", summary.get('total_issues', 0))
+    
+    if summary.get('tables_without_primary_key'):
+        st.warning(f"⚠️ Tables without a primary key: {', '.join(summary['tables_without_primary_key'])}")
+    if summary.get('tables_without_audit_trail'):
+        st.warning(f"⚠️ Tables without an audit trail: {', '.join(summary['tables_without_audit_trail'])}")
+    for sheet_name, error in workbook.get('errors', {}).items():
+        st.caption(f"Skipped sheet '{sheet_name}': {str(error).splitlines()[0]}")
+    
+    table_summaries = workbook.get('table_summaries', [])
+    if not table_summaries:
+        return
+    summary_df = pd.DataFrame([{
+        'Table': row['sheet_name'],
+        'Columns': row['total_columns'],
+        'Fields': row['total_fields'],
+        'Primary Key': '✅' if row['has_primary_key'] else '❌',
+        'Audit Trail': '✅' if row['has_audit_trail'] else '❌',
+        'NDMO Score': f"{row['compliance_score']:.1f}%",
+        'Issues': row['issue_count']
+    } for row in table_summaries])
+    st.dataframe(summary_df, use_container_width=True, hide_index=True)
+    
+    # The selected table becomes the current schema analysis for the other tabs and reports
+    selected_table = st.selectbox(
+        "Browse table",
+        [row['sheet_name'] for row in table_summaries],
+        key="schema_workbook_table"
+    )
+    analysis = workbook['tables'][selected_table]
+    st.session_state.schema_analysis = analysis
+    
+    with st.expander(f"📋 Columns of {selected_table}", expanded=True):
+        compliance = analysis.get('ndmo_compliance', {})
+        st.dataframe(pd.DataFrame([{
+            'Column': col.get('column_name'),
+            'Detected Type': col.get('detected_type'),
+            'Type Confidence': f"{col.get('type_confidence', 0) * 100:.0f}%",
+            'Completeness': f"{col.get('completeness', 0):.1f}%",
+            'Uniqueness': f"{col.get('uniqueness', 0):.1f}%",
+            'NDMO Score': f"{compliance.get(col.get('column_name'), {}).get('score', 0) * 100:.1f}%"
+        } for col in analysis.get('column_analysis', [])]), use_container_width=True, hide_index=True)
+        for issue in analysis.get('issues', []):
+            st.warning(f"**{issue.get('severity', 'Unknown')}**: {issue.get('issue', '')} - {issue.get('impact', '')}")
+    
+    if st.button("📄 Generate Workbook Report", use_container_width=True, key="generate_workbook_report"):
+        try:
+            with st.spinner("🔄 Generating workbook report..."):
+                from data_quality_report import create_workbook_quality_report
+                logo_path = "logo@3x.png" if os.path.exists("logo@3x.png") else None
+                st.session_state.schema_workbook_report = create_workbook_quality_report(
+                    workbook, workbook.get('file_name', 'schema_file.xlsx'), logo_path=logo_path
+                )
+        except Exception as e:
+            st.error(f"❌ Error generating workbook report: {str(e)}")
+    
+    report_filename = st.session_state.get('schema_workbook_report')
+    if report_filename and os.path.exists(report_filename):
+        with open(report_filename, 'rb') as f:
+            st.download_button(
+                "📥 Download Workbook Report",
+                f.read(),
+                file_name=os.path.basename(report_filename),
+                mime="application/pdf",
+                use_container_width=True,
+                key="download_workbook_report"
+            )
+
+def show_quality_monitoring():
+    """Incremental monitoring: each new batch of a dataset is checked against its saved history"""
+    from data_readers import UPLOAD_TYPES
+    from quality_monitor import DEFAULT_DRIFT_THRESHOLDS, SERIES_METRICS, DatasetMonitor, MonitorStore
+
+    st.markdown("### 📡 Quality Monitoring")
+    st.markdown("Check each new batch of a dataset (e.g. a daily load) against everything loaded before, without reprocessing the history")
+
+    if 'schema_analysis' not in st.session_state:
+        st.info("💡 Analyze a schema first to monitor datasets against it")
+        return
+
+    store = MonitorStore()
+    known = store.datasets()
+    new_label = "➕ New dataset"
+    dataset = st.selectbox("Dataset", known + [new_label], key="monitor_dataset") if known else new_label
+    if dataset == new_label:
+        default_name = os.path.splitext(st.session_state.schema_analysis.get('file_name', 'dataset'))[0]
+        dataset = st.text_input("Dataset name", value=default_name, key="monitor_new_dataset").strip()
+
+    try:
+        monitor = store.load(dataset) if dataset in known else None
+    except Exception as e:
+        st.error(f"❌ Could not load monitoring state: {str(e)}")
+        return
+
+    with st.expander("⚙️ Drift Thresholds"):
+        current = monitor.thresholds if monitor else DEFAULT_DRIFT_THRESHOLDS
+        thresholds = {}
+        for key, label in (
+            ('completeness_drop', "Completeness drop"),
+            ('duplicate_rate', "Duplicate rows in a batch"),
+            ('validity_drop', "Type conformance drop"),
+            ('rule_pass_rate_drop', "Business rule pass rate drop")
+        ):
+            thresholds[key] = st.number_input(
+                f"{label} (%)", min_value=0.0, max_value=100.0, value=float(current[key] * 100), step=0.5,
+                key=f"monitor_threshold_{key}"
+            ) / 100
+        st.caption("Drops are measured against all earlier batches; business rules uploaded above apply when a dataset is created.")
+
+    batch_file = st.file_uploader("Upload Batch (Excel, CSV/TSV or Parquet)", type=UPLOAD_TYPES, key="monitor_batch_upload")
+    if batch_file and dataset and st.button("📡 Check Batch", use_container_width=True, key="monitor_batch_btn"):
+        tmp_path = None
+        try:
+            if monitor is None:
+                business_rules = None
+                if st.session_state.get('rules_upload'):
+                    from business_rules import load_rules
+                    business_rules = load_rules(st.session_state.rules_upload.getvalue(), st.session_state.rules_upload.name)
+                monitor = DatasetMonitor(dataset, st.session_state.schema_analysis, business_rules)
+            monitor.thresholds.update(thresholds)
+
+            import tempfile
+            file_ext = os.path.splitext(batch_file.name)[1].lower() or '.xlsx'
+            with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
+                tmp_file.write(batch_file.getvalue())
+                tmp_path = tmp_file.name
+
+            with st.spinner("Checking batch..."):
+                outcome = st.session_state.data_processor.monitor_batch(tmp_path, monitor, source=batch_file.name)
+            if outcome.get('success'):
+                store.save(monitor)
+                st.success(f"✅ Batch checked in {outcome['run']['duration_s']:.1f} s and added to **{dataset}**")
+            else:
+                st.error(f"❌ {outcome.get('error', 'Monitoring failed')}")
+                monitor = store.load(dataset)
+        except Exception as e:
+            st.error(f"❌ Error checking batch: {str(e)}")
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    if not monitor or not monitor.runs:
+        return
+
+    last_run = monitor.runs[-1]
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Runs", len(monitor.runs))
+    with col2:
+        st.metric("Rows Monitored", f"{monitor.total_rows:,}")
+    with col3:
+        st.metric("Last Batch Score", f"{last_run['metrics']['overall_score'] * 100:.1f}%")
+    with col4:
+        st.metric("Drift Flags", len(last_run['drift']))
+
+    if last_run['drift']:
+        for flag in last_run['drift']:
+            st.warning(f"⚠️ {flag['message']}")
+    else:
+        st.success(f"✅ No drift in run {last_run['run']} ({last_run['source'] or 'batch'})")
+
+    history = monitor.history_frame()
+    series = [metric for metric in SERIES_METRICS if history[metric].notna().any()]
+    fig = go.Figure()
+    for metric in series:
+        fig.add_trace(go.Scatter(x=history['run'], y=history[metric] * 100, mode='lines+markers', name=metric.replace('_', ' ').title()))
+    fig.update_layout(xaxis_title="Run", yaxis_title="Score (%)", height=350, margin={'t': 20, 'b': 20})
+    st.plotly_chart(fig, use_container_width=True)
+
+    with st.expander("📋 Run History"):
+        st.dataframe(history, use_container_width=True, hide_index=True)
+        st.download_button(
+            "📥 Download Metric Time Series (JSON)",
+            json.dumps({'dataset': monitor.dataset, 'runs': monitor.runs}, indent=2, default=str),
+            file_name=f"monitoring_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json",
+            key="download_monitoring_series"
+        )
+    with st.expander("📊 Columns (all batches)"):
+        st.dataframe(pd.DataFrame(monitor.column_summary()), use_container_width=True, hide_index=True)
+
 def show_data_quality_dashboard():
     """Data Quality Dashboard - SANS Data Quality System"""
     st.header("🛡️ SANS Data Quality System")
@@ -3946,6 +4180,9 @@ def show_data_quality_dashboard():
         from ndmo_quality_standards import NDMOQualityStandards
         from smart_schema_analyzer import SmartSchemaAnalyzer
         from smart_data_processor import SmartDataProcessor
+        from data_readers import UPLOAD_TYPES, schema_dtypes
+        from data_writers import EXPORT_FORMATS, export_processed_data, release_result_files
+        from near_duplicates import MAX_BUCKET_SIZE
     except ImportError as e:
         st.error(f"Error importing data quality modules: {str(e)}")
         return
@@ -3971,8 +4208,8 @@ def show_data_quality_dashboard():
         st.markdown("Upload and analyze your schema file to check NDMO compliance")
         
         uploaded_schema = st.file_uploader(
-            "Upload Schema File (Excel)",
-            type=['xlsx', 'xls'],
+            "Upload Schema File (Excel, CSV/TSV or Parquet)",
+            type=UPLOAD_TYPES,
             key="schema_upload"
         )
         
@@ -3992,8 +4229,8 @@ def show_data_quality_dashboard():
                 tmp_path = None
                 
                 try:
-                    # Determine file extension
-                    file_ext = '.xlsx' if uploaded_schema.name.endswith('.xlsx') else '.xls'
+                    # Keep the extension; the reader layer detects the format from content and name
+                    file_ext = os.path.splitext(uploaded_schema.name)[1].lower() or '.xlsx'
                     
                     with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
                         tmp_file.write(uploaded_schema.getvalue())
@@ -4013,7 +4250,32 @@ def show_data_quality_dashboard():
                     tmp_path = None
             
             if tmp_path and os.path.exists(tmp_path):
-                if st.button("🔍 Analyze Schema", use_container_width=True):
+                analyze_all_sheets = st.checkbox(
+                    "Analyze all sheets (one table per sheet)",
+                    key="schema_all_sheets",
+                    help="Profiles every worksheet concurrently and builds a workbook-level summary"
+                )
+                if analyze_all_sheets:
+                    if st.button("🔍 Analyze All Sheets", use_container_width=True, key="analyze_workbook"):
+                        try:
+                            with st.spinner("🔄 Analyzing all sheets..."):
+                                workbook = st.session_state.schema_analyzer.analyze_workbook(tmp_path)
+                            if 'error' in workbook:
+                                st.error(f"❌ {workbook['error']}")
+                            else:
+                                workbook['file_name'] = uploaded_schema.name
+                                st.session_state.schema_workbook_analysis = workbook
+                                if workbook.get('from_cache'):
+                                    st.caption("⚡ This workbook was analyzed before; results were loaded from the cache.")
+                                st.session_state.pop('schema_workbook_report', None)
+                                st.success(f"✅ Analyzed {len(workbook['tables'])} of {workbook['sheet_count']} sheets")
+                        finally:
+                            if os.path.exists(tmp_path):
+                                try:
+                                    os.unlink(tmp_path)
+                                except Exception:
+                                    pass
+                elif st.button("🔍 Analyze Schema", use_container_width=True):
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
@@ -4025,7 +4287,14 @@ def show_data_quality_dashboard():
                         if not os.path.exists(tmp_path):
                             raise FileNotFoundError(f"Temporary file not found: {tmp_path}")
                         
-                        analysis = st.session_state.schema_analyzer.analyze_schema(tmp_path)
+                        # A re-upload of the same schema only recomputes added or changed columns
+                        previous_analysis = st.session_state.get('schema_analysis')
+                        if previous_analysis and previous_analysis.get('file_name') == uploaded_schema.name:
+                            analysis = st.session_state.schema_analyzer.analyze_schema_incremental(tmp_path, previous_analysis)
+                        else:
+                            analysis = st.session_state.schema_analyzer.analyze_schema(tmp_path)
+                        if 'error' not in analysis:
+                            analysis['file_name'] = uploaded_schema.name
                         
                         if 'error' in analysis:
                             progress_bar.empty()
@@ -4037,7 +4306,44 @@ def show_data_quality_dashboard():
                             
                             # Store results
                             st.session_state.schema_analysis = analysis
-                            
+
+                            if analysis.get('from_cache'):
+                                st.caption("⚡ This file was analyzed before; results were loaded from the cache.")
+
+                            change_report = analysis.get('change_report')
+                            if change_report:
+                                with st.expander("🔄 Changes Since Previous Upload", expanded=True):
+                                    chg1, chg2, chg3, chg4 = st.columns(4)
+                                    with chg1:
+                                        st.metric("Added Columns", len(change_report['added_columns']))
+                                    with chg2:
+                                        st.metric("Removed Columns", len(change_report['removed_columns']))
+                                    with chg3:
+                                        st.metric("Changed Columns", len(change_report['changed_columns']))
+                                    with chg4:
+                                        st.metric("Avg. NDMO Score", f"{change_report['compliance_delta']:+.1f} pts")
+                                    if change_report['added_columns']:
+                                        st.write(f"**Added:** {', '.join(change_report['added_columns'])}")
+                                    if change_report['removed_columns']:
+                                        st.write(f"**Removed:** {', '.join(change_report['removed_columns'])}")
+                                    if change_report['score_deltas']:
+                                        st.dataframe(pd.DataFrame([{
+                                            'Column': delta['column_name'],
+                                            'Previous Score': f"{delta['previous_score'] * 100:.1f}%",
+                                            'Current Score': f"{delta['current_score'] * 100:.1f}%",
+                                            'Change': f"{delta['delta'] * 100:+.1f} pts"
+                                        } for delta in change_report['score_deltas']]), use_container_width=True, hide_index=True)
+                                    for flag, change in change_report['flag_changes'].items():
+                                        st.info(f"**{flag.replace('_', ' ').title()}:** {change['previous']} → {change['current']}")
+                                    for issue in change_report['resolved_issues']:
+                                        st.success(f"✅ Resolved: {issue}")
+                                    for issue in change_report['new_issues']:
+                                        st.warning(f"⚠️ New issue: {issue}")
+
+                            if analysis.get('profiling_mode') == 'streaming':
+                                st.info(f"ℹ️ Large sheet profiled in streaming mode ({analysis.get('total_fields', 0):,} rows). "
+                                        "Distinct counts above 2,048 per column are HyperLogLog estimates (about ±1.6%).")
+
                             # Display results
                             st.markdown("### 📊 Analysis Summary")
                             
@@ -4097,6 +4403,7 @@ def show_data_quality_dashboard():
                                     display_data.append({
                                         'Column Name': col_name,
                                         'Data Type': col_info.get('detected_type', 'Unknown'),
+                                        'Type Confidence': f"{col_info.get('type_confidence', 0)*100:.0f}%",
                                         'Completeness %': f"{col_info.get('completeness', 0):.1f}%",
                                         'Uniqueness %': f"{col_info.get('uniqueness', 0):.1f}%",
                                         'Non-Null': col_info.get('non_null_count', 0),
@@ -4130,6 +4437,8 @@ def show_data_quality_dashboard():
                                         col1, col2, col3, col4 = st.columns(4)
                                         with col1:
                                             st.metric("Data Type", col_info.get('detected_type', 'Unknown'))
+                                            if col_info.get('type_distribution'):
+                                                st.caption(', '.join(f"{type_name} {share*100:.0f}%" for type_name, share in col_info['type_distribution'].items()))
                                         with col2:
                                             st.metric("Completeness", f"{col_info.get('completeness', 0):.1f}%")
                                         with col3:
@@ -4346,7 +4655,7 @@ def show_data_quality_dashboard():
                         # Provide helpful suggestions
                         st.warning("💡 **Troubleshooting Tips:**")
                         st.markdown("""
-                        - Make sure the file is a valid Excel file (.xlsx or .xls)
+                        - Make sure the file is a valid Excel (.xlsx or .xls), CSV/TSV or Parquet file
                         - Check that the file is not corrupted
                         - Ensure the file is not password protected
                         - Try opening the file in Excel first to verify it's valid
@@ -4360,6 +4669,9 @@ def show_data_quality_dashboard():
                             except Exception as cleanup_error:
                                 # Log but don't show cleanup errors to user
                                 pass
+        
+        if 'schema_workbook_analysis' in st.session_state:
+            show_schema_workbook_browser(st.session_state.schema_workbook_analysis)
     
     with dq_tab2:
         st.subheader("⚙️ Data Processing")
@@ -4385,11 +4697,18 @@ def show_data_quality_dashboard():
         st.markdown("---")
         
         uploaded_data = st.file_uploader(
-            "Upload Data File (Excel)",
-            type=['xlsx', 'xls'],
+            "Upload Data File (Excel, CSV/TSV or Parquet)",
+            type=UPLOAD_TYPES,
             key="data_upload"
         )
         
+        uploaded_rules = st.file_uploader(
+            "Business Rules (optional, JSON or YAML)",
+            type=['json', 'yaml', 'yml'],
+            key="rules_upload",
+            help="Not-null, range, regex, allowed-value, conditional and cross-field rules checked against the data (NDMO BR001)"
+        )
+        
         if uploaded_data:
             # Display file info
             file_size = len(uploaded_data.getvalue())
@@ -4401,7 +4720,7 @@ def show_data_quality_dashboard():
                 st.info("💡 **Steps to follow:**")
                 st.markdown("""
                 1. Go to **Schema Analysis** tab
-                2. Upload your schema file (Excel)
+                2. Upload your schema file (Excel, CSV/TSV or Parquet)
                 3. Click **Analyze Schema** button
                 4. Come back here to process your data file
                 """)
@@ -4420,8 +4739,8 @@ def show_data_quality_dashboard():
                         import tempfile
                         import os
                         
-                        # Determine file extension
-                        file_ext = '.xlsx' if uploaded_data.name.endswith('.xlsx') else '.xls'
+                        # Keep the extension; the reader layer detects the format from content and name
+                        file_ext = os.path.splitext(uploaded_data.name)[1].lower() or '.xlsx'
                         
                         with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
                             tmp_file.write(uploaded_data.getvalue())
@@ -4435,20 +4754,34 @@ def show_data_quality_dashboard():
                             st.error("❌ Data processor not initialized. Please refresh the page.")
                             return
                         
+                        business_rules = None
+                        if uploaded_rules:
+                            from business_rules import load_rules
+                            try:
+                                business_rules = load_rules(uploaded_rules.getvalue(), uploaded_rules.name)
+                            except ValueError as e:
+                                st.error(f"❌ {str(e)}")
+                                return
+                        
                         # Process data
                         status_text.info("🔄 Analyzing data quality...")
                         progress_bar.progress(50)
                         
                         result = st.session_state.data_processor.process_data(
                             tmp_path,
-                            st.session_state.schema_analysis
+                            st.session_state.schema_analysis,
+                            business_rules=business_rules,
+                            export_violations=True
                         )
                         
                         progress_bar.progress(80)
                         
                         if result and result.get('success'):
-                            # Store results
+                            # Store results; the previous result's temporary files (exports, violations) are no longer reachable
+                            release_result_files(st.session_state.get('data_processing_result'))
                             st.session_state.data_processing_result = result
+                            if result.get('from_cache'):
+                                st.caption("⚡ This file was processed before with the same schema; results were loaded from the cache.")
                             
                             progress_bar.progress(100)
                             status_text.success("✅ Data processing completed!")
@@ -4475,7 +4808,7 @@ def show_data_quality_dashboard():
                                     status_text.info("🔄 Step 3/3: Automatically generating reports...")
                                     
                                     try:
-                                        from data_quality_report import create_data_quality_report, create_schema_assessment_report
+                                        from data_quality_report import create_quality_reports
                                         
                                         # Get logo path
                                         logo_path = "logo@3x.png"
@@ -4492,21 +4825,15 @@ def show_data_quality_dashboard():
                                         if 'total_fields' not in schema_analysis:
                                             schema_analysis['total_fields'] = len(schema_analysis.get('fields', []))
                                         
-                                        # Generate Technical Report
-                                        report_filename = create_data_quality_report(
+                                        # Generate Technical and Assessment Reports from one shared model, side by side
+                                        report_filename, assessment_filename = create_quality_reports(
                                             schema_analysis,
                                             schema_analysis.get('file_name', 'schema_file.xlsx'),
-                                            logo_path=logo_path
+                                            logo_path=logo_path,
+                                            parallel=True
                                         )
                                         st.session_state.dq_report_filename = report_filename
                                         st.session_state.dq_report_generated = True
-                                        
-                                        # Generate Assessment Report
-                                        assessment_filename = create_schema_assessment_report(
-                                            schema_analysis,
-                                            schema_analysis.get('file_name', 'schema_file.xlsx'),
-                                            logo_path=logo_path
-                                        )
                                         st.session_state.dq_assessment_filename = assessment_filename
                                         st.session_state.dq_assessment_generated = True
                                         
@@ -4576,33 +4903,202 @@ def show_data_quality_dashboard():
             with col5:
                 st.metric("Overall Score", f"{metrics.get('overall_score', 0)*100:.1f}%")
             
+            memory_report = result.get('memory_report')
+            if memory_report:
+                memory_caption = f"Peak working set: {memory_report.get('peak_working_set_mb', 0):.1f} MB"
+                if 'peak_rss_mb' in memory_report:
+                    memory_caption += f" · Process peak memory: {memory_report['peak_rss_mb']:.0f} MB"
+                dtype_report = result.get('dtype_optimization')
+                if dtype_report and dtype_report['converted_columns']:
+                    memory_caption += (
+                        f" · Processed data: {dtype_report['memory_before_bytes'] / 1024 / 1024:.1f} MB → "
+                        f"{dtype_report['memory_after_bytes'] / 1024 / 1024:.1f} MB after compacting "
+                        f"{len(dtype_report['converted_columns'])} column types"
+                    )
+                st.caption(memory_caption)
+
+            stage_metrics = result.get('stage_metrics')
+            if stage_metrics and stage_metrics.get('stages'):
+                with st.expander(f"⏱️ Stage timings ({stage_metrics['total_wall_s']:.2f} s)"):
+                    stages = stage_metrics['stages']
+                    # Waterfall: each stage's bar starts where the previous stages' wall time ends
+                    offsets = [sum(stage['wall_s'] for stage in stages[:position]) for position in range(len(stages))]
+                    fig = go.Figure(go.Bar(
+                        y=[stage['stage'] for stage in stages],
+                        x=[stage['wall_s'] for stage in stages],
+                        base=offsets,
+                        orientation='h',
+                        text=[f"{stage['wall_s']:.2f} s" for stage in stages],
+                        hovertemplate="%{y}: %{x:.3f} s<extra></extra>"
+                    ))
+                    fig.update_layout(xaxis_title="Seconds", yaxis={'autorange': 'reversed'}, height=60 + 40 * len(stages), margin={'t': 20, 'b': 20})
+                    st.plotly_chart(fig, use_container_width=True)
+                    st.dataframe(pd.DataFrame([
+                        {
+                            'Stage': stage['stage'],
+                            'Wall (s)': round(stage['wall_s'], 3),
+                            'CPU (s)': round(stage['cpu_s'], 3),
+                            'Runs': stage['runs'],
+                            'Rows/s': f"{stage['rows_per_s']:,.0f}" if stage['rows_per_s'] else '—',
+                            'Cells/s': f"{stage['cells_per_s']:,.0f}" if stage['cells_per_s'] else '—',
+                            'Peak Memory Δ (MB)': f"{stage['peak_memory_delta_mb']:.1f}" if stage['peak_memory_delta_mb'] is not None else '—'
+                        }
+                        for stage in stages
+                    ]), use_container_width=True, hide_index=True)
+                    st.caption("Peak memory Δ is the growth of the process high-water mark during a stage; chunked stages add up over row blocks.")
+                    st.download_button(
+                        "📥 Download Stage Timings (JSON)",
+                        json.dumps(stage_metrics, indent=2),
+                        file_name=f"stage_timings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                        mime="application/json",
+                        key="download_stage_metrics"
+                    )
+
+            column_quality = result.get('initial_column_quality')
+            if column_quality:
+                with st.expander("🔎 Column checks (accuracy, consistency, validity)"):
+                    checks_df = pd.DataFrame([
+                        {
+                            'Column': column_name,
+                            'Type': checks.get('type', ''),
+                            'Validity': f"{checks['validity']*100:.1f}%" if checks.get('validity') is not None else '—',
+                            'Accuracy': f"{checks['accuracy']*100:.1f}%" if checks.get('accuracy') is not None else '—',
+                            'Consistency': f"{checks['consistency']*100:.1f}%" if checks.get('consistency') is not None else '—',
+                            'Invalid': checks.get('invalid', 0),
+                            'Inaccurate': checks.get('inaccurate', 0),
+                            'Inconsistent': checks.get('inconsistent', 0)
+                        }
+                        for column_name, checks in column_quality.items()
+                    ])
+                    st.dataframe(checks_df, use_container_width=True, hide_index=True)
+                    st.caption("Measured on the uploaded data before quality improvements.")
+
+            rule_results = result.get('business_rules')
+            if rule_results:
+                with st.expander(f"📏 Business rules ({len(rule_results)})", expanded=True):
+                    st.dataframe(pd.DataFrame([
+                        {
+                            'Rule': rule['rule_id'],
+                            'Name': rule.get('name', ''),
+                            'Type': rule['type'],
+                            'Columns': ', '.join(rule['columns']),
+                            'Pass Rate': f"{rule['pass_rate']*100:.1f}%" if rule['pass_rate'] is not None else '—',
+                            'Violations': rule['failed'],
+                            'Note': f"Missing columns: {', '.join(rule['missing_columns'])}" if rule['missing_columns'] else ''
+                        }
+                        for rule in rule_results
+                    ]), use_container_width=True, hide_index=True)
+                    for rule in rule_results:
+                        if rule['violations']:
+                            st.markdown(f"**{rule['rule_id']}** — first {len(rule['violations'])} violating rows")
+                            st.dataframe(pd.DataFrame([
+                                {'Row': violation['row'], **violation['values']} for violation in rule['violations']
+                            ]), use_container_width=True, hide_index=True)
+
+            near_duplicates = result.get('near_duplicates')
+            if near_duplicates and near_duplicates.get('records'):
+                with st.expander(f"👥 Near-duplicate records ({near_duplicates['clusters']:,} clusters)"):
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Redundant Rows", f"{near_duplicates['near_duplicate_rows']:,}")
+                    with col2:
+                        st.metric("Entity Uniqueness", f"{(1 - near_duplicates['dedup_rate'])*100:.1f}%")
+                    with col3:
+                        st.metric("Candidate Pairs", f"{near_duplicates['candidate_pairs']:,}")
+                    if near_duplicates['sample_clusters']:
+                        st.dataframe(pd.DataFrame([
+                            {
+                                'Cluster': number,
+                                'Size': cluster['size'],
+                                'Rows': ', '.join(str(row) for row in cluster['rows'])
+                            }
+                            for number, cluster in enumerate(near_duplicates['sample_clusters'], start=1)
+                        ]), use_container_width=True, hide_index=True)
+                    compared_on = ', '.join(near_duplicates['key_columns'])
+                    if near_duplicates['blocking_columns']:
+                        compared_on += f" (within equal {', '.join(near_duplicates['blocking_columns'])})"
+                    st.caption(f"Compared on: {compared_on}. Rows are 1-based data rows of the uploaded file; largest clusters first.")
+                    if near_duplicates.get('capped_buckets'):
+                        st.caption(
+                            f"⚠️ {near_duplicates['capped_buckets']:,} similarity buckets held more than {MAX_BUCKET_SIZE} records "
+                            "(very common values); their records were only compared with neighbours, so some clusters may be missed."
+                        )
+
+            violation_checks = result.get('violations')
+            if violation_checks:
+                total_violations = sum(check['count'] for check in violation_checks)
+                with st.expander(f"🚩 Row-level issues ({total_violations:,})"):
+                    st.dataframe(pd.DataFrame([
+                        {
+                            'Check': check['description'] or check['check'],
+                            'Subject': check['subject'],
+                            'Rows': check['count'],
+                            'Sampled': len(check['sample'])
+                        }
+                        for check in violation_checks
+                    ]), use_container_width=True, hide_index=True)
+                    labels = [f"{check['description'] or check['check']} — {check['subject']}" for check in violation_checks]
+                    selected = st.selectbox("Sample of offending rows", range(len(labels)), format_func=lambda i: labels[i], key="violation_check_select")
+                    st.dataframe(pd.DataFrame(violation_checks[selected]['sample']).rename(columns={'row': 'Row', 'value': 'Value'}), use_container_width=True, hide_index=True)
+                    st.caption("Rows are 1-based data rows of the uploaded file; samples are drawn uniformly from all offending rows.")
+                    violations_path = result.get('violations_path')
+                    if violations_path and os.path.exists(violations_path):
+                        with open(violations_path, 'rb') as violations_file:
+                            st.download_button(
+                                "📥 Download All Issues (CSV)",
+                                violations_file,
+                                file_name=f"data_issues_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                mime="text/csv",
+                                key="download_violations"
+                            )
+
             # Display processed data preview
             st.markdown("### 📋 Processed Data Preview")
             processed_df = result.get('processed_data')
-            if processed_df is not None and isinstance(processed_df, pd.DataFrame) and not processed_df.empty:
+            output_path = result.get('output_path')
+            chunked_output = bool(output_path) and os.path.exists(output_path)
+            has_rows = processed_df is not None and isinstance(processed_df, pd.DataFrame) and not processed_df.empty
+            if chunked_output:
+                # Chunked mode: the cleaned data is on disk, only a preview is in memory
+                st.caption(f"ℹ️ Large file processed in chunks: {result.get('rows_written', 0):,} rows written; showing the first rows.")
+                if processed_df is not None and isinstance(processed_df, pd.DataFrame):
+                    st.dataframe(processed_df.head(10), use_container_width=True)
+            elif has_rows:
                 st.dataframe(processed_df.head(10), use_container_width=True)
-                
-                # Download processed data
-                st.markdown("### 📥 Download Processed Data")
-                try:
-                    import io
-                    output = io.BytesIO()
-                    processed_df.to_excel(output, index=False, engine='openpyxl')
-                    output.seek(0)
-                    st.download_button(
-                        "📥 Download Processed Data (Excel)",
-                        output.getvalue(),
-                        file_name=f"processed_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="download_processed_data"
-                    )
-                except Exception as e:
-                    st.error(f"❌ Error preparing download: {str(e)}")
             elif processed_df is not None:
                 st.warning("⚠️ Processed data is empty or invalid")
             else:
                 st.info("ℹ️ No processed data available")
-    
+            
+            if chunked_output or has_rows:
+                # Download processed data. Each format is written once per result
+                # (streamed to a temporary file) and served from disk on reruns.
+                st.markdown("### 📥 Download Processed Data")
+                export_format = st.selectbox(
+                    "Format",
+                    list(EXPORT_FORMATS),
+                    format_func=lambda file_format: EXPORT_FORMATS[file_format]['label'],
+                    key="processed_export_format"
+                )
+                try:
+                    with st.spinner("Preparing download..."):
+                        export_path = export_processed_data(
+                            result, export_format, dtype=schema_dtypes(st.session_state.get('schema_analysis'))
+                        )
+                    with open(export_path, 'rb') as export_file:
+                        st.download_button(
+                            f"📥 Download Processed Data ({EXPORT_FORMATS[export_format]['label']})",
+                            export_file,
+                            file_name=f"processed_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}",
+                            mime=EXPORT_FORMATS[export_format]['mime'],
+                            key="download_processed_data"
+                        )
+                except Exception as e:
+                    st.error(f"❌ Error preparing download: {str(e)}")
+
+        st.markdown("---")
+        show_quality_monitoring()
+
     with dq_tab3:
         st.subheader("🛡️ NDMO Compliance Assessment")
         st.markdown("Assess NDMO compliance based on schema analysis and data quality")
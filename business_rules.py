@@ -0,0 +1,348 @@
+"""
+Business Rules
+Declarative per-dataset business rules (JSON or YAML) compiled once into
+vectorized pandas/NumPy masks. Every rule is evaluated on each frame (or
+chunk) in one pass, sharing per-column work, and results accumulate into
+per-rule pass rates with a bounded sample of violating rows.
+
+Example (YAML):
+
+    rules:
+      - id: R1
+        type: not_null
+        column: national_id
+      - id: R2
+        type: range
+        column: age
+        min: 0
+        max: 120
+      - id: R3
+        type: compare
+        left: start_date
+        operator: '<='
+        right: end_date
+      - id: R4
+        type: conditional
+        when: {type: allowed_values, column: status, values: [Closed]}
+        then: {type: not_null, column: closed_date}
+"""
+import json
+import operator
+import re
+import numpy as np
+import pandas as pd
+from quality_checks import as_text
+
+RULE_TYPES = ['not_null', 'range', 'regex', 'allowed_values', 'compare', 'conditional']
+
+COMPARISON_OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>=': operator.ge,
+    '>': operator.gt
+}
+
+# Violating rows kept per rule for display
+RULE_SAMPLE_SIZE = 20
+
+def load_rules(text, file_name=None):
+    """Parse JSON or YAML rules text; returns the list of rule dicts
+
+    The document is either a list of rules or a mapping with a 'rules' list.
+    """
+    if isinstance(text, bytes):
+        text = text.decode('utf-8-sig')
+    if (file_name or '').lower().endswith('.json') or text.lstrip().startswith(('{', '[')):
+        try:
+            document = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON rules: {e}")
+    else:
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML rules require PyYAML (pip install pyyaml); use JSON instead")
+        try:
+            document = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML rules: {e}")
+    rules = document.get('rules', []) if isinstance(document, dict) else document
+    if not isinstance(rules, list):
+        raise ValueError("Rules must be a list or a mapping with a 'rules' list")
+    return rules
+
+def load_rules_file(file_path):
+    with open(file_path, 'rb') as f:
+        return load_rules(f.read(), file_name=file_path)
+
+class _FrameContext:
+    """Per-frame memo of column-derived arrays shared by every rule"""
+
+    def __init__(self, df):
+        self.df = df
+        self.columns = {str(name): position for position, name in reversed(list(enumerate(df.columns)))}
+        self._cache = {}
+
+    def _memo(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def column(self, name):
+        return self.df.iloc[:, self.columns[name]]
+
+    def present(self, name):
+        """Not null and not a blank string"""
+        def compute():
+            column = self.column(name)
+            present = np.array(column.notna(), dtype=bool)
+            if not (pd.api.types.is_numeric_dtype(column) or pd.api.types.is_datetime64_any_dtype(column)):
+                codes, uniques = self.factorized(name)
+                blank = pd.Series(uniques, dtype=object).astype(str).str.strip().eq('').to_numpy()
+                present &= ~np.append(blank, False)[codes]
+            return present
+        return self._memo(('present', name), compute)
+
+    def numeric(self, name):
+        def compute():
+            column = self.column(name)
+            if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+                return column.to_numpy(dtype=np.float64, na_value=np.nan)
+            return pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        return self._memo(('numeric', name), compute)
+
+    def factorized(self, name):
+        return self._memo(('factorized', name), lambda: pd.factorize(self.column(name)))
+
+    def unique_text(self, name):
+        """Distinct values of a column as stripped strings, with the row codes"""
+        def compute():
+            codes, uniques = self.factorized(name)
+            return codes, as_text(uniques)
+        return self._memo(('text', name), compute)
+
+class _Rule:
+    """A compiled rule: evaluate(context) -> (applicable, passed) row masks"""
+
+    def __init__(self, spec, position):
+        if not isinstance(spec, dict):
+            raise ValueError(f"Rule {position}: must be a mapping")
+        self.spec = spec
+        self.rule_type = spec.get('type')
+        self.id = str(spec.get('id', f'rule_{position}'))
+        self.name = spec.get('name', '')
+        self.weight = float(spec.get('weight', 1.0))
+        if self.rule_type not in RULE_TYPES:
+            raise ValueError(f"Rule {self.id}: unknown type {self.rule_type!r} (expected one of {', '.join(RULE_TYPES)})")
+        self.columns = []
+        self._evaluate = getattr(self, f'_compile_{self.rule_type}')()
+
+    def _require(self, key):
+        if key not in self.spec:
+            raise ValueError(f"Rule {self.id}: '{key}' is required for {self.rule_type} rules")
+        return self.spec[key]
+
+    def _column(self, key='column'):
+        name = str(self._require(key))
+        self.columns.append(name)
+        return name
+
+    def _compile_not_null(self):
+        name = self._column()
+        def evaluate(context):
+            return np.ones(len(context.df), dtype=bool), context.present(name)
+        return evaluate
+
+    def _compile_range(self):
+        name = self._column()
+        low, high = self.spec.get('min'), self.spec.get('max')
+        if low is None and high is None:
+            raise ValueError(f"Rule {self.id}: range rules need 'min' and/or 'max'")
+        def evaluate(context):
+            numbers = context.numeric(name)
+            passed = np.isfinite(numbers)
+            with np.errstate(invalid='ignore'):
+                if low is not None:
+                    passed &= numbers >= float(low)
+                if high is not None:
+                    passed &= numbers <= float(high)
+            return context.present(name), passed
+        return evaluate
+
+    def _compile_regex(self):
+        name = self._column()
+        try:
+            pattern = re.compile(str(self._require('pattern')))
+        except re.error as e:
+            raise ValueError(f"Rule {self.id}: invalid pattern: {e}")
+        def evaluate(context):
+            codes, text = context.unique_text(name)
+            matched = np.array(text.str.fullmatch(pattern).fillna(False), dtype=bool)
+            return context.present(name), np.append(matched, False)[codes]
+        return evaluate
+
+    def _compile_allowed_values(self):
+        name = self._column()
+        values = self._require('values')
+        if not isinstance(values, list):
+            raise ValueError(f"Rule {self.id}: 'values' must be a list")
+        allowed = {str(value).strip() for value in values}
+        def evaluate(context):
+            codes, text = context.unique_text(name)
+            return context.present(name), np.append(text.isin(allowed).to_numpy(), False)[codes]
+        return evaluate
+
+    def _compile_compare(self):
+        left = self._column('left')
+        compare = COMPARISON_OPERATORS.get(self.spec.get('operator', '=='))
+        if compare is None:
+            raise ValueError(f"Rule {self.id}: operator must be one of {', '.join(COMPARISON_OPERATORS)}")
+        right = self._column('right') if 'right' in self.spec else None
+        if right is None and 'value' not in self.spec:
+            raise ValueError(f"Rule {self.id}: compare rules need 'right' (a column) or 'value'")
+        constant = self.spec.get('value')
+
+        def operand(series):
+            if pd.api.types.is_datetime64_any_dtype(series):
+                return series
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                return series.astype(np.float64)
+            numbers = pd.to_numeric(series, errors='coerce')
+            return numbers if numbers.notna().sum() == series.notna().sum() else series.astype(str)
+
+        def evaluate(context):
+            left_values = operand(context.column(left))
+            applicable = context.present(left)
+            if right is not None:
+                right_values = operand(context.column(right)).to_numpy()
+                applicable = applicable & context.present(right)
+            elif pd.api.types.is_datetime64_any_dtype(left_values):
+                right_values = pd.Timestamp(constant)
+            elif pd.api.types.is_numeric_dtype(left_values):
+                right_values = float(constant)
+            else:
+                right_values = str(constant)
+            try:
+                passed = np.asarray(compare(left_values.to_numpy(), right_values), dtype=bool)
+            except TypeError:
+                # Incomparable types (e.g. a date against text) fail the rule
+                passed = np.zeros(len(context.df), dtype=bool)
+            return applicable, passed & applicable
+        return evaluate
+
+    def _compile_conditional(self):
+        condition = _Rule(self._require('when'), f'{self.id}.when')
+        consequence = _Rule(self._require('then'), f'{self.id}.then')
+        self.columns.extend(condition.columns + consequence.columns)
+        def evaluate(context):
+            condition_applicable, condition_passed = condition.evaluate(context)
+            applicable, passed = consequence.evaluate(context)
+            applicable = applicable & condition_applicable & condition_passed
+            return applicable, passed & applicable
+        return evaluate
+
+    def evaluate(self, context):
+        return self._evaluate(context)
+
+class RuleSet:
+    """Rules compiled once; evaluate() returns per-rule masks for a frame"""
+
+    def __init__(self, rules):
+        if isinstance(rules, dict):
+            rules = rules.get('rules', [])
+        self.rules = [_Rule(spec, position) for position, spec in enumerate(rules, start=1)]
+        ids = [rule.id for rule in self.rules]
+        duplicates = sorted({rule_id for rule_id in ids if ids.count(rule_id) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate rule ids: {', '.join(duplicates)}")
+
+    def __len__(self):
+        return len(self.rules)
+
+    def evaluate(self, df):
+        """Yield (rule, applicable, passed, missing_columns) for every rule"""
+        context = _FrameContext(df)
+        for rule in self.rules:
+            missing = [name for name in rule.columns if name not in context.columns]
+            if missing:
+                yield rule, None, None, missing
+                continue
+            applicable, passed = rule.evaluate(context)
+            yield rule, applicable, passed, []
+
+def _joined_values(df, columns):
+    """'col=value' pairs of the rule's columns, one string per row"""
+    joined = None
+    for name in columns:
+        column = df[name] if df.columns.is_unique else df.loc[:, name].iloc[:, 0]
+        part = name + '=' + column.astype(object).where(column.notna(), '').astype(str)
+        joined = part if joined is None else joined + '; ' + part
+    return joined.to_numpy(dtype=object)
+
+class RuleAccumulator:
+    """Per-rule applicable/failed counts and a bounded sample of violating rows over frames (or chunks)"""
+
+    def __init__(self, rule_set, sample_size=RULE_SAMPLE_SIZE, violations=None):
+        self.rule_set = rule_set
+        self.sample_size = sample_size
+        self.violations = violations
+        self.rows = 0
+        self.results = {
+            rule.id: {
+                'rule_id': rule.id,
+                'name': rule.name,
+                'type': rule.rule_type,
+                'columns': list(dict.fromkeys(rule.columns)),
+                'applicable': 0,
+                'failed': 0,
+                'missing_columns': [],
+                'violations': []
+            }
+            for rule in rule_set.rules
+        }
+
+    def update(self, df):
+        for rule, applicable, passed, missing in self.rule_set.evaluate(df):
+            result = self.results[rule.id]
+            if missing:
+                result['missing_columns'] = missing
+                continue
+            failed = applicable & ~passed
+            result['applicable'] += int(applicable.sum())
+            result['failed'] += int(failed.sum())
+            if self.violations is not None:
+                self.violations.record(
+                    'rule_violation', failed, self.rows, subject=rule.id,
+                    column=', '.join(result['columns']),
+                    values=lambda positions, columns=result['columns']: _joined_values(df.iloc[positions], columns)
+                )
+            room = self.sample_size - len(result['violations'])
+            if room > 0 and failed.any():
+                columns = [name for name in result['columns'] if name in df.columns]
+                for position in np.flatnonzero(failed)[:room]:
+                    row = df.iloc[position]
+                    result['violations'].append({
+                        'row': self.rows + int(position) + 1,
+                        'values': {name: None if pd.isna(row[name]) else str(row[name]) for name in columns}
+                    })
+        self.rows += len(df)
+
+    def report(self):
+        """Per-rule results with pass rates (None when no row was applicable)"""
+        report = []
+        for result in self.results.values():
+            result = dict(result)
+            result['pass_rate'] = 1 - result['failed'] / result['applicable'] if result['applicable'] else None
+            report.append(result)
+        return report
+
+    def pass_rate(self):
+        """Weighted mean pass rate over rules that applied to at least one row, or None"""
+        weights = {rule.id: rule.weight for rule in self.rule_set.rules}
+        rated = [(weights[result['rule_id']], result['pass_rate']) for result in self.report() if result['pass_rate'] is not None]
+        total_weight = sum(weight for weight, _ in rated)
+        if not total_weight:
+            return None
+        return sum(weight * rate for weight, rate in rated) / total_weight
@@ -0,0 +1,96 @@
+"""
+Column Name Classifier
+Labels column names as primary keys, foreign keys, audit fields and type hints
+by matching whole name tokens (snake_case, camelCase, kebab-case, spaces)
+against configurable keyword tables, so 'valid' no longer matches 'id' and
+'location' no longer looks like an audit field
+"""
+import re
+from functools import lru_cache
+
+# Keyword tables by label. Entries are whole tokens or space-separated token
+# sequences; a leading '^' only matches at the start of the name.
+DEFAULT_NAME_KEYWORDS = {
+    'primary_key': ['id', 'key', 'pk', 'primary', 'identifier', 'serial', 'uuid', 'guid'],
+    'foreign_key': ['fk', 'foreign', 'ref', 'reference', 'references'],
+    'audit': [
+        'created', 'creation', 'updated', 'modified', 'modification', 'deleted', 'changed',
+        'inserted', 'timestamp', 'audit', 'entered by', 'last login'
+    ],
+    'Email': ['email', 'mail', 'e mail'],
+    'Phone': ['phone', 'mobile', 'tel', 'telephone', 'fax'],
+    'DateTime': ['date', 'time', 'datetime', 'timestamp', 'created', 'updated', 'modified', 'dob'],
+    'Numeric': ['id', 'number', 'num', 'count', 'quantity', 'qty', 'amount', 'price', 'cost', 'total'],
+    'Boolean': ['flag', '^is', '^has', 'active', 'enabled', 'status']
+}
+
+# Type hints in priority order when a name carries several
+TYPE_HINT_ORDER = ['Email', 'Phone', 'DateTime', 'Numeric', 'Boolean']
+
+_CAMEL_BOUNDARY = re.compile(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+_SEPARATORS = re.compile(r'[^\w]+|_')
+
+def tokenize_name(name):
+    """Split a column name into lowercase tokens: 'CreatedBy_userID' -> created, by, user, id"""
+    spaced = _CAMEL_BOUNDARY.sub(' ', str(name))
+    return tuple(token.lower() for token in _SEPARATORS.split(spaced) if token)
+
+class ColumnNameClassifier:
+    """Token automaton compiled from keyword tables; labels a name in one pass over its tokens"""
+
+    def __init__(self, keyword_tables=None, cache_size=65536):
+        tables = dict(DEFAULT_NAME_KEYWORDS)
+        tables.update(keyword_tables or {})
+        self.keyword_tables = tables
+        self.phrases = {}
+        self.leading_phrases = {}
+        self.max_phrase_length = 1
+        for label, keywords in tables.items():
+            for keyword in keywords:
+                target = self.phrases
+                if keyword.startswith('^'):
+                    keyword = keyword[1:]
+                    target = self.leading_phrases
+                phrase = tokenize_name(keyword)
+                if not phrase:
+                    continue
+                target.setdefault(phrase, set()).add(label)
+                self.max_phrase_length = max(self.max_phrase_length, len(phrase))
+        self.phrases = {phrase: frozenset(labels) for phrase, labels in self.phrases.items()}
+        self.leading_phrases = {phrase: frozenset(labels) for phrase, labels in self.leading_phrases.items()}
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _classify(self, name):
+        tokens = tokenize_name(name)
+        labels = set()
+        for start in range(len(tokens)):
+            for length in range(1, min(self.max_phrase_length, len(tokens) - start) + 1):
+                phrase = tokens[start:start + length]
+                found = self.phrases.get(phrase)
+                if found:
+                    labels |= found
+                if start == 0:
+                    found = self.leading_phrases.get(phrase)
+                    if found:
+                        labels |= found
+        return frozenset(labels)
+
+    def classify_many(self, names):
+        """Label a batch of names (e.g. a whole catalog); repeated names hit the cache"""
+        return [self.classify(name) for name in names]
+
+    def is_primary_key(self, name):
+        return 'primary_key' in self.classify(name)
+
+    def is_foreign_key(self, name):
+        return 'foreign_key' in self.classify(name)
+
+    def is_audit_field(self, name):
+        return 'audit' in self.classify(name)
+
+    def type_hint(self, name, default='Text'):
+        labels = self.classify(name)
+        for type_name in TYPE_HINT_ORDER:
+            if type_name in labels:
+                return type_name
+        return default
@@ -0,0 +1,367 @@
+"""
+Column Sketches
+Mergeable, bounded-memory column statistics: HyperLogLog distinct counts,
+t-digest numeric quantiles and space-saving frequent values. Chunks, sheets,
+files or worker processes can each be profiled independently and merged.
+
+Error bounds (defaults):
+- HyperLogLog, precision 12 (4,096 one-byte registers): distinct counts are
+  exact up to 2,048 distinct values per column, then have a standard error
+  of 1.04 / sqrt(4096) ~ 1.6%. Merging is lossless: the merged sketch equals
+  the sketch of the combined data.
+- t-digest, compression 200: quantile estimates are typically within ~0.5%
+  of rank in the middle of the distribution and tighter at the tails; min
+  and max are exact. Merged digests carry the same bound.
+- Space-saving, capacity 100: each reported count c satisfies
+  true <= c <= true + N / 100, where N is the number of non-null values seen.
+  Any value occurring more than N / 100 times is guaranteed to be reported.
+  Merged summaries (parallel space-saving) keep the same bound.
+"""
+import hashlib
+import numpy as np
+import pandas as pd
+
+HLL_PRECISION = 12
+HLL_EXACT_LIMIT = 2048
+TDIGEST_COMPRESSION = 200
+TOP_K_CAPACITY = 100
+
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_))
+
+def _is_numeric_series(values):
+    return isinstance(values, pd.Series) and pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values)
+
+def _is_text_series(values):
+    # String dtypes hold only text, so values need no per-value type test
+    return isinstance(values, pd.Series) and isinstance(values.dtype, pd.StringDtype)
+
+def _hash_numbers(numbers):
+    """Hashes of a numeric array: integers as int64, so IDs beyond 2**53 stay
+    distinct; integral floats hash like the same integers"""
+    if numbers.dtype.kind in 'iu':
+        return pd.util.hash_array(numbers)
+    floats = numbers.astype(np.float64)
+    hashes = pd.util.hash_array(floats)
+    integral = np.isfinite(floats) & (floats == np.floor(floats)) & (np.abs(floats) < 2.0 ** 63)
+    hashes[integral] = pd.util.hash_array(floats[integral].astype(np.int64))
+    return hashes
+
+def hash_values(values):
+    """Stable 64-bit hashes of non-null values, identical across processes
+
+    Numbers hash by numeric value, so 1, 1.0 and numpy numbers agree whether a
+    column was read from Excel rows or from a DataFrame; everything else
+    hashes by its string form.
+    """
+    if len(values) == 0:
+        return np.empty(0, dtype=np.uint64)
+    if _is_numeric_series(values):
+        if pd.api.types.is_integer_dtype(values):
+            return _hash_numbers(values.to_numpy(dtype=np.uint64 if values.dtype.kind == 'u' else np.int64))
+        return _hash_numbers(values.to_numpy(dtype=np.float64))
+    if _is_text_series(values):
+        return pd.util.hash_array(values.to_numpy(dtype=object))
+    values = np.asarray(list(values), dtype=object)
+    is_number = np.fromiter((_is_number(v) for v in values), dtype=bool, count=len(values))
+    hashes = np.empty(len(values), dtype=np.uint64)
+    if is_number.any():
+        numbers = values[is_number]
+        # Python ints within int64 range hash exactly; larger ones go through float
+        is_integer = np.fromiter(
+            (isinstance(v, (int, np.integer)) and -2 ** 63 <= v < 2 ** 63 for v in numbers),
+            dtype=bool, count=len(numbers)
+        )
+        number_hashes = np.empty(len(numbers), dtype=np.uint64)
+        if is_integer.any():
+            number_hashes[is_integer] = _hash_numbers(numbers[is_integer].astype(np.int64))
+        if not is_integer.all():
+            number_hashes[~is_integer] = _hash_numbers(numbers[~is_integer].astype(np.float64))
+        hashes[is_number] = number_hashes
+    if not is_number.all():
+        text = np.array([str(v) for v in values[~is_number]], dtype=object)
+        hashes[~is_number] = pd.util.hash_array(text, categorize=False)
+    return hashes
+
+def _label(value):
+    # Display form of a frequent value; integral floats read as ints
+    if isinstance(value, (float, np.floating)) and float(value).is_integer() and abs(value) < 2 ** 53:
+        return int(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _bit_length(x):
+    """Vectorized int.bit_length for uint64 arrays"""
+    x = x.copy()
+    length = np.zeros(x.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = x >= (np.uint64(1) << np.uint64(shift))
+        length[mask] += shift
+        x[mask] >>= np.uint64(shift)
+    return length + (x > 0)
+
+class HyperLogLog:
+    """Distinct-count sketch; exact below exact_limit distinct hashes"""
+
+    def __init__(self, precision=HLL_PRECISION, exact_limit=HLL_EXACT_LIMIT):
+        self.precision = precision
+        self.exact_limit = exact_limit
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+        self.exact_hashes = np.empty(0, dtype=np.uint64)
+
+    @property
+    def is_exact(self):
+        return self.exact_hashes is not None
+
+    def update_hashes(self, hashes):
+        if len(hashes) == 0:
+            return
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.int64)
+        rest = hashes << np.uint64(p)
+        rank = np.minimum(64 - _bit_length(rest) + 1, 64 - p + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        if self.exact_hashes is not None:
+            self._add_exact(np.unique(hashes))
+
+    def _add_exact(self, unique_hashes):
+        merged = np.union1d(self.exact_hashes, unique_hashes)
+        self.exact_hashes = merged if len(merged) <= self.exact_limit else None
+
+    def update(self, values):
+        self.update_hashes(hash_values(values))
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        if self.exact_hashes is not None:
+            if other.exact_hashes is None:
+                self.exact_hashes = None
+            else:
+                self._add_exact(other.exact_hashes)
+        return self
+
+    def count(self):
+        if self.exact_hashes is not None:
+            return len(self.exact_hashes)
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+class TDigest:
+    """Merging t-digest for numeric quantiles (k1 scale function)"""
+
+    def __init__(self, compression=TDIGEST_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.count = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        if len(values):
+            self._absorb(values, np.ones(len(values)), values.min(), values.max())
+
+    def merge(self, other):
+        if other.count:
+            self._absorb(other.means, other.weights, other.min, other.max)
+        return self
+
+    def _absorb(self, means, weights, new_min, new_max):
+        self.min = min(self.min, float(new_min))
+        self.max = max(self.max, float(new_max))
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind='mergesort')
+        means, weights = means[order], weights[order]
+
+        total = weights.sum()
+        q_mid = (np.cumsum(weights) - weights / 2) / total
+        # Centroids may span at most one unit of k = compression / (2 pi) * asin(2q - 1)
+        k = self.compression / (2 * np.pi) * np.arcsin(np.clip(2 * q_mid - 1, -1, 1))
+        bucket = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+        self.count = float(total)
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        centers = np.cumsum(self.weights) - self.weights / 2
+        xs = np.concatenate([[0.0], centers, [self.count]])
+        ys = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q * self.count, xs, ys))
+
+class SpaceSaving:
+    """Frequent-value summary with counts overestimated by at most N / capacity"""
+
+    def __init__(self, capacity=TOP_K_CAPACITY):
+        self.capacity = capacity
+        self.counts = {}
+        self.labels = {}
+        self.total = 0
+
+    def _floor(self):
+        # Unmonitored values occur at most as often as the smallest monitored counter
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def update(self, hashes, values):
+        """Count a chunk of values given their hashes (from hash_values)"""
+        if len(hashes) == 0:
+            return
+        unique, first_index, counts = np.unique(hashes, return_index=True, return_counts=True)
+        top = np.argsort(-counts, kind='stable')[:self.capacity]
+        # An exact chunk count truncated to its top values is a valid summary
+        other = SpaceSaving(self.capacity)
+        other.counts = {int(unique[i]): int(counts[i]) for i in top}
+        pick = values.iloc.__getitem__ if isinstance(values, pd.Series) else values.__getitem__
+        other.labels = {int(unique[i]): _label(pick(int(first_index[i]))) for i in top}
+        other.total = len(hashes)
+        self.merge(other)
+
+    def merge(self, other):
+        self_floor, other_floor = self._floor(), other._floor()
+        combined = {}
+        for key in set(self.counts) | set(other.counts):
+            combined[key] = self.counts.get(key, self_floor) + other.counts.get(key, other_floor)
+        top = sorted(combined.items(), key=lambda item: item[1], reverse=True)[:self.capacity]
+        self.counts = dict(top)
+        self.labels = {key: self.labels[key] if key in self.labels else other.labels[key] for key in self.counts}
+        self.total += other.total
+        return self
+
+    def top(self, n=10):
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:n]
+        return [(self.labels[key], count) for key, count in ranked]
+
+    @property
+    def max_error(self):
+        return self.total / self.capacity
+
+def _numeric_values(values):
+    """Real numbers among the values (booleans and numeric-looking text excluded)"""
+    if _is_numeric_series(values):
+        return values.to_numpy(dtype=np.float64)
+    if _is_text_series(values):
+        return np.empty(0, dtype=np.float64)
+    return np.array([v for v in values if _is_number(v)], dtype=np.float64)
+
+class ColumnSketch:
+    """Mergeable profile of one column: counts, distinct values, quantiles and frequent values"""
+
+    def __init__(self, name=None):
+        self.name = name
+        self.total_count = 0
+        self.non_null_count = 0
+        self.distinct = HyperLogLog()
+        self.digest = TDigest()
+        self.frequent = SpaceSaving()
+
+    def update(self, values, present=None):
+        """Fold a chunk of raw values into the sketch
+
+        present, if given, is the chunk's non-null values already filtered by the caller.
+        Returns the hashes of the present values so callers can reuse them.
+        """
+        if present is None:
+            series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+            present = series[series.notna() & (series.astype(object) != '')]
+        self.total_count += len(values)
+        self.non_null_count += len(present)
+        if len(present) == 0:
+            return np.empty(0, dtype=np.uint64)
+        hashes = hash_values(present)
+        self.distinct.update_hashes(hashes)
+        self.digest.update(_numeric_values(present))
+        self.frequent.update(hashes, present)
+        return hashes
+
+    def merge(self, other):
+        self.total_count += other.total_count
+        self.non_null_count += other.non_null_count
+        self.distinct.merge(other.distinct)
+        self.digest.merge(other.digest)
+        self.frequent.merge(other.frequent)
+        return self
+
+    @property
+    def distinct_count(self):
+        return min(self.distinct.count(), self.non_null_count)
+
+    def summary(self, top_n=10):
+        """JSON-friendly summary of the sketch"""
+        return {
+            'distinct_count': self.distinct_count,
+            'distinct_is_exact': self.distinct.is_exact,
+            'quantiles': {f"p{int(q * 100)}": self.digest.quantile(q) for q in QUANTILES} if self.digest.count else None,
+            # Counts at or below the error bound cannot be told apart from rare values
+            'top_values': [{'value': value, 'count': count} for value, count in self.frequent.top(top_n) if count > self.frequent.max_error],
+            'top_values_max_error': int(self.frequent.max_error)
+        }
+
+class ColumnFingerprint:
+    """Order-sensitive content hash of a column, independent of how it was chunked
+
+    Two columns share a fingerprint only if they hold the same values (by
+    hash_values) at the same non-empty positions. Unlike the sketches above,
+    fingerprints cannot be merged.
+    """
+
+    def __init__(self):
+        self._mask = hashlib.blake2b(digest_size=16)
+        self._values = hashlib.blake2b(digest_size=16)
+
+    def update(self, present_mask, hashes):
+        """Fold in a chunk: which positions hold a value, and the hashes of those values"""
+        self._mask.update(np.asarray(present_mask, dtype=np.uint8).tobytes())
+        self._values.update(np.ascontiguousarray(hashes, dtype=np.uint64).tobytes())
+
+    def hexdigest(self):
+        return hashlib.blake2b(self._mask.digest() + self._values.digest(), digest_size=16).hexdigest()
+
+def column_fingerprints(df):
+    """Content fingerprint of every DataFrame column (by position)"""
+    fingerprints = []
+    for position in range(len(df.columns)):
+        column = df.iloc[:, position]
+        present = column.notna()
+        if column.dtype == object:
+            present &= column != ''
+        present = present.to_numpy()
+        fingerprint = ColumnFingerprint()
+        fingerprint.update(present, hash_values(column[present]))
+        fingerprints.append(fingerprint.hexdigest())
+    return fingerprints
+
+def sketch_frame(df):
+    """Build one ColumnSketch per column of a DataFrame (by position)"""
+    sketches = []
+    for position in range(len(df.columns)):
+        sketch = ColumnSketch(str(df.columns[position]))
+        sketch.update(df.iloc[:, position])
+        sketches.append(sketch)
+    return sketches
+
+def merge_sketches(left, right):
+    """Merge two positional lists of column sketches in place and return the left list"""
+    for position, sketch in enumerate(right):
+        if position < len(left):
+            left[position].merge(sketch)
+        else:
+            left.append(sketch)
+    return left
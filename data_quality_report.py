@@ -5,7 +5,8 @@ Creates comprehensive NDMO compliance reports with unified design
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Preformatted
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, PageBreak, Preformatted
+from reportlab.platypus.flowables import Flowable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from reportlab.pdfgen import canvas
@@ -13,9 +14,187 @@ from datetime import datetime
 import os
 import json
 
-def create_data_quality_report(analysis_results, schema_file_name, logo_path="logo@3x.png"):
+# Rows per table chunk in the column listings. Each chunk is laid out on its own,
+# so layout cost stays linear in the number of columns.
+COLUMN_TABLE_CHUNK_SIZE = 200
+
+COLUMN_TABLE_STYLE = [
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8)
+]
+
+class ChunkedLongTable(Flowable):
+    """Long table that pulls its rows from a generator one chunk at a time
+
+    Only the chunk currently being laid out is materialized, so memory stays
+    bounded no matter how many rows the generator yields. Every chunk repeats
+    the header row on each page it spans.
+    """
+    
+    def __init__(self, header_row, row_iter, col_widths, table_style, chunk_size=COLUMN_TABLE_CHUNK_SIZE):
+        Flowable.__init__(self)
+        self.header_row = header_row
+        self.row_iter = iter(row_iter)
+        self.col_widths = col_widths
+        self.table_style = table_style
+        self.chunk_size = max(1, int(chunk_size))
+        self._pending = None
+        self._next_rows = self._read_chunk()
+    
+    def _read_chunk(self):
+        rows = []
+        for row in self.row_iter:
+            rows.append(row)
+            if len(rows) >= self.chunk_size:
+                break
+        return rows
+    
+    def has_rows(self):
+        """Whether any rows are left to render"""
+        return self._pending is not None or bool(self._next_rows)
+    
+    def _next_table(self):
+        if self._pending is not None:
+            table, self._pending = self._pending, None
+            return table
+        rows, self._next_rows = self._next_rows, self._read_chunk()
+        table = LongTable([self.header_row] + rows, colWidths=self.col_widths, repeatRows=1)
+        table.setStyle(TableStyle(self.table_style))
+        return table
+    
+    def wrap(self, availWidth, availHeight):
+        # Always report more height than available so the frame asks us to split;
+        # that is where the next chunk gets built.
+        self.width = availWidth
+        return availWidth, availHeight + 1
+    
+    def split(self, availWidth, availHeight):
+        if not self.has_rows():
+            return []
+        table = self._next_table()
+        w, h = table.wrap(availWidth, availHeight)
+        if h <= availHeight:
+            parts = [table]
+        else:
+            parts = table.split(availWidth, availHeight)
+            if not parts:
+                # Not even the header and one row fit; retry on the next frame
+                self._pending = table
+                return []
+        if self.has_rows():
+            # We are never drawn ourselves, so clear the frame-overflow marker
+            # that the doc template would otherwise only reset on draw
+            if hasattr(self, '_postponed'):
+                del self._postponed
+            parts.append(self)
+        return parts
+    
+    def draw(self):
+        pass
+
+STANDARD_CATEGORIES = [
+    ('DG', 'Data Governance (DG)'),
+    ('DQ', 'Data Quality (DQ)'),
+    ('DS', 'Data Security (DS)'),
+    ('DA', 'Data Architecture (DA)'),
+    ('BR', 'Business Rules (BR)')
+]
+
+def build_report_model(analysis_results):
+    """Derive everything the technical and assessment reports share in one pass over the columns"""
+    column_analysis = analysis_results.get('column_analysis', [])
+    ndmo_compliance = analysis_results.get('ndmo_compliance', {})
+    category_names = dict(STANDARD_CATEGORIES)
+    standards_by_category = {name: set() for _, name in STANDARD_CATEGORIES}
+    
+    columns = []
+    for col_info in column_analysis:
+        col_name = col_info['column_name']
+        compliance_info = ndmo_compliance.get(col_name, {})
+        standards = compliance_info.get('standards', [])
+        
+        for std in standards:
+            category = category_names.get(std[:2])
+            if category:
+                standards_by_category[category].add(std)
+        
+        columns.append({
+            'name': str(col_name),
+            'type': str(col_info.get('detected_type', 'Unknown')),
+            'completeness': f"{col_info.get('completeness', 0):.1f}%",
+            'uniqueness': f"{col_info.get('uniqueness', 0):.1f}%",
+            'score': compliance_info.get('score', 0),
+            'standards': ', '.join(standards) or 'N/A'
+        })
+    
+    total_cols = len(column_analysis)
+    compliant_cols = sum(1 for col in ndmo_compliance.values() if col.get('score', 0) >= 0.7)
+    
+    return {
+        'total_cols': total_cols,
+        'compliant_cols': compliant_cols,
+        'compliance_percentage': (compliant_cols / total_cols * 100) if total_cols > 0 else 0,
+        'columns': columns,
+        'standards_by_category': {category: sorted(stds) for category, stds in standards_by_category.items()},
+        'issues': analysis_results.get('issues', []),
+        'recommendations': analysis_results.get('recommendations', [])
+    }
+
+def _iter_column_detail_rows(columns, normal_style):
+    """Yield one row of the Detailed Column Analysis table per analyzed column"""
+    for col in columns:
+        yield [
+            Paragraph(col['name'][:30], normal_style),
+            Paragraph(col['type'], normal_style),
+            Paragraph(col['completeness'], normal_style),
+            Paragraph(col['uniqueness'], normal_style),
+            Paragraph(f"{col['score']*100:.1f}%", normal_style),
+            Paragraph(col['standards'], normal_style)
+        ]
+
+def _iter_column_assessment_rows(columns, normal_style):
+    """Yield one row of the Column-by-Column Assessment table per analyzed column"""
+    status_styles = {
+        'compliant': ParagraphStyle('StatusCompliant', parent=normal_style, textColor=colors.HexColor('#28a745')),
+        'partial': ParagraphStyle('StatusPartial', parent=normal_style, textColor=colors.HexColor('#ffc107')),
+        'non_compliant': ParagraphStyle('StatusNonCompliant', parent=normal_style, textColor=colors.HexColor('#dc3545'))
+    }
+    
+    for col in columns:
+        score = col['score']
+        
+        if score >= 0.7:
+            status, status_style = "✅ Compliant", status_styles['compliant']
+        elif score >= 0.5:
+            status, status_style = "⚠️ Partial", status_styles['partial']
+        else:
+            status, status_style = "❌ Non-Compliant", status_styles['non_compliant']
+        
+        yield [
+            Paragraph(col['name'][:25], normal_style),
+            Paragraph(col['type'], normal_style),
+            Paragraph(col['completeness'], normal_style),
+            Paragraph(col['uniqueness'], normal_style),
+            Paragraph(f"{score*100:.1f}%", normal_style),
+            Paragraph(status, status_style)
+        ]
+
+def create_data_quality_report(analysis_results, schema_file_name, logo_path="logo@3x.png", report_model=None):
     """Create professional data quality technical report"""
     
+    model = report_model or build_report_model(analysis_results)
+    
     try:
         os.makedirs("reports", exist_ok=True)
     except Exception as e:
@@ -168,9 +347,9 @@ def create_data_quality_report(analysis_results, schema_file_name, logo_path="lo
     # Executive Summary
     story.append(Paragraph("Executive Summary", heading_style))
     
-    total_cols = len(analysis_results.get('column_analysis', []))
-    compliant_cols = sum(1 for col in analysis_results.get('ndmo_compliance', {}).values() if col.get('score', 0) >= 0.7)
-    compliance_percentage = (compliant_cols / total_cols * 100) if total_cols > 0 else 0
+    total_cols = model['total_cols']
+    compliant_cols = model['compliant_cols']
+    compliance_percentage = model['compliance_percentage']
     
     summary_text = f"""
     This technical report provides a comprehensive analysis of the data schema file "{schema_file_name}" 
@@ -190,90 +369,30 @@ def create_data_quality_report(analysis_results, schema_file_name, logo_path="lo
     # Column Analysis Details
     story.append(Paragraph("Detailed Column Analysis", heading_style))
     
-    column_analysis = analysis_results.get('column_analysis', [])
-    ndmo_compliance = analysis_results.get('ndmo_compliance', {})
-    
-    if column_analysis:
-        # Create table for column details
-        col_details_data = [[
+    if model['columns']:
+        # Render every column; rows are generated lazily in repeat-header chunks
+        col_details_header = [
             Paragraph('<b>Column Name</b>', field_label_style),
             Paragraph('<b>Data Type</b>', field_label_style),
             Paragraph('<b>Completeness</b>', field_label_style),
             Paragraph('<b>Uniqueness</b>', field_label_style),
             Paragraph('<b>NDMO Score</b>', field_label_style),
             Paragraph('<b>Standards</b>', field_label_style)
-        ]]
-        
-        for col_info in column_analysis[:50]:  # Limit to first 50 columns
-            col_name = col_info['column_name']
-            compliance_info = ndmo_compliance.get(col_name, {})
-            
-            col_details_data.append([
-                Paragraph(str(col_name)[:30], normal_style),
-                Paragraph(str(col_info.get('detected_type', 'Unknown')), normal_style),
-                Paragraph(f"{col_info.get('completeness', 0):.1f}%", normal_style),
-                Paragraph(f"{col_info.get('uniqueness', 0):.1f}%", normal_style),
-                Paragraph(f"{compliance_info.get('score', 0)*100:.1f}%", normal_style),
-                Paragraph(', '.join(compliance_info.get('standards', [])) or 'N/A', normal_style)
-            ])
-        
-        if len(column_analysis) > 50:
-            col_details_data.append([
-                Paragraph(f"... and {len(column_analysis) - 50} more columns", normal_style),
-                '', '', '', '', ''
-            ])
+        ]
         
-        col_details_table = Table(col_details_data, colWidths=[1.5*inch, 1*inch, 1*inch, 1*inch, 1*inch, 1.5*inch])
-        col_details_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8)
-        ]))
-        story.append(col_details_table)
+        story.append(ChunkedLongTable(
+            col_details_header,
+            _iter_column_detail_rows(model['columns'], normal_style),
+            [1.5*inch, 1*inch, 1*inch, 1*inch, 1*inch, 1.5*inch],
+            COLUMN_TABLE_STYLE
+        ))
         story.append(Spacer(1, 0.2*inch))
     
     # NDMO Standards Compliance
     story.append(Paragraph("NDMO Standards Compliance Assessment", heading_style))
     
-    # Group standards by category
-    standards_by_category = {
-        'Data Governance (DG)': [],
-        'Data Quality (DQ)': [],
-        'Data Security (DS)': [],
-        'Data Architecture (DA)': [],
-        'Business Rules (BR)': []
-    }
-    
-    for col_info in column_analysis:
-        col_name = col_info['column_name']
-        compliance_info = ndmo_compliance.get(col_name, {})
-        standards = compliance_info.get('standards', [])
-        
-        for std in standards:
-            if std.startswith('DG'):
-                standards_by_category['Data Governance (DG)'].append(std)
-            elif std.startswith('DQ'):
-                standards_by_category['Data Quality (DQ)'].append(std)
-            elif std.startswith('DS'):
-                standards_by_category['Data Security (DS)'].append(std)
-            elif std.startswith('DA'):
-                standards_by_category['Data Architecture (DA)'].append(std)
-            elif std.startswith('BR'):
-                standards_by_category['Business Rules (BR)'].append(std)
-    
-    for category, stds in standards_by_category.items():
-        if stds:
-            unique_stds = sorted(set(stds))
+    for category, unique_stds in model['standards_by_category'].items():
+        if unique_stds:
             story.append(Paragraph(f"<b>{category}</b>", ParagraphStyle(
                 'CategoryStyle',
                 parent=styles['Heading3'],
@@ -288,9 +407,9 @@ def create_data_quality_report(analysis_results, schema_file_name, logo_path="lo
     story.append(Spacer(1, 0.2*inch))
     
     # Issues and Recommendations
-    if analysis_results.get('issues'):
+    if model['issues']:
         story.append(Paragraph("Identified Issues", heading_style))
-        for idx, issue in enumerate(analysis_results['issues'], 1):
+        for idx, issue in enumerate(model['issues'], 1):
             issue_text = f"<b>{idx}. {issue.get('issue', 'Unknown Issue')}</b><br/>"
             issue_text += f"Severity: {issue.get('severity', 'Unknown')}<br/>"
             issue_text += f"Impact: {issue.get('impact', 'N/A')}<br/>"
@@ -298,9 +417,9 @@ def create_data_quality_report(analysis_results, schema_file_name, logo_path="lo
             story.append(Paragraph(issue_text, normal_style))
             story.append(Spacer(1, 0.1*inch))
     
-    if analysis_results.get('recommendations'):
+    if model['recommendations']:
         story.append(Paragraph("Recommendations", heading_style))
-        for idx, rec in enumerate(analysis_results['recommendations'], 1):
+        for idx, rec in enumerate(model['recommendations'], 1):
             rec_text = f"<b>{idx}. {rec.get('type', 'Recommendation')}:</b> {rec.get('message', 'N/A')}<br/>"
             rec_text += f"NDMO Standard: {rec.get('standard', 'N/A')}"
             story.append(Paragraph(rec_text, normal_style))
@@ -350,38 +469,189 @@ def create_data_quality_report(analysis_results, schema_file_name, logo_path="lo
     doc.build(story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
     return filename
 
+def create_workbook_quality_report(workbook_analysis, schema_file_name, logo_path="logo@3x.png"):
+    """Create one technical report covering every table of a multi-sheet workbook
+    
+    The summary table links to a section per table; each section lists the
+    table's columns with the same detail table as the single-sheet report.
+    """
+    try:
+        os.makedirs("reports", exist_ok=True)
+    except Exception as e:
+        print(f"Warning: Could not create reports directory: {e}")
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"reports/Workbook_Quality_Report_{timestamp}.pdf"
+    
+    doc = SimpleDocTemplate(
+        filename,
+        pagesize=A4,
+        rightMargin=45,
+        leftMargin=45,
+        topMargin=75,
+        bottomMargin=50
+    )
+    
+    story = []
+    styles = getSampleStyleSheet()
+    
+    title_style = ParagraphStyle(
+        'TitleStyle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        textColor=colors.HexColor('#1f77b4'),
+        spaceAfter=20,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+    
+    heading_style = ParagraphStyle(
+        'HeadingStyle',
+        parent=styles['Heading2'],
+        fontSize=13,
+        textColor=colors.HexColor('#2c3e50'),
+        spaceAfter=10,
+        spaceBefore=15,
+        fontName='Helvetica-Bold',
+        backColor=colors.HexColor('#ecf0f1'),
+        borderPadding=8
+    )
+    
+    field_label_style = ParagraphStyle(
+        'FieldLabelStyle',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=colors.black,
+        fontName='Helvetica-Bold',
+        leading=14
+    )
+    
+    normal_style = ParagraphStyle(
+        'NormalStyle',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=colors.black,
+        alignment=TA_LEFT,
+        leading=14,
+        wordWrap='CJK'
+    )
+    
+    def on_page(canvas_obj, doc):
+        from unified_templates import add_unified_header_footer
+        add_unified_header_footer(canvas_obj, doc, logo_path, "RESTRICTED - INTERNAL")
+    
+    story.append(Paragraph("Workbook Data Quality Report", title_style))
+    
+    summary = workbook_analysis.get('summary', {})
+    summary_text = f"""
+    This report covers the workbook "{schema_file_name}": {summary.get('total_tables', 0)} tables with
+    {summary.get('total_columns', 0)} columns in total, of which {summary.get('compliant_columns', 0)}
+    ({summary.get('compliance_percentage', 0):.1f}%) meet NDMO compliance requirements.
+    Tables without a primary key: {len(summary.get('tables_without_primary_key', []))}.
+    Tables without an audit trail: {len(summary.get('tables_without_audit_trail', []))}.
+    """
+    story.append(Paragraph("Workbook Summary", heading_style))
+    story.append(Paragraph(summary_text.strip(), normal_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    from xml.sax.saxutils import escape
+    
+    tables = workbook_analysis.get('tables', {})
+    anchors = {name: f"table_{i}" for i, name in enumerate(tables)}
+    
+    def summary_rows():
+        for row in workbook_analysis.get('table_summaries', []):
+            yield [
+                Paragraph(f'<a href="#{anchors[row["sheet_name"]]}" color="#1f77b4">{escape(row["sheet_name"][:30])}</a>', normal_style),
+                Paragraph(str(row['total_columns']), normal_style),
+                Paragraph("✅ Yes" if row['has_primary_key'] else "❌ No", normal_style),
+                Paragraph("✅ Yes" if row['has_audit_trail'] else "❌ No", normal_style),
+                Paragraph(f"{row['compliance_score']:.1f}%", normal_style),
+                Paragraph(str(row['issue_count']), normal_style)
+            ]
+    
+    story.append(Paragraph("Tables", heading_style))
+    story.append(ChunkedLongTable(
+        [Paragraph(f'<b>{label}</b>', field_label_style) for label in ['Table', 'Columns', 'Primary Key', 'Audit Trail', 'NDMO Score', 'Issues']],
+        summary_rows(),
+        [2*inch, 0.9*inch, 1.1*inch, 1.1*inch, 1.1*inch, 0.8*inch],
+        COLUMN_TABLE_STYLE
+    ))
+    
+    errors = workbook_analysis.get('errors', {})
+    if errors:
+        story.append(Spacer(1, 0.2*inch))
+        story.append(Paragraph("Sheets Not Analyzed", heading_style))
+        for sheet_name, error in errors.items():
+            story.append(Paragraph(f"<b>{escape(sheet_name)}</b>: {escape(str(error).splitlines()[0])}", normal_style))
+    
+    detail_header = [
+        Paragraph('<b>Column Name</b>', field_label_style),
+        Paragraph('<b>Data Type</b>', field_label_style),
+        Paragraph('<b>Completeness</b>', field_label_style),
+        Paragraph('<b>Uniqueness</b>', field_label_style),
+        Paragraph('<b>NDMO Score</b>', field_label_style),
+        Paragraph('<b>Standards</b>', field_label_style)
+    ]
+    
+    for sheet_name, analysis in tables.items():
+        model = build_report_model(analysis)
+        story.append(PageBreak())
+        story.append(Paragraph(f'<a name="{anchors[sheet_name]}"/>Table: {escape(sheet_name)}', heading_style))
+        story.append(Paragraph(
+            f"{model['total_cols']} columns, {model['compliant_cols']} compliant ({model['compliance_percentage']:.1f}%). "
+            f"Primary key: {'Present' if analysis.get('has_primary_key') else 'Missing'}. "
+            f"Audit trail: {'Present' if analysis.get('has_audit_trail') else 'Missing'}.",
+            normal_style
+        ))
+        story.append(Spacer(1, 0.1*inch))
+        if model['columns']:
+            story.append(ChunkedLongTable(
+                detail_header,
+                _iter_column_detail_rows(model['columns'], normal_style),
+                [1.5*inch, 1*inch, 1*inch, 1*inch, 1*inch, 1.5*inch],
+                COLUMN_TABLE_STYLE
+            ))
+        for issue in model['issues']:
+            story.append(Paragraph(f"<b>{issue.get('severity', 'Unknown')}</b>: {issue.get('issue', '')} - {issue.get('impact', '')}", normal_style))
+    
+    doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
+    return filename
+
 def generate_sql_script(analysis_results):
     """Generate SQL script for schema enhancement"""
-    script = "-- NDMO Compliance Schema Enhancement Script\n"
-    script += f"-- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-    script += "-- This script enhances the schema according to NDMO standards\n\n"
+    return "".join(_iter_sql_script_lines(analysis_results))
+
+def _iter_sql_script_lines(analysis_results):
+    """Yield the SQL enhancement script line by line, covering every column"""
+    yield "-- NDMO Compliance Schema Enhancement Script\n"
+    yield f"-- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+    yield "-- This script enhances the schema according to NDMO standards\n\n"
     
-    script += "-- Step 1: Add Primary Key if missing\n"
+    yield "-- Step 1: Add Primary Key if missing\n"
     if not analysis_results.get('has_primary_key'):
-        script += "-- TODO: Add primary key column\n"
-        script += "-- ALTER TABLE your_table ADD COLUMN id SERIAL PRIMARY KEY;\n\n"
+        yield "-- TODO: Add primary key column\n"
+        yield "-- ALTER TABLE your_table ADD COLUMN id SERIAL PRIMARY KEY;\n\n"
     
-    script += "-- Step 2: Add Audit Trail Fields (DS004)\n"
+    yield "-- Step 2: Add Audit Trail Fields (DS004)\n"
     if not analysis_results.get('has_audit_trail'):
-        script += "-- ALTER TABLE your_table ADD COLUMN created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP;\n"
-        script += "-- ALTER TABLE your_table ADD COLUMN updated_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP;\n"
-        script += "-- ALTER TABLE your_table ADD COLUMN created_by VARCHAR(100);\n"
-        script += "-- ALTER TABLE your_table ADD COLUMN updated_by VARCHAR(100);\n\n"
+        yield "-- ALTER TABLE your_table ADD COLUMN created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP;\n"
+        yield "-- ALTER TABLE your_table ADD COLUMN updated_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP;\n"
+        yield "-- ALTER TABLE your_table ADD COLUMN created_by VARCHAR(100);\n"
+        yield "-- ALTER TABLE your_table ADD COLUMN updated_by VARCHAR(100);\n\n"
     
-    script += "-- Step 3: Add Constraints for Data Quality\n"
+    yield "-- Step 3: Add Constraints for Data Quality\n"
     column_analysis = analysis_results.get('column_analysis', [])
-    for col_info in column_analysis[:20]:  # Limit to first 20
+    for col_info in column_analysis:
         col_name = col_info['column_name']
         if col_info.get('is_required', False) and col_info.get('completeness', 100) < 100:
-            script += f"-- ALTER TABLE your_table ALTER COLUMN {col_name} SET NOT NULL;\n"
+            yield f"-- ALTER TABLE your_table ALTER COLUMN {col_name} SET NOT NULL;\n"
     
-    script += "\n-- Step 4: Add Indexes for Performance\n"
-    for col_info in column_analysis[:10]:
+    yield "\n-- Step 4: Add Indexes for Performance\n"
+    for col_info in column_analysis:
         col_name = col_info['column_name']
         if col_info.get('is_primary_key'):
-            script += f"-- CREATE INDEX idx_{col_name} ON your_table({col_name});\n"
-    
-    return script
+            yield f"-- CREATE INDEX idx_{col_name} ON your_table({col_name});\n"
 
 def generate_python_monitoring_script(analysis_results):
     """Generate Python script for data quality monitoring"""
@@ -428,9 +698,11 @@ def monitor_data_quality(df, schema_analysis):
 """
     return script
 
-def create_schema_assessment_report(analysis_results, schema_file_name, logo_path="logo@3x.png"):
+def create_schema_assessment_report(analysis_results, schema_file_name, logo_path="logo@3x.png", report_model=None):
     """Create professional schema assessment report with NDMO compliance"""
     
+    model = report_model or build_report_model(analysis_results)
+    
     try:
         os.makedirs("reports", exist_ok=True)
     except Exception as e:
@@ -544,9 +816,9 @@ def create_schema_assessment_report(analysis_results, schema_file_name, logo_pat
     # Assessment Summary
     story.append(Paragraph("Assessment Summary", heading_style))
     
-    total_cols = len(analysis_results.get('column_analysis', []))
-    compliant_cols = sum(1 for col in analysis_results.get('ndmo_compliance', {}).values() if col.get('score', 0) >= 0.7)
-    compliance_percentage = (compliant_cols / total_cols * 100) if total_cols > 0 else 0
+    total_cols = model['total_cols']
+    compliant_cols = model['compliant_cols']
+    compliance_percentage = model['compliance_percentage']
     
     summary_data = [
         [Paragraph('<b>Schema File:</b>', field_label_style), Paragraph(schema_file_name, normal_style), Paragraph('<b>Assessment Date:</b>', field_label_style), Paragraph(datetime.now().strftime("%Y-%m-%d"), normal_style)],
@@ -593,61 +865,29 @@ def create_schema_assessment_report(analysis_results, schema_file_name, logo_pat
     # Column Assessment Details
     story.append(Paragraph("Column-by-Column Assessment", heading_style))
     
-    column_analysis = analysis_results.get('column_analysis', [])
-    ndmo_compliance = analysis_results.get('ndmo_compliance', {})
-    
-    if column_analysis:
-        # Create detailed assessment table
-        assessment_data = [[
+    if model['columns']:
+        # Create detailed assessment table, generated lazily in repeat-header chunks
+        assessment_header = [
             Paragraph('<b>Column</b>', field_label_style),
             Paragraph('<b>Type</b>', field_label_style),
             Paragraph('<b>Completeness</b>', field_label_style),
             Paragraph('<b>Uniqueness</b>', field_label_style),
             Paragraph('<b>NDMO Score</b>', field_label_style),
             Paragraph('<b>Status</b>', field_label_style)
-        ]]
-        
-        for col_info in column_analysis:
-            col_name = col_info['column_name']
-            compliance_info = ndmo_compliance.get(col_name, {})
-            score = compliance_info.get('score', 0)
-            
-            status = "✅ Compliant" if score >= 0.7 else "⚠️ Partial" if score >= 0.5 else "❌ Non-Compliant"
-            status_color = colors.HexColor('#28a745') if score >= 0.7 else colors.HexColor('#ffc107') if score >= 0.5 else colors.HexColor('#dc3545')
-            
-            assessment_data.append([
-                Paragraph(str(col_name)[:25], normal_style),
-                Paragraph(str(col_info.get('detected_type', 'Unknown')), normal_style),
-                Paragraph(f"{col_info.get('completeness', 0):.1f}%", normal_style),
-                Paragraph(f"{col_info.get('uniqueness', 0):.1f}%", normal_style),
-                Paragraph(f"{score*100:.1f}%", normal_style),
-                Paragraph(status, ParagraphStyle('StatusStyle', parent=normal_style, textColor=status_color))
-            ])
+        ]
         
-        assessment_table = Table(assessment_data, colWidths=[1.5*inch, 1*inch, 1*inch, 1*inch, 1*inch, 1.5*inch])
-        assessment_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-        ]))
-        story.append(assessment_table)
+        story.append(ChunkedLongTable(
+            assessment_header,
+            _iter_column_assessment_rows(model['columns'], normal_style),
+            [1.5*inch, 1*inch, 1*inch, 1*inch, 1*inch, 1.5*inch],
+            COLUMN_TABLE_STYLE + [('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])]
+        ))
         story.append(Spacer(1, 0.2*inch))
     
     # Issues and Recommendations
-    if analysis_results.get('issues'):
+    if model['issues']:
         story.append(Paragraph("Critical Issues", heading_style))
-        for idx, issue in enumerate(analysis_results['issues'], 1):
+        for idx, issue in enumerate(model['issues'], 1):
             issue_text = f"<b>{idx}. {issue.get('issue', 'Unknown Issue')}</b><br/>"
             issue_text += f"Severity: {issue.get('severity', 'Unknown')} | "
             issue_text += f"Impact: {issue.get('impact', 'N/A')} | "
@@ -655,9 +895,9 @@ def create_schema_assessment_report(analysis_results, schema_file_name, logo_pat
             story.append(Paragraph(issue_text, normal_style))
             story.append(Spacer(1, 0.1*inch))
     
-    if analysis_results.get('recommendations'):
+    if model['recommendations']:
         story.append(Paragraph("Recommendations", heading_style))
-        for idx, rec in enumerate(analysis_results['recommendations'], 1):
+        for idx, rec in enumerate(model['recommendations'], 1):
             rec_text = f"<b>{idx}. {rec.get('type', 'Recommendation')}:</b> {rec.get('message', 'N/A')}<br/>"
             rec_text += f"NDMO Standard: {rec.get('standard', 'N/A')}"
             story.append(Paragraph(rec_text, normal_style))
@@ -669,3 +909,49 @@ def create_schema_assessment_report(analysis_results, schema_file_name, logo_pat
     doc.build(story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
     return filename
 
+def _build_in_worker(builder, *args):
+    """Run a report builder in a worker process; its errors are returned, so they are not mistaken for pool failures"""
+    try:
+        return builder(*args), None
+    except Exception as e:
+        import traceback
+        return None, (e, traceback.format_exc())
+
+def create_quality_reports(analysis_results, schema_file_name, logo_path="logo@3x.png", parallel=False):
+    """Create the technical and assessment reports from one shared report model
+    
+    The derived model (column rows, per-category standards, compliance counts,
+    issue lists) is computed once. With parallel=True (opt-in: it starts a
+    process pool per call) both PDFs are built in separate worker processes,
+    since ReportLab layout is CPU bound. Only pool failures fall back to
+    building sequentially; errors in a report propagate to the caller.
+    
+    Returns (technical_report_filename, assessment_report_filename).
+    """
+    model = build_report_model(analysis_results)
+    
+    if parallel and (os.cpu_count() or 1) > 1:
+        import pickle
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(_build_in_worker, builder, analysis_results, schema_file_name, logo_path, model)
+                    for builder in (create_data_quality_report, create_schema_assessment_report)
+                ]
+                outcomes = [future.result() for future in futures]
+        # Pickling failures surface as PicklingError, TypeError or AttributeError
+        except (BrokenProcessPool, OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            print(f"Warning: Parallel report generation unavailable, building sequentially: {e}")
+        else:
+            for _, error in outcomes:
+                if error:
+                    exception, worker_traceback = error
+                    raise exception from RuntimeError(f"Report worker traceback:\n{worker_traceback}")
+            return tuple(filename for filename, _ in outcomes)
+    
+    return (
+        create_data_quality_report(analysis_results, schema_file_name, logo_path, report_model=model),
+        create_schema_assessment_report(analysis_results, schema_file_name, logo_path, report_model=model)
+    )
@@ -0,0 +1,255 @@
+"""
+Data Readers
+Common reader layer for schema and data files: Excel, CSV/TSV and Parquet.
+The format is detected from the file's content (falling back to its name);
+CSV/TSV and Parquet are read in chunks so large extracts can be streamed.
+"""
+import csv
+import os
+import pandas as pd
+
+DEFAULT_CHUNK_ROWS = 100000
+
+# File types accepted by the Data Quality uploaders
+UPLOAD_TYPES = ['xlsx', 'xls', 'csv', 'tsv', 'txt', 'parquet']
+
+EXTENSION_FORMATS = {
+    '.xlsx': 'excel',
+    '.xlsm': 'excel',
+    '.xls': 'excel',
+    '.csv': 'csv',
+    '.txt': 'csv',
+    '.tsv': 'tsv',
+    '.tab': 'tsv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet'
+}
+
+FORMAT_DELIMITERS = {'csv': ',', 'tsv': '\t'}
+
+# Detected types whose values must be read as text (leading zeros, '+' prefixes, long digit strings)
+PRESERVE_TEXT_TYPES = {'Phone', 'Saudi National ID', 'IBAN'}
+
+SNIFF_BYTES = 64 * 1024
+
+# In-memory DataFrame size per byte of file, for formats without size metadata
+DELIMITED_EXPANSION_RATIO = 3
+
+def detect_format(file_path, file_name=None):
+    """Return 'excel', 'csv', 'tsv' or 'parquet' from the file's magic bytes, then its name"""
+    with open(file_path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+    if head.startswith(b'PAR1'):
+        return 'parquet'
+    # xlsx is a zip archive; xls is an OLE2 compound document
+    if head.startswith(b'PK\x03\x04') or head.startswith(b'\xd0\xcf\x11\xe0'):
+        return 'excel'
+
+    extension = os.path.splitext(file_name or file_path)[1].lower()
+    file_format = EXTENSION_FORMATS.get(extension)
+    if file_format in ('csv', 'tsv'):
+        return _sniff_delimited(head, default=file_format)
+    if file_format:
+        return file_format
+    return _sniff_delimited(head, default='csv')
+
+def _sniff_delimited(head, default='csv'):
+    """Tell tab- from comma-separated text by the first lines"""
+    text = head.decode('utf-8', errors='ignore')
+    lines = [line for line in text.splitlines()[:20] if line.strip()]
+    if not lines:
+        return default
+    tabs = sum(line.count('\t') for line in lines)
+    commas = sum(line.count(',') for line in lines)
+    if tabs and tabs >= commas:
+        return 'tsv'
+    if commas:
+        return 'csv'
+    return default
+
+def _column_names(header):
+    """Header cells as column names; blank cells become Column_<n>, repeats get a .<k> suffix"""
+    names = []
+    seen = {}
+    for col_idx, cell_value in enumerate(header, start=1):
+        name = str(cell_value).strip() if cell_value is not None and str(cell_value).strip() else f'Column_{col_idx}'
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+def _read_delimited_header(file_path, delimiter, encoding):
+    with open(file_path, newline='', encoding=encoding) as f:
+        return next(csv.reader(f, delimiter=delimiter), [])
+
+def _iter_delimited(file_path, delimiter, chunksize, dtype):
+    encoding = 'utf-8-sig'
+    try:
+        header = _read_delimited_header(file_path, delimiter, encoding)
+    except UnicodeDecodeError:
+        encoding = 'cp1256'  # Arabic Windows exports
+        header = _read_delimited_header(file_path, delimiter, encoding)
+    names = _column_names(header)
+    reader = pd.read_csv(
+        file_path,
+        sep=delimiter,
+        header=0,
+        names=names,
+        dtype={name: dtype[name] for name in names if name in dtype} if dtype else None,
+        chunksize=chunksize,
+        encoding=encoding,
+        low_memory=False
+    )
+    with reader:
+        yielded = False
+        for chunk in reader:
+            yielded = True
+            yield chunk
+        if not yielded:
+            yield pd.DataFrame(columns=names)
+
+def _iter_parquet(file_path, chunksize, dtype):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        # Without pyarrow, fall back to whatever Parquet engine pandas has (read whole)
+        yield _apply_dtypes(pd.read_parquet(file_path), dtype)
+        return
+    parquet_file = pq.ParquetFile(file_path)
+    yielded = False
+    for batch in parquet_file.iter_batches(batch_size=chunksize):
+        yielded = True
+        yield _apply_dtypes(batch.to_pandas(), dtype)
+    if not yielded:
+        yield _apply_dtypes(parquet_file.schema_arrow.empty_table().to_pandas(), dtype)
+
+def _is_text_dtype(column_dtype):
+    return column_dtype in ('str', str, object)
+
+def _cell_text(value):
+    """An Excel cell value as text the way it displays: whole numbers without '.0'"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def _read_excel(file_path, sheet_name, dtype):
+    """Whole-sheet read; text dtypes are applied while parsing, so numeric cells never pass through float"""
+    text_columns = {name: str for name, column_dtype in (dtype or {}).items() if _is_text_dtype(column_dtype)}
+    df = pd.read_excel(file_path, sheet_name=sheet_name or 0, dtype=text_columns or None)
+    return _apply_dtypes(df, {name: column_dtype for name, column_dtype in (dtype or {}).items() if name not in text_columns})
+
+def _iter_excel(file_path, chunksize, dtype, sheet_name):
+    try:
+        import openpyxl
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    except Exception:
+        # Legacy .xls: parsed whole by pandas
+        yield _read_excel(file_path, sheet_name, dtype)
+        return
+    from streaming_profiler import iter_row_blocks
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.active
+        rows = ws.iter_rows(values_only=True)
+        names = _column_names(next(rows, None) or ())
+        yielded = False
+        for block in iter_row_blocks(rows, chunksize):
+            width = max(len(names), max(len(row) for row in block))
+            if width > len(names):
+                names = names + _column_names([None] * width)[len(names):]
+            block = [tuple(row) + (None,) * (width - len(row)) for row in block]
+            # Text columns are formatted from the cell values, before pandas infers numbers
+            text_positions = [position for position, name in enumerate(names) if _is_text_dtype((dtype or {}).get(name))]
+            if text_positions:
+                block = [list(row) for row in block]
+                for row in block:
+                    for position in text_positions:
+                        row[position] = _cell_text(row[position])
+            yielded = True
+            yield _apply_dtypes(pd.DataFrame.from_records(block, columns=names).infer_objects(), dtype)
+        if not yielded:
+            yield pd.DataFrame(columns=names)
+    finally:
+        wb.close()
+
+def _apply_dtypes(df, dtype):
+    if not dtype:
+        return df
+    for name, column_dtype in dtype.items():
+        if name in df.columns:
+            try:
+                if _is_text_dtype(column_dtype) and pd.api.types.is_numeric_dtype(df[name]):
+                    # Numbers as they display, not '551234567.0'
+                    df[name] = df[name].astype(object).map(_cell_text, na_action='ignore').astype(column_dtype)
+                else:
+                    df[name] = df[name].astype(column_dtype)
+            except (TypeError, ValueError):
+                pass  # Keep the inferred dtype if the column does not fit
+    return df
+
+def iter_table_chunks(file_path, chunksize=DEFAULT_CHUNK_ROWS, dtype=None, file_format=None, sheet_name=None, file_name=None):
+    """Yield a table as DataFrames of at most chunksize rows (one DataFrame for .xls)
+
+    dtype maps column names to explicit dtypes (see schema_dtypes); explicit
+    dtypes skip per-chunk type inference and keep chunks consistent.
+    """
+    file_format = file_format or detect_format(file_path, file_name)
+    if file_format in FORMAT_DELIMITERS:
+        return _iter_delimited(file_path, FORMAT_DELIMITERS[file_format], chunksize, dtype)
+    if file_format == 'parquet':
+        return _iter_parquet(file_path, chunksize, dtype)
+    if file_format == 'excel':
+        return _iter_excel(file_path, chunksize, dtype, sheet_name)
+    raise ValueError(f"Unsupported file format: {file_format}")
+
+def read_table(file_path, dtype=None, file_format=None, sheet_name=None, file_name=None):
+    """Read a whole table into one DataFrame"""
+    file_format = file_format or detect_format(file_path, file_name)
+    if file_format == 'excel':
+        return _read_excel(file_path, sheet_name, dtype)
+    if file_format == 'parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            try:
+                return _apply_dtypes(pd.read_parquet(file_path), dtype)
+            except ImportError as e:
+                raise ValueError(f"Parquet support requires pyarrow or fastparquet: {e}")
+        # Release Arrow buffers column by column while converting, instead of holding two copies
+        return _apply_dtypes(pq.read_table(file_path).to_pandas(split_blocks=True, self_destruct=True), dtype)
+    chunks = list(iter_table_chunks(file_path, dtype=dtype, file_format=file_format))
+    return chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+
+def estimate_table_memory(file_path, file_format=None, sheet_name=None):
+    """Estimate the in-memory DataFrame size of a table in bytes"""
+    file_format = file_format or detect_format(file_path)
+    if file_format == 'excel':
+        from streaming_profiler import estimate_sheet_memory
+        try:
+            return estimate_sheet_memory(file_path, sheet_name)
+        except Exception:
+            pass  # Legacy .xls: use the file size below
+    elif file_format == 'parquet':
+        try:
+            import pyarrow.parquet as pq
+            metadata = pq.ParquetFile(file_path).metadata
+            return sum(metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups))
+        except ImportError:
+            pass
+    return os.path.getsize(file_path) * DELIMITED_EXPANSION_RATIO
+
+def schema_dtypes(schema_analysis):
+    """Explicit read dtypes from a schema analysis: phone, ID and IBAN columns are read as text"""
+    schema_analysis = schema_analysis or {}
+    dtypes = {}
+    for field in schema_analysis.get('fields', []):
+        if field.get('detected_type') in PRESERVE_TEXT_TYPES:
+            dtypes[field.get('field_name', '')] = 'str'
+    for col_info in schema_analysis.get('column_analysis', []):
+        if col_info.get('detected_type') in PRESERVE_TEXT_TYPES:
+            dtypes[col_info['column_name']] = 'str'
+    return dtypes
@@ -0,0 +1,156 @@
+"""
+Data Writers
+Streaming export of processed data to Excel, CSV or Parquet. Rows are
+written in blocks (openpyxl write-only mode for Excel, a ParquetWriter for
+Parquet), so export memory stays flat however large the data; the source is
+a DataFrame or a CSV file on disk (the output of chunked processing).
+"""
+import os
+import tempfile
+import pandas as pd
+from data_readers import iter_table_chunks
+
+EXPORT_BLOCK_ROWS = 50000
+
+# Data rows per worksheet (Excel's limit is 1,048,576 rows including the header)
+EXCEL_MAX_DATA_ROWS = 1048575
+
+EXPORT_FORMATS = {
+    'xlsx': {'label': 'Excel', 'mime': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'},
+    'csv': {'label': 'CSV', 'mime': 'text/csv'},
+    'parquet': {'label': 'Parquet', 'mime': 'application/vnd.apache.parquet'}
+}
+
+def _iter_blocks(source, dtype=None):
+    """Row blocks of a DataFrame, or of a CSV file read with the given dtypes"""
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, max(len(source), 1), EXPORT_BLOCK_ROWS):
+            yield source.iloc[start:start + EXPORT_BLOCK_ROWS]
+    else:
+        yield from iter_table_chunks(source, chunksize=EXPORT_BLOCK_ROWS, dtype=dtype, file_format='csv')
+
+def _excel_rows(block):
+    """Row tuples of Python values; missing values become empty cells"""
+    block = block.copy(deep=False)
+    for name, column in block.items():
+        if isinstance(column.dtype, pd.DatetimeTZDtype):
+            # Excel has no time zones
+            block[name] = column.dt.tz_localize(None)
+    values = block.astype(object)
+    return values.where(block.notna(), None).itertuples(index=False, name=None)
+
+def _write_excel(blocks, path):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet, sheet_rows, header = None, 0, None
+    for block in blocks:
+        header = [str(name) for name in block.columns]
+        for row in _excel_rows(block):
+            if sheet is None or sheet_rows == EXCEL_MAX_DATA_ROWS:
+                sheet = workbook.create_sheet(f"Sheet{len(workbook.worksheets) + 1}")
+                sheet.append(header)
+                sheet_rows = 0
+            sheet.append(row)
+            sheet_rows += 1
+    if sheet is None:
+        workbook.create_sheet("Sheet1").append(header or [])
+    workbook.save(path)
+
+def _write_csv(blocks, path):
+    for position, block in enumerate(blocks):
+        block.to_csv(path, mode='w' if position == 0 else 'a', header=position == 0, index=False)
+
+def _unified_type(known, new):
+    """Arrow type holding values of both types: nulls take the other type, mixed numbers become float64, anything else text"""
+    import pyarrow as pa
+
+    if known is None or pa.types.is_null(known):
+        return new
+    if pa.types.is_null(new) or new == known:
+        return known
+    if (pa.types.is_integer(known) or pa.types.is_floating(known)) and (pa.types.is_integer(new) or pa.types.is_floating(new)):
+        return pa.float64()
+    return pa.large_string()
+
+def _parquet_schema(source, dtype):
+    """Arrow schema every block conforms to"""
+    import pyarrow as pa
+
+    if isinstance(source, pd.DataFrame):
+        # Inferred from every row
+        return pa.Schema.from_pandas(source, preserve_index=False)
+    # A CSV's blocks are typed independently (an all-empty block reads as float), so unify them first
+    types = {}
+    for block in _iter_blocks(source, dtype):
+        for field in pa.Schema.from_pandas(block, preserve_index=False):
+            types[field.name] = _unified_type(types.get(field.name), field.type)
+    return pa.schema([(name, pa.large_string() if pa.types.is_null(value_type) else value_type) for name, value_type in types.items()])
+
+def _write_parquet(source, path, dtype):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ValueError(f"Parquet export requires pyarrow: {e}")
+    schema = _parquet_schema(source, dtype)
+    with pq.ParquetWriter(path, schema) as writer:
+        for block in _iter_blocks(source, dtype):
+            writer.write_table(pa.Table.from_pandas(block, schema=schema, preserve_index=False))
+
+def write_table(source, path, file_format, dtype=None):
+    """Write a DataFrame or CSV file to path as 'xlsx', 'csv' or 'parquet', one block of rows at a time"""
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {file_format}")
+    if file_format == 'xlsx':
+        _write_excel(_iter_blocks(source, dtype), path)
+    elif file_format == 'csv':
+        _write_csv(_iter_blocks(source, dtype), path)
+    else:
+        _write_parquet(source, path, dtype)
+    return path
+
+def export_processed_data(result, file_format, dtype=None):
+    """Path of a processing result's data exported as file_format, built once per result
+
+    Export files are remembered in result['exports'], so redrawing a page does
+    not rebuild them. Chunked results are exported from their output CSV
+    (read with dtype), which is itself the CSV export.
+    """
+    exports = result.setdefault('exports', {})
+    path = exports.get(file_format)
+    if path and os.path.exists(path):
+        return path
+    output_path = result.get('output_path')
+    on_disk = bool(output_path) and os.path.exists(output_path)
+    if file_format == 'csv' and on_disk:
+        path = output_path
+    else:
+        fd, path = tempfile.mkstemp(prefix='processed_data_', suffix=f'.{file_format}')
+        os.close(fd)
+        try:
+            write_table(output_path if on_disk else result['processed_data'], path, file_format, dtype)
+        except Exception:
+            os.remove(path)
+            raise
+    exports[file_format] = path
+    return path
+
+def release_result_files(result):
+    """Delete the temporary files of a processing result: its exports, violations CSV and chunked output
+
+    Call when the result is discarded (e.g. replaced by a new one); files the
+    caller supplied, such as an explicit chunked output_path, are kept.
+    """
+    if not result:
+        return
+    owned = set(result.get('temp_files') or [])
+    owned.update(path for path in (result.get('exports') or {}).values() if path != result.get('output_path'))
+    for path in owned:
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            print(f"Warning: Could not remove temporary file {path}: {e}")
+    result['exports'] = {}
+    result['temp_files'] = []
@@ -0,0 +1,77 @@
+"""
+Dtype Optimizer
+Shrinks a processed DataFrame without changing its values: integers are
+downcast to the smallest type holding their range, floats to float32 when
+that is lossless, repetitive text becomes categorical and other text uses
+the Arrow-backed string dtype when pyarrow is available.
+"""
+import numpy as np
+import pandas as pd
+
+# Text columns with at most this share of distinct values become categorical
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+def _arrow_string_dtype():
+    """Arrow-backed strings with NaN for missing values (pandas' 'str' dtype), or None without pyarrow"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError:
+        # pandas < 2.1 only has the pd.NA variant
+        return pd.StringDtype('pyarrow')
+
+def _optimized_numeric(column):
+    """Smallest integer type, or float32 when every value survives the round trip; None to keep the column"""
+    if pd.api.types.is_integer_dtype(column):
+        downcast = pd.to_numeric(column, downcast='integer')
+        return downcast if downcast.dtype != column.dtype else None
+    if column.dtype == np.float64:
+        narrow = column.to_numpy().astype(np.float32)
+        if np.array_equal(narrow.astype(np.float64), column.to_numpy(), equal_nan=True):
+            return pd.Series(narrow, index=column.index, name=column.name)
+    return None
+
+def _optimized_text(column, string_dtype):
+    """Categorical for repetitive text, Arrow strings for the rest; None to keep the column"""
+    values = column.dropna()
+    if len(values) == 0 or (column.dtype == object and not values.map(type).eq(str).all()):
+        # Mixed Python objects (numbers, dates, ...) are left as they are
+        return None
+    if values.nunique() <= CATEGORY_MAX_UNIQUE_RATIO * len(column):
+        return column.astype('category')
+    if string_dtype is not None and column.dtype == object:
+        return column.astype(string_dtype)
+    return None
+
+def optimize_dtypes(df):
+    """Shrink df's column dtypes in place
+
+    Returns a report with the memory before and after (deep, in bytes) and the
+    new dtype of every converted column.
+    """
+    memory_before = int(df.memory_usage(deep=True).sum())
+    string_dtype = _arrow_string_dtype()
+    converted = {}
+    for position, name in enumerate(df.columns):
+        column = df.iloc[:, position]
+        if pd.api.types.is_bool_dtype(column) or isinstance(column.dtype, pd.CategoricalDtype):
+            continue
+        if pd.api.types.is_numeric_dtype(column):
+            optimized = _optimized_numeric(column)
+        elif pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column):
+            optimized = _optimized_text(column, string_dtype)
+        else:
+            optimized = None
+        if optimized is not None:
+            df.isetitem(position, optimized)
+            converted[str(name)] = str(optimized.dtype)
+    memory_after = int(df.memory_usage(deep=True).sum())
+    return {
+        'memory_before_bytes': memory_before,
+        'memory_after_bytes': memory_after,
+        'reduction_ratio': memory_before / memory_after if memory_after else 1.0,
+        'converted_columns': converted
+    }
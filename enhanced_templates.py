@@ -5,12 +5,9 @@ Improved field sizes, fonts, and layout for all templates
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-from reportlab.pdfgen import canvas
 from datetime import datetime
 import os
+from template_engine import FORM_TABLE_STYLE, classification_banner, register_template, render_template, sentences
 
 def add_enhanced_header_footer(canvas_obj, doc, logo_path=None, classification="RESTRICTED - INTERNAL"):
     """Add enhanced professional header and footer"""
@@ -68,360 +65,122 @@ def add_enhanced_header_footer(canvas_obj, doc, logo_path=None, classification="
     
     canvas_obj.restoreState()
 
-def create_enhanced_evidence_template(control_id, control_name, spec_id, spec_text, description, priority, domain, evidence_requirements=None):
-    """Create enhanced evidence template with better field sizes and fonts"""
-    
-    os.makedirs("templates", exist_ok=True)
-    
-    filename = f"templates/Evidence_{spec_id.replace('.', '_')}.pdf"
-    doc = SimpleDocTemplate(
-        filename, 
-        pagesize=A4,
-        rightMargin=45,
-        leftMargin=45,
-        topMargin=90,
-        bottomMargin=65
-    )
-    
-    story = []
-    styles = getSampleStyleSheet()
-    
-    # Enhanced styles with better sizing
-    title_style = ParagraphStyle(
-        'TitleStyle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor('#1f77b4'),
-        spaceAfter=25,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold',
-        leading=24
-    )
-    
-    heading_style = ParagraphStyle(
-        'HeadingStyle',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=12,
-        spaceBefore=18,
-        fontName='Helvetica-Bold',
-        backColor=colors.HexColor('#ecf0f1'),
-        borderPadding=10
-    )
-    
-    subheading_style = ParagraphStyle(
-        'SubheadingStyle',
-        parent=styles['Heading3'],
-        fontSize=12,
-        textColor=colors.HexColor('#34495e'),
-        spaceAfter=10,
-        spaceBefore=12,
-        fontName='Helvetica-Bold'
-    )
-    
-    normal_style = ParagraphStyle(
-        'NormalStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        alignment=TA_LEFT,
-        leading=16,
-        wordWrap='CJK'
-    )
-    
-    field_label_style = ParagraphStyle(
-        'FieldLabelStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        fontName='Helvetica-Bold',
-        leading=16
-    )
-    
-    # Classification banner
-    classification = "RESTRICTED - INTERNAL"
-    classification_style = ParagraphStyle(
-        'ClassificationStyle',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=colors.white,
-        alignment=TA_CENTER,
-        leading=16
-    )
-    classification_table = Table(
-        [[Paragraph(f"<b>CLASSIFICATION: {classification}</b>", classification_style)]],
-        colWidths=[7.1*inch],
-        style=TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#e74c3c')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ])
-    )
-    story.append(classification_table)
-    story.append(Spacer(1, 0.25*inch))
-    
-    # Title
-    story.append(Paragraph("Evidence Collection Form", title_style))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Control Information Section - Enhanced with better spacing
-    story.append(Paragraph("Control Information", heading_style))
-    
-    control_data = [
-        [Paragraph('<b>Control ID:</b>', field_label_style), Paragraph(control_id, normal_style)],
-        [Paragraph('<b>Control Name:</b>', field_label_style), Paragraph(control_name, normal_style)],
-        [Paragraph('<b>Domain:</b>', field_label_style), Paragraph(domain, normal_style)],
-        [Paragraph('<b>Specification ID:</b>', field_label_style), Paragraph(spec_id, normal_style)],
-        [Paragraph('<b>Priority:</b>', field_label_style), Paragraph(f'<b>{priority}</b>', normal_style)],
-        [Paragraph('<b>Document Date:</b>', field_label_style), Paragraph(datetime.now().strftime("%Y-%m-%d"), normal_style)]
-    ]
-    
-    control_table = Table(control_data, colWidths=[2.3*inch, 4.8*inch])
-    control_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 14),
-        ('TOPPADDING', (0, 0), (-1, -1), 14),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8)
-    ]))
-    story.append(control_table)
-    story.append(Spacer(1, 0.35*inch))
-    
-    # Specification Details - Enhanced
-    story.append(Paragraph("Specification Details", heading_style))
-    
-    story.append(Paragraph("<b>Specification Text:</b>", subheading_style))
-    if spec_text:
-        spec_paragraphs = spec_text.split('. ')
-        for para in spec_paragraphs[:6]:
-            if para.strip():
-                story.append(Paragraph(para.strip() + ('.' if not para.endswith('.') else ''), normal_style))
-    else:
-        story.append(Paragraph("N/A", normal_style))
-    
-    story.append(Spacer(1, 0.2*inch))
-    
-    story.append(Paragraph("<b>Description:</b>", subheading_style))
-    if description:
-        desc_paragraphs = description.split('. ')
-        for para in desc_paragraphs[:4]:
-            if para.strip():
-                story.append(Paragraph(para.strip() + ('.' if not para.endswith('.') else ''), normal_style))
-    else:
-        story.append(Paragraph("N/A", normal_style))
-    
-    story.append(Spacer(1, 0.35*inch))
-    
-    # Evidence Requirements Section
-    if evidence_requirements:
-        story.append(Paragraph("Evidence Requirements", heading_style))
-        
-        req_data = [[Paragraph('<b>Requirement</b>', field_label_style), Paragraph('<b>Description</b>', field_label_style), 
-                    Paragraph('<b>Format</b>', field_label_style), Paragraph('<b>Required</b>', field_label_style)]]
-        for req in evidence_requirements[:6]:
-            req_data.append([
-                Paragraph(req.get('type', 'Document'), normal_style),
-                Paragraph(req.get('description', '')[:90] + '...' if len(req.get('description', '')) > 90 else req.get('description', ''), normal_style),
-                Paragraph(req.get('format', 'PDF'), normal_style),
-                Paragraph('Yes' if req.get('required', True) else 'No', normal_style)
-            ])
-        
-        req_table = Table(req_data, colWidths=[1.6*inch, 3.2*inch, 1.1*inch, 1.2*inch])
-        req_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-        ]))
-        story.append(req_table)
-        story.append(Spacer(1, 0.35*inch))
-    
-    # Evidence Collection Section - Enhanced with better field sizes
-    story.append(Paragraph("Evidence Collection", heading_style))
-    
-    evidence_fields = [
-        [Paragraph('<b>Evidence Type:</b>', field_label_style), '_________________________________', 
-         Paragraph('<b>Evidence Category:</b>', field_label_style), '☐ Policy  ☐ Procedure  ☐ Configuration  ☐ Report'],
-        [Paragraph('<b>Evidence Description:</b>', field_label_style), '', '', ''],
-        ['', '', '', ''],
-        ['', '', '', ''],
-        [Paragraph('<b>File Name:</b>', field_label_style), '_________________________________', 
-         Paragraph('<b>File Size:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>File Location/Path:</b>', field_label_style), '_________________________________', 
-         Paragraph('<b>File Format:</b>', field_label_style), '☐ PDF  ☐ DOCX  ☐ XLSX  ☐ Other'],
-        [Paragraph('<b>Upload Date:</b>', field_label_style), '_________________________________', 
-         Paragraph('<b>Version:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>Uploaded By:</b>', field_label_style), '_________________________________', 
-         Paragraph('<b>Department:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>Reviewed By:</b>', field_label_style), '_________________________________', 
-         Paragraph('<b>Review Date:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>Approved By:</b>', field_label_style), '_________________________________', 
-         Paragraph('<b>Approval Date:</b>', field_label_style), '_________________________________']
-    ]
-    
-    evidence_table = Table(evidence_fields, colWidths=[1.9*inch, 2.3*inch, 1.9*inch, 2.3*inch])
-    evidence_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-        ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 16),
-        ('TOPPADDING', (0, 0), (-1, -1), 16),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('SPAN', (1, 1), (3, 3)),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-    ]))
-    story.append(evidence_table)
-    story.append(Spacer(1, 0.35*inch))
-    
-    # Acceptance Criteria Section - Enhanced
-    if evidence_requirements:
-        story.append(Paragraph("Acceptance Criteria", heading_style))
-        for req in evidence_requirements[:4]:
-            if req.get('acceptance_criteria'):
-                story.append(Paragraph(f"<b>{req.get('type', 'Document')}:</b>", subheading_style))
-                criteria_text = req.get('acceptance_criteria', '')
-                if len(criteria_text) > 250:
-                    sentences = criteria_text.split('. ')
-                    for sent in sentences[:5]:
-                        if sent.strip():
-                            story.append(Paragraph(sent.strip() + ('.' if not sent.endswith('.') else ''), normal_style))
-                else:
-                    story.append(Paragraph(criteria_text, normal_style))
-                story.append(Spacer(1, 0.2*inch))
-    
-    # Compliance Status Section - Enhanced
-    story.append(Paragraph("Compliance Status", heading_style))
-    
-    status_data = [
-        [Paragraph('<b>Compliance Status:</b>', field_label_style), '☐ Compliant  ☐ Partially Compliant  ☐ Non-Compliant  ☐ Not Applicable'],
-        [Paragraph('<b>Compliance Score (%):</b>', field_label_style), '___________ %', 
-         Paragraph('<b>Maturity Level:</b>', field_label_style), '☐ Level 0  ☐ Level 1  ☐ Level 2  ☐ Level 3  ☐ Level 4  ☐ Level 5'],
-        [Paragraph('<b>Implementation Date:</b>', field_label_style), '_________________________________', 
-         Paragraph('<b>Review Date:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>Next Review Date:</b>', field_label_style), '_________________________________', 
-         Paragraph('<b>Last Audit Date:</b>', field_label_style), '_________________________________']
-    ]
-    
-    status_table = Table(status_data, colWidths=[2.1*inch, 2.6*inch, 1.6*inch, 2.1*inch])
-    status_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-        ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 16),
-        ('TOPPADDING', (0, 0), (-1, -1), 16),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-    ]))
-    story.append(status_table)
-    story.append(Spacer(1, 0.35*inch))
-    
-    # Notes Section - Enhanced with more space
-    story.append(Paragraph("Notes and Comments", heading_style))
-    
-    notes_data = [
-        [Paragraph('<b>Notes:</b>', field_label_style), ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        ['', '']
-    ]
-    
-    notes_table = Table(notes_data, colWidths=[1.6*inch, 5.5*inch])
-    notes_table.setStyle(TableStyle([
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 16),
-        ('TOPPADDING', (0, 0), (-1, -1), 16),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#f8f9fa')),
-        ('SPAN', (1, 0), (1, 7)),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-    ]))
-    story.append(notes_table)
-    story.append(Spacer(1, 0.35*inch))
-    
-    # Signatures Section - Enhanced
-    story.append(Paragraph("Signatures and Approvals", heading_style))
-    
-    signature_data = [
-        [Paragraph('<b>Prepared By:</b>', field_label_style), '_________________________', 
-         Paragraph('<b>Date:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Name:</b>', field_label_style), '_________________________', 
-         Paragraph('<b>Title:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Signature:</b>', field_label_style), '_________________________', 
-         Paragraph('<b>Email:</b>', field_label_style), '_________________________'],
-        ['', '', '', ''],
-        [Paragraph('<b>Reviewed By:</b>', field_label_style), '_________________________', 
-         Paragraph('<b>Date:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Name:</b>', field_label_style), '_________________________', 
-         Paragraph('<b>Title:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Signature:</b>', field_label_style), '_________________________', 
-         Paragraph('<b>Email:</b>', field_label_style), '_________________________'],
-        ['', '', '', ''],
-        [Paragraph('<b>Approved By:</b>', field_label_style), '_________________________', 
-         Paragraph('<b>Date:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Name:</b>', field_label_style), '_________________________', 
-         Paragraph('<b>Title:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Signature:</b>', field_label_style), '_________________________', 
-         Paragraph('<b>Email:</b>', field_label_style), '_________________________']
+ENHANCED_TABLE_STYLE = dict(FORM_TABLE_STYLE, padding=16, side_padding=10, grid_width=1)
+
+SIGNATURE_BLANK = '_________________________'
+
+ENHANCED_EVIDENCE_TEMPLATE = {
+    'page': {'margins': (90, 45, 65, 45), 'header_footer': add_enhanced_header_footer},
+    'table_style': ENHANCED_TABLE_STYLE,
+    'styles': {
+        'title': {'fontSize': 20, 'spaceAfter': 25, 'leading': 24, 'fontName': 'Helvetica-Bold'},
+        'heading': {'fontSize': 14, 'spaceAfter': 12, 'spaceBefore': 18, 'fontName': 'Helvetica-Bold',
+                    'backColor': '#ecf0f1', 'borderPadding': 10},
+        'subheading': {'parent': 'Heading3', 'fontSize': 12, 'textColor': '#34495e', 'spaceAfter': 10, 'spaceBefore': 12,
+                       'fontName': 'Helvetica-Bold'},
+        'cell': {'parent': 'Normal', 'fontSize': 11, 'leading': 16, 'wordWrap': 'CJK'}
+    },
+    'blocks': [
+        classification_banner(font_size=12, padding=10, spacer_after=0.25),
+        {'type': 'title', 'text': "Evidence Collection Form"},
+        {'type': 'heading', 'text': "Control Information"},
+        {'type': 'field_table', 'col_widths': [2.3, 4.8], 'cell_style': 'cell', 'spacer_after': 0.35,
+         'table_style': {'padding': 14, 'side_padding': 8}, 'rows': [
+            ['Control ID:', '{control_id}'],
+            ['Control Name:', '{control_name}'],
+            ['Domain:', '{domain}'],
+            ['Specification ID:', '{spec_id}'],
+            ['Priority:', '<b>{priority}</b>'],
+            ['Document Date:', '{today}']
+        ]},
+        {'type': 'heading', 'text': "Specification Details"},
+        {'type': 'paragraph', 'text': "<b>Specification Text:</b>", 'style': 'subheading'},
+        {'type': 'paragraphs', 'key': 'spec_sentences', 'style': 'cell', 'empty': "N/A", 'spacer_after': 0.2},
+        {'type': 'paragraph', 'text': "<b>Description:</b>", 'style': 'subheading'},
+        {'type': 'paragraphs', 'key': 'description_sentences', 'style': 'cell', 'empty': "N/A", 'spacer_after': 0.35},
+        {'type': 'heading', 'text': "Evidence Requirements", 'when': 'requirements'},
+        {'type': 'grid_table', 'when': 'requirements', 'col_widths': [1.6, 3.2, 1.1, 1.2], 'align': 'CENTER',
+         'cell_style': 'cell', 'table_style': {'font_size': 10, 'padding': 10, 'side_padding': None}, 'spacer_after': 0.35,
+         'extra_style': [('ALIGN', (1, 1), (1, -1), 'LEFT')],
+         'header': ['Requirement', 'Description', 'Format', 'Required'],
+         'rows_key': 'requirements', 'row_fields': ['type', 'description', 'format', 'required']},
+        {'type': 'heading', 'text': "Evidence Collection"},
+        {'type': 'field_table', 'col_widths': [1.9, 2.3, 1.9, 2.3], 'label_columns': [0, 2], 'spacer_after': 0.35,
+         'extra_style': [('SPAN', (1, 1), (3, 3))], 'rows': [
+            ['Evidence Type:', None, 'Evidence Category:', '☐ Policy  ☐ Procedure  ☐ Configuration  ☐ Report'],
+            ['Evidence Description:', '', '', ''],
+            ['', '', '', ''],
+            ['', '', '', ''],
+            ['File Name:', None, 'File Size:', None],
+            ['File Location/Path:', None, 'File Format:', '☐ PDF  ☐ DOCX  ☐ XLSX  ☐ Other'],
+            ['Upload Date:', None, 'Version:', None],
+            ['Uploaded By:', None, 'Department:', None],
+            ['Reviewed By:', None, 'Review Date:', None],
+            ['Approved By:', None, 'Approval Date:', None]
+        ]},
+        {'type': 'heading', 'text': "Acceptance Criteria", 'when': 'requirements'},
+        {'type': 'repeat', 'key': 'acceptance_criteria', 'blocks': [
+            {'type': 'paragraph', 'text': "<b>{type}:</b>", 'style': 'subheading'},
+            {'type': 'paragraphs', 'key': 'sentences', 'style': 'cell', 'spacer_after': 0.2}
+        ]},
+        {'type': 'heading', 'text': "Compliance Status"},
+        {'type': 'field_table', 'col_widths': [2.1, 2.6, 1.6, 2.1], 'label_columns': [0, 2], 'spacer_after': 0.35, 'rows': [
+            ['Compliance Status:', '☐ Compliant  ☐ Partially Compliant  ☐ Non-Compliant  ☐ Not Applicable'],
+            ['Compliance Score (%):', '___________ %', 'Maturity Level:', '☐ Level 0  ☐ Level 1  ☐ Level 2  ☐ Level 3  ☐ Level 4  ☐ Level 5'],
+            ['Implementation Date:', None, 'Review Date:', None],
+            ['Next Review Date:', None, 'Last Audit Date:', None]
+        ]},
+        {'type': 'heading', 'text': "Notes and Comments"},
+        {'type': 'text_area', 'col_widths': [1.6, 5.5], 'span': True, 'spacer_after': 0.35, 'areas': [('Notes:', 8)]},
+        {'type': 'heading', 'text': "Signatures and Approvals"},
+        {'type': 'field_table', 'col_widths': [1.6, 2.1, 1.6, 2.1], 'label_columns': [0, 2], 'label_shading': False,
+         'blank': SIGNATURE_BLANK, 'rows': [
+            ['Prepared By:', None, 'Date:', None],
+            ['Name:', None, 'Title:', None],
+            ['Signature:', None, 'Email:', None],
+            ['', '', '', ''],
+            ['Reviewed By:', None, 'Date:', None],
+            ['Name:', None, 'Title:', None],
+            ['Signature:', None, 'Email:', None],
+            ['', '', '', ''],
+            ['Approved By:', None, 'Date:', None],
+            ['Name:', None, 'Title:', None],
+            ['Signature:', None, 'Email:', None]
+        ]}
     ]
-    
-    sig_table = Table(signature_data, colWidths=[1.6*inch, 2.1*inch, 1.6*inch, 2.1*inch])
-    sig_table.setStyle(TableStyle([
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 16),
-        ('TOPPADDING', (0, 0), (-1, -1), 16),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-    ]))
-    story.append(sig_table)
-    
-    # Build PDF with enhanced header/footer
-    logo_path = "logo@3x.png"
-    
-    def on_first_page(canvas, doc):
-        add_enhanced_header_footer(canvas, doc, logo_path, classification)
-    
-    def on_later_pages(canvas, doc):
-        add_enhanced_header_footer(canvas, doc, logo_path, classification)
-    
-    doc.build(story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
-    return filename
+}
 
+register_template('enhanced_evidence', ENHANCED_EVIDENCE_TEMPLATE)
 
+def create_enhanced_evidence_template(control_id, control_name, spec_id, spec_text, description, priority, domain, evidence_requirements=None):
+    """Create enhanced evidence template with better field sizes and fonts"""
+    filename = f"templates/Evidence_{spec_id.replace('.', '_')}.pdf"
+    requirements = evidence_requirements or []
+    acceptance = []
+    for req in requirements[:4]:
+        criteria = req.get('acceptance_criteria')
+        if criteria:
+            acceptance.append({
+                'type': req.get('type', 'Document'),
+                'sentences': sentences(criteria, 5) if len(criteria) > 250 else [criteria]
+            })
+    
+    return render_template('enhanced_evidence', filename, {
+        'control_id': control_id,
+        'control_name': control_name,
+        'domain': domain,
+        'spec_id': spec_id,
+        'priority': priority,
+        'spec_sentences': sentences(spec_text, 6),
+        'description_sentences': sentences(description, 4),
+        'requirements': [
+            {
+                'type': req.get('type', 'Document'),
+                'description': req.get('description', '')[:90] + '...' if len(req.get('description', '')) > 90 else req.get('description', ''),
+                'format': req.get('format', 'PDF'),
+                'required': 'Yes' if req.get('required', True) else 'No'
+            }
+            for req in requirements[:6]
+        ],
+        'acceptance_criteria': acceptance
+    })
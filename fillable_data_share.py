@@ -5,13 +5,7 @@ Handles form data storage and PDF generation for Data Share forms
 import json
 import os
 from datetime import datetime
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-from reportlab.pdfgen import canvas
+from template_engine import FORM_STYLES, FORM_TABLE_STYLE, classification_banner, register_template, render_template
 
 FORMS_DIR = "filled_forms"
 PDF_FORMS_DIR = "filled_forms_pdf"
@@ -46,135 +40,26 @@ def load_data_share_form(form_type):
     with open(f"{FORMS_DIR}/{latest_file}", 'r', encoding='utf-8') as f:
         return json.load(f)
 
+def _data_share_form_template(title):
+    return {
+        'page': {'margins': (75, 45, 50, 45), 'header_footer': 'unified'},
+        'table_style': FORM_TABLE_STYLE,
+        'styles': FORM_STYLES,
+        'blocks': [
+            classification_banner(),
+            {'type': 'title', 'text': title, 'spacer_after': 0.15},
+            {'type': 'heading', 'text': "Form Information"},
+            # Rows follow whatever fields the form was filled with
+            {'type': 'field_table', 'col_widths': [2.0, 5.1], 'cell_style': 'cell', 'rows_key': 'fields'}
+        ]
+    }
+
+register_template('filled_data_share_agreement', _data_share_form_template("Data Share Agreement"))
+register_template('filled_data_sharing_report', _data_share_form_template("Data Sharing Report"))
+
 def generate_pdf_from_data_share_form(form_type, form_data):
     """Generate PDF from filled data share form data with unified design"""
-    os.makedirs(PDF_FORMS_DIR, exist_ok=True)
-    
     filename = f"{PDF_FORMS_DIR}/{form_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-    
-    doc = SimpleDocTemplate(
-        filename, 
-        pagesize=A4,
-        rightMargin=45,
-        leftMargin=45,
-        topMargin=75,
-        bottomMargin=50
-    )
-    story = []
-    
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1f77b4'),
-        spaceAfter=15,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold',
-        leading=20
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=13,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=8,
-        spaceBefore=12,
-        fontName='Helvetica-Bold',
-        backColor=colors.HexColor('#ecf0f1'),
-        borderPadding=8
-    )
-    
-    field_label_style = ParagraphStyle(
-        'FieldLabel',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        fontName='Helvetica-Bold',
-        leading=14
-    )
-    
-    normal_style = ParagraphStyle(
-        'NormalText',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        leading=14
-    )
-    
-    # Classification banner
-    classification = "RESTRICTED - INTERNAL"
-    classification_style = ParagraphStyle(
-        'ClassificationStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.white,
-        alignment=TA_CENTER,
-        leading=14
-    )
-    classification_table = Table(
-        [[Paragraph(f"<b>CLASSIFICATION: {classification}</b>", classification_style)]],
-        colWidths=[7.1*inch],
-        style=TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#e74c3c')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ])
-    )
-    story.append(classification_table)
-    story.append(Spacer(1, 0.15*inch))
-    
-    # Title
-    if form_type == "data_share_agreement":
-        title = "Data Share Agreement"
-    else:
-        title = "Data Sharing Report"
-    
-    story.append(Paragraph(title, title_style))
-    story.append(Spacer(1, 0.15*inch))
-    
-    # Form data
-    story.append(Paragraph("Form Information", heading_style))
-    
-    form_info = []
-    for key, value in form_data.items():
-        if value:
-            label = key.replace('_', ' ').title()
-            form_info.append([Paragraph(f'<b>{label}:</b>', field_label_style), Paragraph(str(value), normal_style)])
-    
-    if form_info:
-        info_table = Table(form_info, colWidths=[2.0*inch, 5.1*inch])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8)
-        ]))
-        story.append(info_table)
-    
-    # Build PDF with header/footer
-    logo_path = "logo@3x.png"
-    
-    def on_first_page(canvas, doc):
-        from unified_templates import add_unified_header_footer
-        add_unified_header_footer(canvas, doc, logo_path, classification)
-    
-    def on_later_pages(canvas, doc):
-        from unified_templates import add_unified_header_footer
-        add_unified_header_footer(canvas, doc, logo_path, classification)
-    
-    doc.build(story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
-    return filename
-
+    fields = [(f"{key.replace('_', ' ').title()}:", value) for key, value in form_data.items() if value]
+    template = 'filled_data_share_agreement' if form_type == "data_share_agreement" else 'filled_data_sharing_report'
+    return render_template(template, filename, {'fields': fields})
@@ -5,17 +5,89 @@ Handles form data storage and PDF generation for Technical Reports (Gap Analysis
 import json
 import os
 from datetime import datetime
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from reportlab.pdfgen import canvas
+from template_engine import FORM_STYLES, FORM_TABLE_STYLE, classification_banner, register_template, render_template
 
 FORMS_DIR = "filled_forms"
 PDF_FORMS_DIR = "filled_forms_pdf"
 
+def _report_template(title, info_rows, summary_heading, summary_rows, details, plan, signer):
+    """Technical report layout: information and summary tables, free-text sections and approval"""
+    info_table = {'type': 'field_table', 'col_widths': [2.5, 4.6], 'cell_style': 'cell', 'spacer_after': 0.2}
+    return {
+        'page': {'margins': (75, 45, 50, 45), 'header_footer': 'unified'},
+        'table_style': FORM_TABLE_STYLE,
+        'styles': FORM_STYLES,
+        'blocks': [
+            classification_banner(),
+            {'type': 'title', 'text': title, 'spacer_after': 0.15},
+            {'type': 'heading', 'text': "Report Information"},
+            dict(info_table, rows=info_rows),
+            {'type': 'heading', 'text': summary_heading},
+            dict(info_table, rows=summary_rows),
+            # Section headings always print; their text only when filled in
+            {'type': 'heading', 'text': details[0]},
+            {'type': 'paragraph', 'text': '{%s}' % details[1], 'style': 'cell', 'when': details[1], 'spacer_after': 0.2},
+            {'type': 'heading', 'text': plan[0]},
+            {'type': 'paragraph', 'text': '{%s}' % plan[1], 'style': 'cell', 'when': plan[1], 'spacer_after': 0.2},
+            {'type': 'heading', 'text': "Approval"},
+            {'type': 'field_table', 'col_widths': [1.6, 2.1, 1.6, 2.1], 'label_columns': [0, 2], 'label_shading': False,
+             'cell_style': 'cell', 'table_style': {'side_padding': 10}, 'rows': [
+                [f"{signer[0]}:", '{%s}' % signer[1], 'Date:', '{%s}' % signer[2]],
+                ['Reviewed By:', '{reviewed_by}', 'Date:', '{reviewed_date}'],
+                ['Approved By:', '{approved_by}', 'Date:', '{approved_date}']
+            ]}
+        ]
+    }
+
+register_template('gap_analysis_report', _report_template(
+    "Gap Analysis Report",
+    [
+        ['Report Date:', '{report_date}'],
+        ['Entity Name:', '{entity_name}'],
+        ['Assessment Period From:', '{period_from}'],
+        ['Assessment Period To:', '{period_to}'],
+        ['Department:', '{department}'],
+        ['Prepared By:', '{prepared_by}'],
+        ['Review Date:', '{review_date}']
+    ],
+    "Gap Summary",
+    [
+        ['Total Controls Assessed:', '{total_controls}'],
+        ['Compliant Controls:', '{compliant_controls}'],
+        ['Partially Compliant:', '{partially_compliant}'],
+        ['Non-Compliant:', '{non_compliant}'],
+        ['Gap Percentage:', '{gap_percentage}%'],
+        ['Priority Gaps (P1):', '{priority_gaps}']
+    ],
+    ("Gap Details", 'gap_details'),
+    ("Remediation Plan", 'remediation_plan'),
+    ('Prepared By', 'prepared_by_signature', 'prepared_date')
+))
+
+register_template('risk_assessment_report', _report_template(
+    "Risk Assessment Report",
+    [
+        ['Report Date:', '{report_date}'],
+        ['Entity Name:', '{entity_name}'],
+        ['Assessment Date:', '{assessment_date}'],
+        ['Department:', '{department}'],
+        ['Assessed By:', '{assessed_by}'],
+        ['Review Date:', '{review_date}']
+    ],
+    "Risk Summary",
+    [
+        ['Total Risks Identified:', '{total_risks}'],
+        ['High Risk:', '{high_risk}'],
+        ['Medium Risk:', '{medium_risk}'],
+        ['Low Risk:', '{low_risk}'],
+        ['Risk Score (Average):', '{risk_score}'],
+        ['Mitigation Status:', '{mitigation_status}']
+    ],
+    ("Risk Details", 'risk_details'),
+    ("Mitigation Plan", 'mitigation_plan'),
+    ('Assessed By', 'assessed_by_signature', 'assessed_date')
+))
+
 def save_technical_report_form(report_type, form_data):
     """Save filled technical report form data to JSON file"""
     os.makedirs(FORMS_DIR, exist_ok=True)
@@ -48,242 +120,6 @@ def load_technical_report_form(report_type):
 
 def generate_pdf_from_technical_report(report_type, form_data):
     """Generate PDF from filled technical report form data with unified design"""
-    os.makedirs(PDF_FORMS_DIR, exist_ok=True)
-    
     filename = f"{PDF_FORMS_DIR}/{report_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-    
-    doc = SimpleDocTemplate(
-        filename, 
-        pagesize=A4,
-        rightMargin=45,
-        leftMargin=45,
-        topMargin=75,
-        bottomMargin=50
-    )
-    story = []
-    
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1f77b4'),
-        spaceAfter=15,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold',
-        leading=20
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=13,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=8,
-        spaceBefore=12,
-        fontName='Helvetica-Bold',
-        backColor=colors.HexColor('#ecf0f1'),
-        borderPadding=8
-    )
-    
-    field_label_style = ParagraphStyle(
-        'FieldLabel',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        fontName='Helvetica-Bold',
-        leading=14
-    )
-    
-    normal_style = ParagraphStyle(
-        'NormalText',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        leading=14,
-        wordWrap='CJK'
-    )
-    
-    # Classification banner
-    classification = "RESTRICTED - INTERNAL"
-    classification_style = ParagraphStyle(
-        'ClassificationStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.white,
-        alignment=TA_CENTER,
-        leading=14
-    )
-    classification_table = Table(
-        [[Paragraph(f"<b>CLASSIFICATION: {classification}</b>", classification_style)]],
-        colWidths=[7.1*inch],
-        style=TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#e74c3c')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ])
-    )
-    story.append(classification_table)
-    story.append(Spacer(1, 0.15*inch))
-    
-    # Title
-    if report_type == "gap_analysis":
-        title = "Gap Analysis Report"
-    else:
-        title = "Risk Assessment Report"
-    
-    story.append(Paragraph(title, title_style))
-    story.append(Spacer(1, 0.15*inch))
-    
-    # Report Information
-    story.append(Paragraph("Report Information", heading_style))
-    
-    if report_type == "gap_analysis":
-        report_info = []
-        report_info.append([Paragraph('<b>Report Date:</b>', field_label_style), Paragraph(str(form_data.get('report_date', '')), normal_style)])
-        report_info.append([Paragraph('<b>Entity Name:</b>', field_label_style), Paragraph(str(form_data.get('entity_name', '')), normal_style)])
-        report_info.append([Paragraph('<b>Assessment Period From:</b>', field_label_style), Paragraph(str(form_data.get('period_from', '')), normal_style)])
-        report_info.append([Paragraph('<b>Assessment Period To:</b>', field_label_style), Paragraph(str(form_data.get('period_to', '')), normal_style)])
-        report_info.append([Paragraph('<b>Department:</b>', field_label_style), Paragraph(str(form_data.get('department', '')), normal_style)])
-        report_info.append([Paragraph('<b>Prepared By:</b>', field_label_style), Paragraph(str(form_data.get('prepared_by', '')), normal_style)])
-        report_info.append([Paragraph('<b>Review Date:</b>', field_label_style), Paragraph(str(form_data.get('review_date', '')), normal_style)])
-    else:
-        report_info = []
-        report_info.append([Paragraph('<b>Report Date:</b>', field_label_style), Paragraph(str(form_data.get('report_date', '')), normal_style)])
-        report_info.append([Paragraph('<b>Entity Name:</b>', field_label_style), Paragraph(str(form_data.get('entity_name', '')), normal_style)])
-        report_info.append([Paragraph('<b>Assessment Date:</b>', field_label_style), Paragraph(str(form_data.get('assessment_date', '')), normal_style)])
-        report_info.append([Paragraph('<b>Department:</b>', field_label_style), Paragraph(str(form_data.get('department', '')), normal_style)])
-        report_info.append([Paragraph('<b>Assessed By:</b>', field_label_style), Paragraph(str(form_data.get('assessed_by', '')), normal_style)])
-        report_info.append([Paragraph('<b>Review Date:</b>', field_label_style), Paragraph(str(form_data.get('review_date', '')), normal_style)])
-    
-    if report_info:
-        info_table = Table(report_info, colWidths=[2.5*inch, 4.6*inch])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8)
-        ]))
-        story.append(info_table)
-    
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Summary Section
-    if report_type == "gap_analysis":
-        story.append(Paragraph("Gap Summary", heading_style))
-        summary_info = []
-        summary_info.append([Paragraph('<b>Total Controls Assessed:</b>', field_label_style), Paragraph(str(form_data.get('total_controls', '')), normal_style)])
-        summary_info.append([Paragraph('<b>Compliant Controls:</b>', field_label_style), Paragraph(str(form_data.get('compliant_controls', '')), normal_style)])
-        summary_info.append([Paragraph('<b>Partially Compliant:</b>', field_label_style), Paragraph(str(form_data.get('partially_compliant', '')), normal_style)])
-        summary_info.append([Paragraph('<b>Non-Compliant:</b>', field_label_style), Paragraph(str(form_data.get('non_compliant', '')), normal_style)])
-        summary_info.append([Paragraph('<b>Gap Percentage:</b>', field_label_style), Paragraph(str(form_data.get('gap_percentage', '')) + '%', normal_style)])
-        summary_info.append([Paragraph('<b>Priority Gaps (P1):</b>', field_label_style), Paragraph(str(form_data.get('priority_gaps', '')), normal_style)])
-    else:
-        story.append(Paragraph("Risk Summary", heading_style))
-        summary_info = []
-        summary_info.append([Paragraph('<b>Total Risks Identified:</b>', field_label_style), Paragraph(str(form_data.get('total_risks', '')), normal_style)])
-        summary_info.append([Paragraph('<b>High Risk:</b>', field_label_style), Paragraph(str(form_data.get('high_risk', '')), normal_style)])
-        summary_info.append([Paragraph('<b>Medium Risk:</b>', field_label_style), Paragraph(str(form_data.get('medium_risk', '')), normal_style)])
-        summary_info.append([Paragraph('<b>Low Risk:</b>', field_label_style), Paragraph(str(form_data.get('low_risk', '')), normal_style)])
-        summary_info.append([Paragraph('<b>Risk Score (Average):</b>', field_label_style), Paragraph(str(form_data.get('risk_score', '')), normal_style)])
-        summary_info.append([Paragraph('<b>Mitigation Status:</b>', field_label_style), Paragraph(str(form_data.get('mitigation_status', '')), normal_style)])
-    
-    if summary_info:
-        summary_table = Table(summary_info, colWidths=[2.5*inch, 4.6*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8)
-        ]))
-        story.append(summary_table)
-    
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Details Section
-    if report_type == "gap_analysis":
-        story.append(Paragraph("Gap Details", heading_style))
-        details_text = form_data.get('gap_details', '')
-    else:
-        story.append(Paragraph("Risk Details", heading_style))
-        details_text = form_data.get('risk_details', '')
-    
-    if details_text:
-        story.append(Paragraph(details_text, normal_style))
-        story.append(Spacer(1, 0.2*inch))
-    
-    # Action Plan Section
-    if report_type == "gap_analysis":
-        story.append(Paragraph("Remediation Plan", heading_style))
-        action_plan = form_data.get('remediation_plan', '')
-    else:
-        story.append(Paragraph("Mitigation Plan", heading_style))
-        action_plan = form_data.get('mitigation_plan', '')
-    
-    if action_plan:
-        story.append(Paragraph(action_plan, normal_style))
-        story.append(Spacer(1, 0.2*inch))
-    
-    # Signatures
-    story.append(Paragraph("Approval", heading_style))
-    signature_info = []
-    if report_type == "gap_analysis":
-        signature_info.append([Paragraph('<b>Prepared By:</b>', field_label_style), Paragraph(str(form_data.get('prepared_by_signature', '')), normal_style), 
-                              Paragraph('<b>Date:</b>', field_label_style), Paragraph(str(form_data.get('prepared_date', '')), normal_style)])
-    else:
-        signature_info.append([Paragraph('<b>Assessed By:</b>', field_label_style), Paragraph(str(form_data.get('assessed_by_signature', '')), normal_style), 
-                              Paragraph('<b>Date:</b>', field_label_style), Paragraph(str(form_data.get('assessed_date', '')), normal_style)])
-    
-    signature_info.append([Paragraph('<b>Reviewed By:</b>', field_label_style), Paragraph(str(form_data.get('reviewed_by', '')), normal_style), 
-                          Paragraph('<b>Date:</b>', field_label_style), Paragraph(str(form_data.get('reviewed_date', '')), normal_style)])
-    signature_info.append([Paragraph('<b>Approved By:</b>', field_label_style), Paragraph(str(form_data.get('approved_by', '')), normal_style), 
-                          Paragraph('<b>Date:</b>', field_label_style), Paragraph(str(form_data.get('approved_date', '')), normal_style)])
-    
-    if signature_info:
-        sig_table = Table(signature_info, colWidths=[1.6*inch, 2.1*inch, 1.6*inch, 2.1*inch])
-        sig_table.setStyle(TableStyle([
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-        ]))
-        story.append(sig_table)
-    
-    # Build PDF with header/footer
-    logo_path = "logo@3x.png"
-    
-    def on_first_page(canvas, doc):
-        from unified_templates import add_unified_header_footer
-        add_unified_header_footer(canvas, doc, logo_path, classification)
-    
-    def on_later_pages(canvas, doc):
-        from unified_templates import add_unified_header_footer
-        add_unified_header_footer(canvas, doc, logo_path, classification)
-    
-    doc.build(story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
-    return filename
-
+    template = 'gap_analysis_report' if report_type == "gap_analysis" else 'risk_assessment_report'
+    return render_template(template, filename, form_data)
@@ -0,0 +1,137 @@
+"""
+Uploaded Image Pipeline
+Normalizes user-uploaded images once on ingest (EXIF orientation, downscale to
+print resolution, recompression) and caches the derived variants by content hash
+"""
+import hashlib
+import os
+import re
+
+UPLOAD_DIR = "uploaded_images"
+DERIVED_DIR = os.path.join(UPLOAD_DIR, "derived")
+
+# Largest pixel size worth embedding for each variant. 'print' covers the
+# 4 x 3 inch image box used by the PDF generators at 300 DPI.
+IMAGE_VARIANTS = {
+    'print': (1200, 900)
+}
+
+JPEG_QUALITY = 85
+
+# Extensions of finished variants (interrupted writes leave *.tmp files behind)
+VARIANT_EXTENSIONS = ('.jpg', '.png')
+
+# Source formats whose original bytes can be kept when re-encoding would not shrink them
+ORIGINAL_EXTENSIONS = {'JPEG': '.jpg', 'PNG': '.png'}
+
+EXIF_ORIENTATION = 0x0112
+
+def _content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+def _safe_stem(name):
+    stem = os.path.splitext(os.path.basename(name or 'image'))[0]
+    return re.sub(r'[^A-Za-z0-9_-]+', '_', stem)[:60] or 'image'
+
+def _find_cached_variant(digest, variant):
+    """Return the cached variant path for a content hash, if one exists"""
+    if not os.path.isdir(DERIVED_DIR):
+        return None
+    prefix = f"{digest[:16]}_{variant}_"
+    for name in os.listdir(DERIVED_DIR):
+        if name.startswith(prefix) and name.endswith(VARIANT_EXTENSIONS):
+            return os.path.join(DERIVED_DIR, name)
+    return None
+
+def _exact_palette(img):
+    """Palette image of an RGB image with at most 256 colours, pixel for pixel
+
+    Flat UI screenshots compress far better as palette PNGs; Pillow's own
+    quantizers may merge close colours, so indices are assigned here.
+    """
+    import numpy as np
+    from PIL import Image
+
+    pixels = np.asarray(img, dtype=np.uint32)
+    packed = (pixels[..., 0] << 16) | (pixels[..., 1] << 8) | pixels[..., 2]
+    colours, indices = np.unique(packed, return_inverse=True)
+    indexed = Image.fromarray(indices.reshape(packed.shape).astype(np.uint8))
+    indexed.putpalette(np.stack([colours >> 16, (colours >> 8) & 255, colours & 255], axis=1).astype(np.uint8).tobytes())
+    return indexed
+
+def _write_variant(data, original_name, digest, variant):
+    """Decode, orient, downscale and recompress an image into the derived cache"""
+    from io import BytesIO
+    from PIL import Image, ImageOps
+
+    max_size = IMAGE_VARIANTS[variant]
+    with Image.open(BytesIO(data)) as src:
+        source_format = src.format
+        upright = src.getexif().get(EXIF_ORIENTATION, 1) == 1
+        if src.format == 'JPEG':
+            # Let the JPEG decoder skip full-resolution decoding; the requested box
+            # is square so it still covers the target after EXIF rotation
+            longest = max(max_size)
+            src.draft('RGB', (longest, longest))
+        lossless = src.format in ('PNG', 'GIF', 'BMP', 'TIFF')
+        img = ImageOps.exif_transpose(src)
+        img.thumbnail(max_size, Image.LANCZOS)
+
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        if img.mode in ('RGBA', 'LA') and img.getchannel('A').getextrema() == (255, 255):
+            # Fully opaque alpha (typical for screenshots) only costs bytes
+            img = img.convert('RGB')
+
+        encoded = BytesIO()
+        if lossless or img.mode in ('RGBA', 'LA'):
+            # Screenshots and transparent images stay PNG so text edges stay sharp
+            extension = ".png"
+            if img.mode == 'RGB' and img.getcolors(256) is not None:
+                img = _exact_palette(img)
+            img.save(encoded, format='PNG', optimize=True)
+        else:
+            extension = ".jpg"
+            img.convert('RGB').save(encoded, format='JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    encoded = encoded.getvalue()
+    if upright and source_format in ORIGINAL_EXTENSIONS and len(encoded) >= len(data):
+        # The upload is already smaller (even if larger in pixels): re-encoding would only add bytes
+        encoded, extension = data, ORIGINAL_EXTENSIONS[source_format]
+
+    os.makedirs(DERIVED_DIR, exist_ok=True)
+    path = os.path.join(DERIVED_DIR, f"{digest[:16]}_{variant}_{_safe_stem(original_name)}{extension}")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(encoded)
+    os.replace(tmp_path, path)
+    return path
+
+def ingest_uploaded_image(data, original_name, variant='print'):
+    """Normalize uploaded image bytes and return the path of the cached variant
+
+    Uploading the same image again returns the existing variant without decoding it.
+    """
+    digest = _content_hash(data)
+    cached = _find_cached_variant(digest, variant)
+    if cached:
+        return cached
+    return _write_variant(data, original_name, digest, variant)
+
+def get_image_variant(image_path, variant='print'):
+    """Return the cached variant for an image on disk, creating it if needed
+
+    Falls back to the original path when the image cannot be processed (for
+    example when Pillow is unavailable), so callers can always embed the result.
+    """
+    if not image_path or not os.path.exists(image_path):
+        return image_path
+    if os.path.dirname(os.path.abspath(image_path)) == os.path.abspath(DERIVED_DIR):
+        return image_path
+
+    try:
+        with open(image_path, 'rb') as f:
+            data = f.read()
+        return ingest_uploaded_image(data, os.path.basename(image_path), variant)
+    except Exception as e:
+        print(f"Warning: Could not normalize image {image_path}: {e}")
+        return image_path
@@ -224,10 +224,12 @@ class NDMOQualityStandards:
                 score = data_quality_metrics.get('accuracy', 0.5)
             elif std_id == 'DQ003':  # Consistency
                 score = data_quality_metrics.get('consistency', 0.5)
-            elif std_id == 'DQ004':  # Uniqueness
-                score = data_quality_metrics.get('uniqueness', 0.5)
+            elif std_id == 'DQ004':  # Uniqueness (of rows, and of entities when near duplicates were clustered)
+                score = min(data_quality_metrics.get('uniqueness', 0.5), data_quality_metrics.get('entity_uniqueness', 1.0))
             elif std_id == 'DQ005':  # Validity
                 score = data_quality_metrics.get('validity', 0.5)
+            elif std_id == 'BR001' and 'business_rules' in data_quality_metrics:  # Declared rules' pass rate
+                score = data_quality_metrics['business_rules']
         
         return min(max(score, 0), 1)  # Ensure score is between 0 and 1
     
@@ -0,0 +1,309 @@
+"""
+Near Duplicates
+Finds records that describe the same entity but differ by whitespace,
+case, punctuation, Arabic spelling variants or transposed digits. Key
+columns are normalized, each distinct record is summarized by a MinHash
+signature of its character 3-grams, and LSH band buckets (within blocking
+keys) generate candidate pairs, so no O(n^2) comparison is made. Candidate
+pairs are scored by signature agreement and linked into clusters.
+"""
+import re
+import unicodedata
+import numpy as np
+import pandas as pd
+from column_name_classifier import ColumnNameClassifier
+from quality_checks import column_specs
+
+NUM_PERMUTATIONS = 32
+BAND_ROWS = 4
+
+# Jaccard similarity of 3-gram sets above which a candidate pair is a match
+DEFAULT_SIMILARITY_THRESHOLD = 0.6
+
+# Candidates whose MinHash estimate is this far below the threshold skip the exact check
+ESTIMATE_MARGIN = 0.1
+
+# Distinct records hashed per batch, and candidate pairs checked per batch (2 ** PAIR_BITS);
+# both bound the 3-gram arrays
+SIGNATURE_BATCH_SIZE = 100000
+PAIR_BITS = 16
+
+# Records of an LSH bucket compared pairwise; larger buckets (very common values) compare neighbours only
+MAX_BUCKET_SIZE = 100
+
+# Clusters returned in the summary, and rows shown per cluster
+SAMPLE_CLUSTERS = 20
+SAMPLE_CLUSTER_ROWS = 10
+
+# Column types that identify an entity (amounts and counts do not)
+KEY_TYPES = {'Text', 'Categorical', 'Email', 'Phone', 'Saudi National ID', 'IBAN', 'DateTime'}
+DIGIT_TYPES = {'Phone', 'Saudi National ID'}
+
+ARABIC_DIACRITICS = [*range(0x064B, 0x0653), 0x0670, 0x0640]  # Harakat, dagger alef, tatweel
+ARABIC_LETTER_VARIANTS = {
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',  # Alef forms
+    'ة': 'ه',  # Ta marbuta -> ha
+    'ى': 'ي',  # Alef maqsura -> ya
+    'ؤ': 'و',  # Waw with hamza
+    'ئ': 'ي'   # Ya with hamza
+}
+EASTERN_DIGITS = {ord(digit): str(value % 10) for value, digit in enumerate('٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹')}
+
+_TEXT_TRANSLATION = {
+    **EASTERN_DIGITS,
+    **{ord(variant): letter for variant, letter in ARABIC_LETTER_VARIANTS.items()},
+    **dict.fromkeys(ARABIC_DIACRITICS)
+}
+_NON_WORD = re.compile(r'[\W_]+')
+_NON_DIGIT = re.compile(r'\D')
+_NON_ALPHANUMERIC = re.compile(r'[^0-9a-z]')
+
+# One random multiply-add permutation of the (already mixed) 3-gram hashes per signature slot;
+# fixed seed so signatures are reproducible
+_rng = np.random.default_rng(20240601)
+_MULTIPLIERS = _rng.integers(0, 2 ** 63, NUM_PERMUTATIONS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_OFFSETS = _rng.integers(0, 2 ** 63, NUM_PERMUTATIONS, dtype=np.uint64)
+
+_name_classifier = ColumnNameClassifier()
+
+def normalize_value(value, value_type='Text'):
+    """Matching form of one value
+
+    Text is NFKC-normalized and casefolded, Arabic letter variants are unified and
+    diacritics dropped, punctuation and whitespace runs become one space. Phones keep
+    their last 9 digits (dropping +966 / 00966 / 0 prefixes), IDs just their digits.
+    """
+    text = unicodedata.normalize('NFKC', str(value)).casefold()
+    if value_type in DIGIT_TYPES:
+        digits = _NON_DIGIT.sub('', text.translate(EASTERN_DIGITS))
+        return digits[-9:] if value_type == 'Phone' else digits
+    if value_type == 'IBAN':
+        return _NON_ALPHANUMERIC.sub('', text)
+    return _NON_WORD.sub(' ', text.translate(_TEXT_TRANSLATION)).strip()
+
+def normalize_values(values, value_type='Text'):
+    """normalize_value over a Series; missing values become ''"""
+    normalized = [normalize_value(value, value_type) if not pd.isna(value) else '' for value in values]
+    return pd.Series(normalized, index=values.index, dtype=object)
+
+def default_key_columns(df, schema_analysis=None):
+    """Columns that identify an entity: text-like schema types, excluding surrogate keys and audit fields"""
+    specs = column_specs(schema_analysis)
+    key_columns = []
+    for name in df.columns:
+        column_type = specs.get(str(name), {}).get('type')
+        if column_type is None:
+            column = df[name]
+            if pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+                continue
+            column_type = 'DateTime' if pd.api.types.is_datetime64_any_dtype(column) else _value_type(name, specs)
+        if column_type not in KEY_TYPES or _name_classifier.is_audit_field(str(name)):
+            continue
+        if column_type in ('Text', 'Categorical') and _name_classifier.is_primary_key(str(name)):
+            continue
+        key_columns.append(name)
+    return key_columns
+
+def _value_type(name, specs):
+    """Schema type of a column, or the type its name suggests"""
+    return specs.get(str(name), {}).get('type') or _name_classifier.type_hint(str(name))
+
+def _record_strings(df, columns, specs):
+    """One normalized string per row; each column is normalized on its distinct values"""
+    record = None
+    for name in columns:
+        codes, uniques = pd.factorize(df[name])
+        normalized = normalize_values(pd.Series(uniques, dtype=object), _value_type(name, specs))
+        part = pd.Series(np.append(normalized.to_numpy(dtype=object), '')[codes], index=df.index, dtype=object)
+        record = part if record is None else record + '\x1f' + part
+    return record
+
+def _mix(x):
+    """splitmix64 finalizer (vectorized, wrapping uint64 arithmetic)"""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def _segments(starts, lengths):
+    """Concatenated index ranges [start, start + length) for each segment"""
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(lengths.sum()) - np.repeat(offsets - starts, lengths)
+
+def _gram_hashes(strings):
+    """Hashes of the character 3-grams of each string (with start/end markers), and where each string's grams start"""
+    strings = ['\x02' + text + '\x03' for text in strings]
+    lengths = np.fromiter((len(text) for text in strings), dtype=np.int64, count=len(strings))
+    codepoints = np.frombuffer(''.join(strings).encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    # Every string has at least 3 characters (the markers), so at least one 3-gram
+    gram_counts = lengths - 2
+    positions = _segments(np.cumsum(lengths) - lengths, gram_counts)
+    grams = _mix(codepoints[positions] * np.uint64(0x100000001B3)
+                 ^ codepoints[positions + 1] * np.uint64(0x1000193)
+                 ^ codepoints[positions + 2])
+    return grams, np.cumsum(gram_counts) - gram_counts
+
+def minhash_signatures(strings):
+    """MinHash signatures (len(strings) x NUM_PERMUTATIONS) of the character 3-gram sets of strings"""
+    signatures = np.empty((len(strings), NUM_PERMUTATIONS), dtype=np.uint64)
+    for start in range(0, len(strings), SIGNATURE_BATCH_SIZE):
+        grams, gram_starts = _gram_hashes(strings[start:start + SIGNATURE_BATCH_SIZE])
+        with np.errstate(over='ignore'):
+            for k in range(NUM_PERMUTATIONS):
+                signatures[start:start + len(gram_starts), k] = np.minimum.reduceat(grams * _MULTIPLIERS[k] + _OFFSETS[k], gram_starts)
+    return signatures
+
+def _distinct_sorted(keys):
+    """Sorted distinct values (np.unique without its hash-table path, which is slower on large int arrays)"""
+    keys = np.sort(keys)
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    return keys[first]
+
+def jaccard_similarity(strings, pairs):
+    """Exact Jaccard similarity of the 3-gram sets of each pair (row of indices into strings)"""
+    similarity = np.empty(len(pairs))
+    shift = np.uint64(64 - PAIR_BITS)
+    for first in range(0, len(pairs), 1 << PAIR_BITS):
+        batch = pairs[first:first + (1 << PAIR_BITS)]
+        records, local = np.unique(batch, return_inverse=True)
+        local = local.reshape(batch.shape)
+        grams, gram_starts = _gram_hashes([strings[record] for record in records])
+        gram_counts = np.diff(np.append(gram_starts, len(grams)))
+        # Key = pair number in the high bits, gram hash in the rest; distinct keys per side
+        sides = []
+        for side in (0, 1):
+            lengths = gram_counts[local[:, side]]
+            pair_numbers = np.repeat(np.arange(len(batch), dtype=np.uint64), lengths)
+            side_grams = grams[_segments(gram_starts[local[:, side]], lengths)]
+            sides.append(_distinct_sorted((pair_numbers << shift) | (side_grams >> np.uint64(PAIR_BITS))))
+        sizes = [np.bincount((keys >> shift).astype(np.int64), minlength=len(batch)) for keys in sides]
+        # A gram in both sets appears twice in the merged keys
+        keys = np.sort(np.concatenate(sides))
+        shared = (keys[1:][keys[1:] == keys[:-1]] >> shift).astype(np.int64)
+        intersection = np.bincount(shared, minlength=len(batch))
+        similarity[first:first + len(batch)] = intersection / (sizes[0] + sizes[1] - intersection)
+    return similarity
+
+def _candidate_pairs(signatures, blocks):
+    """Pairs of records sharing an LSH band bucket within the same block, and the number of capped buckets
+
+    Every pair within a bucket is a candidate, so a member failing the exact
+    check does not hide a match between others. Buckets of more than
+    MAX_BUCKET_SIZE records only pair neighbours in bucket order.
+    """
+    pairs = []
+    capped_buckets = 0
+    for band in range(NUM_PERMUTATIONS // BAND_ROWS):
+        band_hash = np.full(len(signatures), np.uint64(band), dtype=np.uint64)
+        for k in range(band * BAND_ROWS, (band + 1) * BAND_ROWS):
+            band_hash = _mix(band_hash ^ signatures[:, k])
+        bucket = _mix(band_hash ^ blocks.astype(np.uint64))
+        order = np.argsort(bucket, kind='stable')
+        sorted_bucket = bucket[order]
+        starts = np.flatnonzero(np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]])
+        sizes = np.diff(np.append(starts, len(order)))
+        starts, sizes = starts[sizes > 1], sizes[sizes > 1]
+        capped = sizes > MAX_BUCKET_SIZE
+        capped_buckets += int(capped.sum())
+
+        # Position i pairs with i + offset while both are in the same bucket
+        members = _segments(starts[~capped], sizes[~capped])
+        ends = np.repeat(starts[~capped] + sizes[~capped], sizes[~capped])
+        offset = 1
+        while len(members):
+            valid = members + offset < ends
+            members, ends = members[valid], ends[valid]
+            pairs.append(np.stack([order[members], order[members + offset]], axis=1))
+            offset += 1
+        neighbours = _segments(starts[capped], sizes[capped] - 1)
+        pairs.append(np.stack([order[neighbours], order[neighbours + 1]], axis=1))
+    pairs = np.concatenate(pairs)
+    pairs.sort(axis=1)
+    # Distinct pairs, ordered
+    encoded = _distinct_sorted(pairs[:, 0] * len(signatures) + pairs[:, 1])
+    return np.stack([encoded // len(signatures), encoded % len(signatures)], axis=1), capped_buckets
+
+def _connected_components(count, pairs):
+    """Component label (smallest member) of every node, by min-label propagation with pointer jumping"""
+    labels = np.arange(count)
+    if len(pairs) == 0:
+        return labels
+    left, right = pairs[:, 0], pairs[:, 1]
+    while True:
+        lowest = np.minimum(labels[left], labels[right])
+        updated = labels.copy()
+        np.minimum.at(updated, left, lowest)
+        np.minimum.at(updated, right, lowest)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+def find_near_duplicates(df, key_columns=None, blocking_columns=(), schema_analysis=None, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+    """Cluster label of every row (-1 for rows with empty key columns) and run statistics
+
+    Rows with the same label are near duplicates. Candidates must agree on the
+    normalized blocking columns.
+    """
+    specs = column_specs(schema_analysis)
+    key_columns = list(key_columns) if key_columns is not None else default_key_columns(df, schema_analysis)
+    blocking_columns = [name for name in blocking_columns if name in df.columns]
+    stats = {'key_columns': [str(name) for name in key_columns], 'blocking_columns': [str(name) for name in blocking_columns],
+             'candidate_pairs': 0, 'matched_pairs': 0, 'capped_buckets': 0}
+    labels = np.full(len(df), -1, dtype=np.int64)
+    if not key_columns or len(df) == 0:
+        return labels, stats
+
+    records = _record_strings(df, key_columns, specs)
+    has_key = records.str.replace('\x1f', '', regex=False).str.len().to_numpy() > 0
+    # Identical normalized records are matched without hashing
+    codes, unique_records = pd.factorize(records.where(has_key))
+    if len(unique_records) == 0:
+        return labels, stats
+    blocks = np.zeros(len(unique_records), dtype=np.int64)
+    if blocking_columns:
+        block_keys = _record_strings(df, blocking_columns, specs)
+        first_rows = np.unique(codes[codes >= 0], return_index=True)[1]
+        representative = np.flatnonzero(codes >= 0)[first_rows]
+        blocks = pd.factorize(block_keys.iloc[representative])[0]
+
+    signatures = minhash_signatures(list(unique_records))
+    pairs, capped_buckets = _candidate_pairs(signatures, blocks)
+    estimate = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1) if len(pairs) else np.empty(0)
+    # 32 slots estimate Jaccard to about +/-0.08, so likely pairs are confirmed exactly
+    likely = pairs[estimate >= threshold - ESTIMATE_MARGIN]
+    matched = likely[jaccard_similarity(unique_records, likely) >= threshold]
+    stats['candidate_pairs'] = int(len(pairs))
+    stats['matched_pairs'] = int(len(matched))
+    stats['capped_buckets'] = capped_buckets
+
+    components = _connected_components(len(unique_records), matched)
+    labels[codes >= 0] = components[codes[codes >= 0]]
+    return labels, stats
+
+def summarize_clusters(labels, stats=None, keep=None):
+    """Dedup rate and sample clusters from row labels; keep optionally restricts the rows counted"""
+    positions = np.arange(len(labels))
+    if keep is not None:
+        labels, positions = labels[keep], positions[keep]
+    considered = labels >= 0
+    labels, positions = labels[considered], positions[considered]
+    summary = dict(stats or {})
+    summary['records'] = int(len(labels))
+    if len(labels) == 0:
+        summary.update({'clusters': 0, 'near_duplicate_rows': 0, 'dedup_rate': 0.0, 'sample_clusters': []})
+        return summary
+    unique_labels, inverse, sizes = np.unique(labels, return_inverse=True, return_counts=True)
+    duplicated = sizes > 1
+    summary['clusters'] = int(duplicated.sum())
+    summary['near_duplicate_rows'] = int((sizes[duplicated] - 1).sum())
+    summary['dedup_rate'] = summary['near_duplicate_rows'] / len(labels)
+    # Largest clusters first; rows are 1-based
+    sample = []
+    for cluster in np.argsort(-sizes, kind='stable')[:SAMPLE_CLUSTERS]:
+        if sizes[cluster] < 2:
+            break
+        rows = positions[inverse == cluster][:SAMPLE_CLUSTER_ROWS] + 1
+        sample.append({'size': int(sizes[cluster]), 'rows': [int(row) for row in rows]})
+    summary['sample_clusters'] = sample
+    return summary
@@ -5,14 +5,24 @@ Enhanced templates with logo, classification, and detailed control information
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
+from reportlab.lib.enums import TA_CENTER
 from reportlab.pdfgen import canvas
 from datetime import datetime
+import hashlib
+import json
 import os
+from template_engine import FORM_TABLE_STYLE, TEMPLATE_STYLES, classification_banner, register_template, render_template, sentences
 
-def add_header_footer(canvas_obj, doc, logo_path=None, classification="RESTRICTED - INTERNAL"):
+# Per-control compliance report sections are cached here as standalone PDFs,
+# one file per (control, content hash).
+FRAGMENT_CACHE_DIR = os.path.join("templates", "fragments")
+
+# Bumped when the compliance report layout changes, so cached sections are re-rendered
+COMPLIANCE_LAYOUT_VERSION = 2
+
+def add_header_footer(canvas_obj, doc, logo_path=None, classification="RESTRICTED - INTERNAL", show_page_number=True):
     """Add unified professional header and footer to each page"""
     canvas_obj.saveState()
     
@@ -56,7 +66,8 @@ def add_header_footer(canvas_obj, doc, logo_path=None, classification="RESTRICTE
     
     canvas_obj.setFont("Helvetica", 8)
     canvas_obj.setFillColor(colors.HexColor('#7f8c8d'))
-    canvas_obj.drawCentredString(A4[0]/2, 28, f"Page {canvas_obj.getPageNumber()} - NDMO/NDI Compliance Tool")
+    if show_page_number:
+        canvas_obj.drawCentredString(A4[0]/2, 28, f"Page {canvas_obj.getPageNumber()} - NDMO/NDI Compliance Tool")
     canvas_obj.drawRightString(A4[0] - 45, 28, classification)
     
     # Lines - thinner
@@ -67,877 +78,404 @@ def add_header_footer(canvas_obj, doc, logo_path=None, classification="RESTRICTE
     
     canvas_obj.restoreState()
 
-def create_professional_evidence_template(control_id, control_name, spec_id, spec_text, description, priority, domain, evidence_requirements=None):
-    """Create professional evidence template with logo and classification"""
-    
-    os.makedirs("templates", exist_ok=True)
-    
-    filename = f"templates/Evidence_{spec_id.replace('.', '_')}.pdf"
-    doc = SimpleDocTemplate(
-        filename, 
-        pagesize=A4,
-        rightMargin=45,
-        leftMargin=45,
-        topMargin=75,
-        bottomMargin=50
-    )
-    
-    story = []
-    
-    # Styles
-    styles = getSampleStyleSheet()
-    
-    # Title style
-    title_style = ParagraphStyle(
-        'TitleStyle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1f77b4'),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    # Heading style
-    heading_style = ParagraphStyle(
-        'HeadingStyle',
-        parent=styles['Heading2'],
-        fontSize=13,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=10,
-        spaceBefore=15,
-        fontName='Helvetica-Bold',
-        backColor=colors.HexColor('#ecf0f1'),
-        borderPadding=8
-    )
-    
-    # Subheading style
-    subheading_style = ParagraphStyle(
-        'SubheadingStyle',
-        parent=styles['Heading3'],
-        fontSize=11,
-        textColor=colors.HexColor('#34495e'),
-        spaceAfter=8,
-        spaceBefore=10,
-        fontName='Helvetica-Bold'
-    )
-    
-    # Field label style for table labels
-    field_label_style = ParagraphStyle(
-        'FieldLabelStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        fontName='Helvetica-Bold',
-        leading=14
-    )
-    
-    # Normal text style - must be defined early for use in tables
-    normal_style = ParagraphStyle(
-        'NormalStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        alignment=TA_LEFT,
-        leading=14,
-        wordWrap='CJK'
-    )
-    
-    # Text display style for long texts
-    text_display_style = ParagraphStyle(
-        'TextDisplayStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.black,
-        alignment=TA_LEFT,
-        leading=16,
-        wordWrap='CJK',
-        spaceAfter=6
-    )
-    
-    # Specification text style
-    spec_text_style = ParagraphStyle(
-        'SpecTextStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#2c3e50'),
-        alignment=TA_LEFT,
-        leading=16,
-        wordWrap='CJK',
-        spaceAfter=8,
-        leftIndent=0,
-        rightIndent=0
-    )
-    
-    # Classification banner
-    classification = "RESTRICTED - INTERNAL"
-    # Classification style (white text)
-    classification_style = ParagraphStyle(
-        'ClassificationStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.white,
-        alignment=TA_CENTER,
-        leading=14
-    )
-    classification_table = Table(
-        [[Paragraph(f"<b>CLASSIFICATION: {classification}</b>", classification_style)]],
-        colWidths=[7*inch],
-        style=TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#e74c3c')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ])
-    )
-    story.append(classification_table)
-    story.append(Spacer(1, 0.15*inch))
-    
-    # Title
-    story.append(Paragraph("Evidence Collection Form", title_style))
-    story.append(Spacer(1, 0.12*inch))
-    
-    # Control Information Section
-    story.append(Paragraph("Control Information", heading_style))
-    
-    # Create table data with proper Paragraph objects for HTML rendering
-    control_data = [
-        [Paragraph('<b>Control ID:</b>', normal_style), Paragraph(control_id, normal_style)],
-        [Paragraph('<b>Control Name:</b>', normal_style), Paragraph(control_name, normal_style)],
-        [Paragraph('<b>Domain:</b>', normal_style), Paragraph(domain, normal_style)],
-        [Paragraph('<b>Specification ID:</b>', normal_style), Paragraph(spec_id, normal_style)],
-        [Paragraph('<b>Priority:</b>', normal_style), Paragraph(f'<b>{priority}</b>', normal_style)],
-        [Paragraph('<b>Document Date:</b>', normal_style), Paragraph(datetime.now().strftime("%Y-%m-%d"), normal_style)]
+def _format_compliance_status(evidence_summary):
+    """Render the status checkboxes, ticking the measured status when known"""
+    status = (evidence_summary or {}).get('status', '')
+    options = [
+        ('Compliant', ['Compliant']),
+        ('Partially Compliant', ['Partially Compliant', 'In Progress']),
+        ('Non-Compliant', ['Non-Compliant'])
     ]
-    
-    control_table = Table(control_data, colWidths=[2.2*inch, 4.8*inch])
-    control_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-    ]))
-    story.append(control_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Specification Details Section
-    story.append(Paragraph("Specification Details", heading_style))
-    
-    # Display specification text professionally
-    story.append(Paragraph("<b>Specification Text:</b>", subheading_style))
-    if spec_text:
-        # Split long text into paragraphs for better display
-        spec_paragraphs = spec_text.split('. ')
-        for para in spec_paragraphs[:5]:  # First 5 sentences
-            if para.strip():
-                story.append(Paragraph(para.strip() + ('.' if not para.endswith('.') else ''), spec_text_style))
-    else:
-        story.append(Paragraph("N/A", text_display_style))
-    
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Description
-    story.append(Paragraph("<b>Description:</b>", subheading_style))
-    if description:
-        desc_paragraphs = description.split('. ')
-        for para in desc_paragraphs[:3]:  # First 3 sentences
-            if para.strip():
-                story.append(Paragraph(para.strip() + ('.' if not para.endswith('.') else ''), text_display_style))
-    else:
-        story.append(Paragraph("N/A", text_display_style))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Evidence Requirements Section
-    if evidence_requirements:
-        story.append(Paragraph("Evidence Requirements", heading_style))
-        
-        req_data = [['<b>Requirement</b>', '<b>Description</b>', '<b>Format</b>', '<b>Required</b>']]
-        for req in evidence_requirements[:5]:  # First 5 requirements
-            req_data.append([
-                req.get('type', 'Document'),
-                req.get('description', '')[:80] + '...' if len(req.get('description', '')) > 80 else req.get('description', ''),
-                req.get('format', 'PDF'),
-                'Yes' if req.get('required', True) else 'No'
-            ])
-        
-        req_table = Table(req_data, colWidths=[1.5*inch, 3*inch, 1*inch, 1.5*inch])
-        req_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6'))
-        ]))
-        story.append(req_table)
-        story.append(Spacer(1, 0.2*inch))
-    
-    # Evidence Collection Section
-    story.append(Paragraph("Evidence Collection", heading_style))
-    
-    # More practical evidence fields with better spacing - using Paragraph for HTML
-    evidence_fields = [
-        [Paragraph('<b>Evidence Type:</b>', field_label_style), '_________________________________', Paragraph('<b>Evidence Category:</b>', field_label_style), '☐ Policy  ☐ Procedure  ☐ Configuration  ☐ Report'],
-        [Paragraph('<b>Evidence Description:</b>', field_label_style), '', '', ''],
-        ['', '', '', ''],
-        ['', '', '', ''],
-        [Paragraph('<b>File Name:</b>', field_label_style), '_________________________________', Paragraph('<b>File Size:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>File Location/Path:</b>', field_label_style), '_________________________________', Paragraph('<b>File Format:</b>', field_label_style), '☐ PDF  ☐ DOCX  ☐ XLSX  ☐ Other'],
-        [Paragraph('<b>Upload Date:</b>', field_label_style), '_________________________________', Paragraph('<b>Version:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>Uploaded By:</b>', field_label_style), '_________________________________', Paragraph('<b>Department:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>Reviewed By:</b>', field_label_style), '_________________________________', Paragraph('<b>Review Date:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>Approved By:</b>', field_label_style), '_________________________________', Paragraph('<b>Approval Date:</b>', field_label_style), '_________________________________']
-    ]
-    
-    evidence_table = Table(evidence_fields, colWidths=[1.8*inch, 2.2*inch, 1.8*inch, 2.2*inch])
-    evidence_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-        ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('SPAN', (1, 1), (3, 3))  # Span description field across 3 rows for more writing space
-    ]))
-    story.append(evidence_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Acceptance Criteria Section
-    story.append(Paragraph("Acceptance Criteria", heading_style))
-    
-    if evidence_requirements:
-        for req in evidence_requirements[:3]:
-            if req.get('acceptance_criteria'):
-                story.append(Paragraph(f"<b>{req.get('type', 'Document')}:</b>", subheading_style))
-                # Split long acceptance criteria into readable paragraphs
-                criteria_text = req.get('acceptance_criteria', '')
-                if len(criteria_text) > 200:
-                    # Split by sentences for long text
-                    sentences = criteria_text.split('. ')
-                    for sent in sentences[:4]:  # First 4 sentences
-                        if sent.strip():
-                            story.append(Paragraph(sent.strip() + ('.' if not sent.endswith('.') else ''), text_display_style))
-                else:
-                    story.append(Paragraph(criteria_text, text_display_style))
-                story.append(Spacer(1, 0.15*inch))
-    
-    # Compliance Status Section
-    story.append(Paragraph("Compliance Status", heading_style))
-    
-    status_data = [
-        [Paragraph('<b>Compliance Status:</b>', field_label_style), '☐ Compliant  ☐ Partially Compliant  ☐ Non-Compliant  ☐ Not Applicable'],
-        [Paragraph('<b>Compliance Score (%):</b>', field_label_style), '___________ %', Paragraph('<b>Maturity Level:</b>', field_label_style), '☐ Level 0  ☐ Level 1  ☐ Level 2  ☐ Level 3  ☐ Level 4  ☐ Level 5'],
-        [Paragraph('<b>Implementation Date:</b>', field_label_style), '_________________________________', Paragraph('<b>Review Date:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>Next Review Date:</b>', field_label_style), '_________________________________', Paragraph('<b>Last Audit Date:</b>', field_label_style), '_________________________________']
-    ]
-    
-    status_table = Table(status_data, colWidths=[2.1*inch, 2.6*inch, 1.6*inch, 2.1*inch])
-    status_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-        ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-    ]))
-    story.append(status_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Notes Section - More practical with more writing space
-    story.append(Paragraph("Notes and Comments", heading_style))
-    
-    # Use a simpler approach with better text display
-    notes_data = [
-        ['<b>Notes:</b>', ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        ['', '']
+    return '  '.join(f"{'☒' if status in matches else '☐'} {label}" for label, matches in options)
+
+PROFESSIONAL_TABLE_STYLE = dict(FORM_TABLE_STYLE, side_padding=10)
+
+COMPLIANCE_REPORT_TEMPLATE = {
+    'page': {'margins': (75, 45, 50, 45), 'header_footer': 'professional'},
+    'table_style': PROFESSIONAL_TABLE_STYLE,
+    'styles': TEMPLATE_STYLES,
+    'blocks': [
+        classification_banner(width=7, spacer_after=0.2),
+        {'type': 'title', 'text': "Compliance Report", 'spacer_after': 0.15},
+        {'type': 'heading', 'text': "Report Information"},
+        {'type': 'field_table', 'col_widths': [1.9, 2.3, 1.9, 2.3], 'label_columns': [0, 2], 'cell_style': 'cell',
+         'spacer_after': 0.2, 'rows': [
+            ['Control ID:', '{control_id}', 'Domain:', '{domain}'],
+            ['Control Name:', '{control_name}', 'Report Period:', 'From: ___________  To: ___________'],
+            ['{date_label}:', '{today}', 'Entity Name:', None],
+            ['Prepared By:', None, 'Department:', None]
+        ]},
+        {'type': 'heading', 'text': "Compliance Summary"},
+        {'type': 'field_table', 'col_widths': [2.6, 2.6, 1.6, 1.6], 'label_columns': [0, 2],
+         'extra_style': [('FONTSIZE', (0, 0), (0, -1), 10), ('FONTSIZE', (2, 0), (2, -1), 10)],
+         'spacer_after': 0.2, 'rows': [
+            ['Overall Compliance Status:', '{status_checkboxes}'],
+            ['Overall Compliance Score:', '{score}', 'Total Specifications:', '{total_specifications}'],
+            ['Compliant Specifications:', '___________', 'Partially Compliant:', '___________'],
+            ['Non-Compliant:', '___________', 'Not Applicable:', '___________']
+        ]},
+        {'type': 'heading', 'text': "Specifications Compliance Details"},
+        {'type': 'grid_table', 'col_widths': [1.3, 1.1, 1.9, 1.1, 1.1], 'align': 'CENTER', 'spacer_after': 0.2,
+         'table_style': {'font_size': 10, 'padding': 12, 'side_padding': 8},
+         'header': ['Spec ID', 'Priority', 'Status', 'Score %', 'Evidence'],
+         'rows_key': 'specifications', 'row_fields': ['spec_id', 'priority', 'status', 'score', 'evidence']},
+        {'type': 'heading', 'text': "Findings and Recommendations"},
+        {'type': 'text_area', 'col_widths': [2.2, 4.9], 'span': True, 'spacer_after': 0.2,
+         'areas': [('Key Findings:', 4), ('Recommendations:', 4), ('Action Items:', 4)]},
+        {'type': 'heading', 'text': "Approval"},
+        {'type': 'signature_block', 'col_widths': [1.6, 2.1, 1.6, 2.1], 'label_columns': [0, 2],
+         'roles': ['Prepared By', 'Reviewed By', 'Approved By']}
     ]
-    
-    notes_table = Table(notes_data, colWidths=[1.6*inch, 5.5*inch])
-    notes_table.setStyle(TableStyle([
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#f8f9fa')),
-        ('SPAN', (1, 0), (1, 7)),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-    ]))
-    story.append(notes_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Signatures Section
-    story.append(Paragraph("Signatures and Approvals", heading_style))
-    
-    # More practical signature fields with better spacing - using Paragraph
-    signature_data = [
-        [Paragraph('<b>Prepared By:</b>', field_label_style), '_________________________', Paragraph('<b>Date:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Name:</b>', field_label_style), '_________________________', Paragraph('<b>Title:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Signature:</b>', field_label_style), '_________________________', Paragraph('<b>Email:</b>', field_label_style), '_________________________'],
-        ['', '', '', ''],
-        [Paragraph('<b>Reviewed By:</b>', field_label_style), '_________________________', Paragraph('<b>Date:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Name:</b>', field_label_style), '_________________________', Paragraph('<b>Title:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Signature:</b>', field_label_style), '_________________________', Paragraph('<b>Email:</b>', field_label_style), '_________________________'],
-        ['', '', '', ''],
-        [Paragraph('<b>Approved By:</b>', field_label_style), '_________________________', Paragraph('<b>Date:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Name:</b>', field_label_style), '_________________________', Paragraph('<b>Title:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Signature:</b>', field_label_style), '_________________________', Paragraph('<b>Email:</b>', field_label_style), '_________________________']
+}
+
+register_template('professional_compliance_report', COMPLIANCE_REPORT_TEMPLATE)
+# Entity report sections: page numbers are stamped when the fragments are assembled
+register_template('professional_compliance_fragment', dict(
+    COMPLIANCE_REPORT_TEMPLATE, page=dict(COMPLIANCE_REPORT_TEMPLATE['page'], page_numbers=False)
+))
+
+EVIDENCE_TEMPLATE = {
+    'page': {'margins': (75, 45, 50, 45), 'header_footer': 'professional'},
+    'table_style': PROFESSIONAL_TABLE_STYLE,
+    'styles': dict(
+        TEMPLATE_STYLES,
+        subheading={'parent': 'Heading3', 'fontSize': 11, 'textColor': '#34495e', 'spaceAfter': 8, 'spaceBefore': 10,
+                    'fontName': 'Helvetica-Bold'},
+        cell={'parent': 'Normal', 'fontSize': 11, 'leading': 14, 'wordWrap': 'CJK'},
+        text={'parent': 'Normal', 'fontSize': 10, 'leading': 16, 'wordWrap': 'CJK', 'spaceAfter': 6},
+        spec={'parent': 'Normal', 'fontSize': 10, 'textColor': '#2c3e50', 'leading': 16, 'wordWrap': 'CJK', 'spaceAfter': 8}
+    ),
+    'blocks': [
+        classification_banner(width=7),
+        {'type': 'title', 'text': "Evidence Collection Form", 'spacer_after': 0.12},
+        {'type': 'heading', 'text': "Control Information"},
+        {'type': 'field_table', 'col_widths': [2.2, 4.8], 'cell_style': 'cell', 'spacer_after': 0.2,
+         'table_style': {'font_size': 10, 'side_padding': None, 'valign': 'TOP'}, 'rows': [
+            ['Control ID:', '{control_id}'],
+            ['Control Name:', '{control_name}'],
+            ['Domain:', '{domain}'],
+            ['Specification ID:', '{spec_id}'],
+            ['Priority:', '<b>{priority}</b>'],
+            ['Document Date:', '{today}']
+        ]},
+        {'type': 'heading', 'text': "Specification Details"},
+        {'type': 'paragraph', 'text': "<b>Specification Text:</b>", 'style': 'subheading'},
+        {'type': 'paragraphs', 'key': 'spec_sentences', 'style': 'spec', 'empty': "N/A", 'spacer_after': 0.2},
+        {'type': 'paragraph', 'text': "<b>Description:</b>", 'style': 'subheading'},
+        {'type': 'paragraphs', 'key': 'description_sentences', 'style': 'text', 'empty': "N/A", 'spacer_after': 0.2},
+        {'type': 'heading', 'text': "Evidence Requirements", 'when': 'requirements'},
+        {'type': 'grid_table', 'when': 'requirements', 'col_widths': [1.5, 3, 1, 1.5], 'align': 'CENTER', 'spacer_after': 0.2,
+         'table_style': {'font_size': 9, 'padding': 8, 'side_padding': None, 'valign': None, 'grid_width': 1},
+         'extra_style': [('ALIGN', (1, 1), (1, -1), 'LEFT')],
+         'header': ['Requirement', 'Description', 'Format', 'Required'],
+         'rows_key': 'requirements', 'row_fields': ['type', 'description', 'format', 'required']},
+        {'type': 'heading', 'text': "Evidence Collection"},
+        {'type': 'field_table', 'col_widths': [1.8, 2.2, 1.8, 2.2], 'label_columns': [0, 2], 'spacer_after': 0.2,
+         'table_style': {'font_size': 9, 'side_padding': None, 'valign': 'TOP'},
+         # Description spans three rows for more writing space
+         'extra_style': [('SPAN', (1, 1), (3, 3))], 'rows': [
+            ['Evidence Type:', None, 'Evidence Category:', '☐ Policy  ☐ Procedure  ☐ Configuration  ☐ Report'],
+            ['Evidence Description:', '', '', ''],
+            ['', '', '', ''],
+            ['', '', '', ''],
+            ['File Name:', None, 'File Size:', None],
+            ['File Location/Path:', None, 'File Format:', '☐ PDF  ☐ DOCX  ☐ XLSX  ☐ Other'],
+            ['Upload Date:', None, 'Version:', None],
+            ['Uploaded By:', None, 'Department:', None],
+            ['Reviewed By:', None, 'Review Date:', None],
+            ['Approved By:', None, 'Approval Date:', None]
+        ]},
+        {'type': 'heading', 'text': "Acceptance Criteria"},
+        {'type': 'repeat', 'key': 'acceptance_criteria', 'blocks': [
+            {'type': 'paragraph', 'text': "<b>{type}:</b>", 'style': 'subheading'},
+            {'type': 'paragraphs', 'key': 'sentences', 'style': 'text', 'spacer_after': 0.15}
+        ]},
+        {'type': 'heading', 'text': "Compliance Status"},
+        {'type': 'field_table', 'col_widths': [2.1, 2.6, 1.6, 2.1], 'label_columns': [0, 2], 'spacer_after': 0.2, 'rows': [
+            ['Compliance Status:', '☐ Compliant  ☐ Partially Compliant  ☐ Non-Compliant  ☐ Not Applicable'],
+            ['Compliance Score (%):', '___________ %', 'Maturity Level:', '☐ Level 0  ☐ Level 1  ☐ Level 2  ☐ Level 3  ☐ Level 4  ☐ Level 5'],
+            ['Implementation Date:', None, 'Review Date:', None],
+            ['Next Review Date:', None, 'Last Audit Date:', None]
+        ]},
+        {'type': 'heading', 'text': "Notes and Comments"},
+        {'type': 'text_area', 'col_widths': [1.6, 5.5], 'span': True, 'spacer_after': 0.2, 'areas': [('Notes:', 8)]},
+        {'type': 'heading', 'text': "Signatures and Approvals"},
+        {'type': 'field_table', 'col_widths': [1.5, 2, 1.5, 2], 'label_columns': [0, 2], 'label_shading': False,
+         'blank': '_________________________', 'table_style': {'font_size': 10, 'padding': 12, 'side_padding': None},
+         'rows': [
+            ['Prepared By:', None, 'Date:', None],
+            ['Name:', None, 'Title:', None],
+            ['Signature:', None, 'Email:', None],
+            ['', '', '', ''],
+            ['Reviewed By:', None, 'Date:', None],
+            ['Name:', None, 'Title:', None],
+            ['Signature:', None, 'Email:', None],
+            ['', '', '', ''],
+            ['Approved By:', None, 'Date:', None],
+            ['Name:', None, 'Title:', None],
+            ['Signature:', None, 'Email:', None]
+        ]}
     ]
-    
-    sig_table = Table(signature_data, colWidths=[1.5*inch, 2*inch, 1.5*inch, 2*inch])
-    sig_table.setStyle(TableStyle([
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-    ]))
-    story.append(sig_table)
-    
-    # Build PDF with header/footer
-    logo_path = "logo@3x.png"
-    
-    def on_first_page(canvas, doc):
-        add_header_footer(canvas, doc, logo_path, classification)
-    
-    def on_later_pages(canvas, doc):
-        add_header_footer(canvas, doc, logo_path, classification)
-    
-    doc.build(story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
-    return filename
+}
+
+register_template('professional_evidence', EVIDENCE_TEMPLATE)
+
+def create_professional_evidence_template(control_id, control_name, spec_id, spec_text, description, priority, domain, evidence_requirements=None):
+    """Create professional evidence template with logo and classification"""
+    filename = f"templates/Evidence_{spec_id.replace('.', '_')}.pdf"
+    requirements = evidence_requirements or []
+    acceptance = []
+    for req in requirements[:3]:
+        criteria = req.get('acceptance_criteria')
+        if criteria:
+            # Long criteria are split into their first sentences
+            acceptance.append({
+                'type': req.get('type', 'Document'),
+                'sentences': sentences(criteria, 4) if len(criteria) > 200 else [criteria]
+            })
+    
+    return render_template('professional_evidence', filename, {
+        'control_id': control_id,
+        'control_name': control_name,
+        'domain': domain,
+        'spec_id': spec_id,
+        'priority': priority,
+        'spec_sentences': sentences(spec_text, 5),
+        'description_sentences': sentences(description, 3),
+        'requirements': [
+            {
+                'type': req.get('type', 'Document'),
+                'description': req.get('description', '')[:80] + '...' if len(req.get('description', '')) > 80 else req.get('description', ''),
+                'format': req.get('format', 'PDF'),
+                'required': 'Yes' if req.get('required', True) else 'No'
+            }
+            for req in requirements[:5]
+        ],
+        'acceptance_criteria': acceptance
+    })
+
+def _compliance_report_data(control_id, control_name, domain, specifications, evidence_summary=None, date_label="Report Date"):
+    """Fill values of the compliance report template for one control"""
+    score = (evidence_summary or {}).get('score')
+    return {
+        'control_id': control_id,
+        'control_name': control_name if len(control_name) <= 50 else control_name[:47] + '...',
+        'domain': domain if len(domain) <= 40 else domain[:37] + '...',
+        'date_label': date_label,
+        'status_checkboxes': _format_compliance_status(evidence_summary),
+        'score': f"{score} %" if score is not None else '___________ %',
+        'total_specifications': len(specifications),
+        'specifications': [
+            {
+                'spec_id': spec.get('spec_id', '') if len(spec.get('spec_id', '')) <= 12 else spec.get('spec_id', '')[:9] + '...',
+                'priority': spec.get('priority', 'P1'),
+                'status': '☐ C ☐ PC ☐ NC ☐ NA',
+                'score': '____',
+                'evidence': '☐ Yes ☐ No'
+            }
+            for spec in specifications[:10]  # First 10 specs
+        ]
+    }
 
 def create_professional_compliance_report(control_id, control_name, domain, specifications, evidence_summary=None):
     """Create professional compliance report with logo and classification"""
-    
-    os.makedirs("templates", exist_ok=True)
-    
     filename = f"templates/Compliance_Report_{control_id.replace('.', '_')}.pdf"
-    doc = SimpleDocTemplate(
-        filename,
-        pagesize=A4,
-        rightMargin=45,
-        leftMargin=45,
-        topMargin=75,
-        bottomMargin=50
+    return render_template(
+        'professional_compliance_report', filename,
+        _compliance_report_data(control_id, control_name, domain, specifications, evidence_summary)
+    )
+
+def compliance_fragment_key(control_id, control_name, domain, specifications, evidence_summary=None):
+    """Content hash of everything that is rendered into a control's report section"""
+    payload = json.dumps(
+        [COMPLIANCE_LAYOUT_VERSION, control_id, control_name, domain, specifications, evidence_summary or {}],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+def render_compliance_fragment(control_id, control_name, domain, specifications, evidence_summary=None):
+    """Render one control's compliance section, reusing the cached PDF when its data is unchanged
+    
+    Returns (fragment_path, rendered) where rendered is False on a cache hit.
+    """
+    os.makedirs(FRAGMENT_CACHE_DIR, exist_ok=True)
+    
+    key = compliance_fragment_key(control_id, control_name, domain, specifications, evidence_summary)
+    safe_id = control_id.replace('.', '_').replace('/', '_')
+    fragment_path = os.path.join(FRAGMENT_CACHE_DIR, f"Compliance_{safe_id}_{key}.pdf")
+    if os.path.exists(fragment_path):
+        return fragment_path, False
+    
+    # Drop stale fragments of this control so the cache holds one file per control
+    prefix = f"Compliance_{safe_id}_"
+    for old_file in os.listdir(FRAGMENT_CACHE_DIR):
+        if old_file.startswith(prefix) and old_file.endswith('.pdf') and len(old_file) == len(prefix) + 20:
+            try:
+                os.remove(os.path.join(FRAGMENT_CACHE_DIR, old_file))
+            except OSError:
+                pass
+    
+    # Page numbers are stamped when fragments are assembled into the entity report
+    tmp_path = fragment_path + ".tmp"
+    render_template(
+        'professional_compliance_fragment', tmp_path,
+        _compliance_report_data(control_id, control_name, domain, specifications, evidence_summary, date_label="Section Updated")
     )
+    os.replace(tmp_path, fragment_path)
+    return fragment_path, True
+
+def _create_page_number_overlay(page_count):
+    """Create an in-memory PDF holding only the footer page numbers"""
+    from io import BytesIO
+    buffer = BytesIO()
+    overlay = canvas.Canvas(buffer, pagesize=A4)
+    for page_number in range(1, page_count + 1):
+        overlay.setFont("Helvetica", 8)
+        overlay.setFillColor(colors.HexColor('#7f8c8d'))
+        overlay.drawCentredString(A4[0]/2, 28, f"Page {page_number} of {page_count} - NDMO/NDI Compliance Tool")
+        overlay.showPage()
+    overlay.save()
+    buffer.seek(0)
+    return buffer
+
+def create_entity_compliance_report(controls, specifications_by_control, compliance_data=None, entity_name=None):
+    """Create an entity-wide compliance report from cached per-control sections
     
-    story = []
+    Each control is rendered as its own fragment keyed by a hash of its data, so
+    only controls whose specifications or measurements changed since the last run
+    are re-rendered. Unchanged sections are copied straight from the cache.
     
-    # Styles - MUST be defined before use
+    Returns (filename, rendered_control_ids).
+    """
+    try:
+        from pypdf import PdfReader, PdfWriter
+    except ImportError:
+        raise ImportError("pypdf is required to assemble the entity compliance report. Install it with: pip install pypdf")
+    
+    os.makedirs("templates", exist_ok=True)
+    compliance_data = compliance_data or {}
+    
+    fragment_paths = []
+    rendered_control_ids = []
+    for control in controls:
+        control_id = control['id']
+        fragment_path, rendered = render_compliance_fragment(
+            control_id,
+            control.get('title') or control.get('name') or '',
+            control.get('domain') or control.get('category') or 'Unknown',
+            specifications_by_control.get(control_id, []),
+            compliance_data.get(control_id)
+        )
+        fragment_paths.append(fragment_path)
+        if rendered:
+            rendered_control_ids.append(control_id)
+    
+    # Cover page is cheap and dated, so it is always rendered fresh
+    from io import BytesIO
+    cover_buffer = BytesIO()
+    cover_doc = SimpleDocTemplate(cover_buffer, pagesize=A4, rightMargin=45, leftMargin=45, topMargin=75, bottomMargin=50)
     styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'TitleStyle',
+    cover_title_style = ParagraphStyle(
+        'CoverTitleStyle',
         parent=styles['Heading1'],
-        fontSize=18,
+        fontSize=20,
         textColor=colors.HexColor('#1f77b4'),
         spaceAfter=20,
         alignment=TA_CENTER,
         fontName='Helvetica-Bold'
     )
-    
-    heading_style = ParagraphStyle(
-        'HeadingStyle',
-        parent=styles['Heading2'],
-        fontSize=13,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=10,
-        spaceBefore=15,
-        fontName='Helvetica-Bold',
-        backColor=colors.HexColor('#ecf0f1'),
-        borderPadding=8
-    )
-    
-    # Field label style for table labels - MUST be defined before use in report_data
-    field_label_style = ParagraphStyle(
-        'FieldLabelStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        fontName='Helvetica-Bold',
-        leading=14
-    )
-    
-    # Normal text style for tables
-    normal_style = ParagraphStyle(
-        'NormalStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.black,
-        alignment=TA_LEFT,
-        leading=14,
-        wordWrap='CJK'
-    )
-    
-    # Classification banner
-    classification = "RESTRICTED - INTERNAL"
-    # Classification style (white text)
-    classification_style = ParagraphStyle(
-        'ClassificationStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.white,
-        alignment=TA_CENTER,
-        leading=14
-    )
-    classification_table = Table(
-        [[Paragraph(f"<b>CLASSIFICATION: {classification}</b>", classification_style)]],
-        colWidths=[7*inch],
-        style=TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#e74c3c')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ])
-    )
-    story.append(classification_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Title
-    story.append(Paragraph("Compliance Report", title_style))
-    story.append(Spacer(1, 0.15*inch))
-    
-    # Report Information
-    story.append(Paragraph("Report Information", heading_style))
-    
-    # Better text display for control name and domain
-    control_name_display = control_name if len(control_name) <= 50 else control_name[:47] + '...'
-    domain_display = domain if len(domain) <= 40 else domain[:37] + '...'
-    
-    report_data = [
-        [Paragraph('<b>Control ID:</b>', field_label_style), Paragraph(control_id, normal_style), Paragraph('<b>Domain:</b>', field_label_style), Paragraph(domain_display, normal_style)],
-        [Paragraph('<b>Control Name:</b>', field_label_style), Paragraph(control_name_display, normal_style), Paragraph('<b>Report Period:</b>', field_label_style), 'From: ___________  To: ___________'],
-        [Paragraph('<b>Report Date:</b>', field_label_style), Paragraph(datetime.now().strftime("%Y-%m-%d"), normal_style), Paragraph('<b>Entity Name:</b>', field_label_style), '_________________________________'],
-        [Paragraph('<b>Prepared By:</b>', field_label_style), '_________________________________', Paragraph('<b>Department:</b>', field_label_style), '_________________________________']
+    cover_story = [
+        Spacer(1, 1.5*inch),
+        Paragraph("Entity Compliance Report", cover_title_style),
+        Paragraph(entity_name or "_________________________________", ParagraphStyle('CoverEntity', parent=styles['Normal'], fontSize=14, alignment=TA_CENTER, spaceAfter=20)),
+        Paragraph(f"Report Date: {datetime.now().strftime('%Y-%m-%d')}", ParagraphStyle('CoverDate', parent=styles['Normal'], fontSize=11, alignment=TA_CENTER)),
+        Paragraph(f"Controls Covered: {len(controls)}", ParagraphStyle('CoverCount', parent=styles['Normal'], fontSize=11, alignment=TA_CENTER))
     ]
     
-    report_table = Table(report_data, colWidths=[1.9*inch, 2.3*inch, 1.9*inch, 2.3*inch])
-    report_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-        ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-    ]))
-    story.append(report_table)
-    story.append(Spacer(1, 0.2*inch))
+    def on_cover_page(canvas_obj, doc):
+        add_header_footer(canvas_obj, doc, "logo@3x.png", "RESTRICTED - INTERNAL", show_page_number=False)
     
-    # Compliance Summary
-    story.append(Paragraph("Compliance Summary", heading_style))
-    
-    summary_data = [
-        [Paragraph('<b>Overall Compliance Status:</b>', normal_style), '☐ Compliant  ☐ Partially Compliant  ☐ Non-Compliant'],
-        [Paragraph('<b>Overall Compliance Score:</b>', normal_style), '___________ %', Paragraph('<b>Total Specifications:</b>', normal_style), f'{len(specifications)}'],
-        [Paragraph('<b>Compliant Specifications:</b>', normal_style), '___________', Paragraph('<b>Partially Compliant:</b>', normal_style), '___________'],
-        [Paragraph('<b>Non-Compliant:</b>', normal_style), '___________', Paragraph('<b>Not Applicable:</b>', normal_style), '___________']
-    ]
+    cover_doc.build(cover_story, onFirstPage=on_cover_page, onLaterPages=on_cover_page)
+    cover_buffer.seek(0)
     
-    summary_table = Table(summary_data, colWidths=[2.6*inch, 2.6*inch, 1.6*inch, 1.6*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-        ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-    ]))
-    story.append(summary_table)
-    story.append(Spacer(1, 0.2*inch))
+    writer = PdfWriter()
+    for source in [cover_buffer] + fragment_paths:
+        for page in PdfReader(source).pages:
+            writer.add_page(page)
     
-    # Specifications Details
-    story.append(Paragraph("Specifications Compliance Details", heading_style))
+    overlay_pages = PdfReader(_create_page_number_overlay(len(writer.pages))).pages
+    for page, overlay_page in zip(writer.pages, overlay_pages):
+        page.merge_page(overlay_page)
     
-    spec_headers = [Paragraph('<b>Spec ID</b>', normal_style), Paragraph('<b>Priority</b>', normal_style), Paragraph('<b>Status</b>', normal_style), Paragraph('<b>Score %</b>', normal_style), Paragraph('<b>Evidence</b>', normal_style)]
-    spec_data = [spec_headers]
+    filename = f"templates/Entity_Compliance_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    with open(filename, 'wb') as f:
+        writer.write(f)
     
-    for spec in specifications[:10]:  # First 10 specs
-        spec_id = spec.get('spec_id', '')
-        # Truncate long spec IDs if needed
-        spec_id_display = spec_id if len(spec_id) <= 12 else spec_id[:9] + '...'
-        spec_data.append([
-            spec_id_display,
-            spec.get('priority', 'P1'),
-            '☐ C ☐ PC ☐ NC ☐ NA',
-            '____',
-            '☐ Yes ☐ No'
-        ])
-    
-    spec_table = Table(spec_data, colWidths=[1.3*inch, 1.1*inch, 1.9*inch, 1.1*inch, 1.1*inch])
-    spec_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8)
-    ]))
-    story.append(spec_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Findings and Recommendations - Better text display
-    story.append(Paragraph("Findings and Recommendations", heading_style))
-    
-    findings_data = [
-        [Paragraph('<b>Key Findings:</b>', normal_style), ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        [Paragraph('<b>Recommendations:</b>', normal_style), ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        [Paragraph('<b>Action Items:</b>', normal_style), ''],
-        ['', ''],
-        ['', ''],
-        ['', '']
-    ]
-    
-    findings_table = Table(findings_data, colWidths=[2.2*inch, 4.9*inch])
-    findings_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#f8f9fa')),
-        ('BACKGROUND', (0, 4), (0, 4), colors.HexColor('#f8f9fa')),
-        ('BACKGROUND', (0, 8), (0, 8), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('SPAN', (1, 0), (1, 3)),
-        ('SPAN', (1, 4), (1, 7)),
-        ('SPAN', (1, 8), (1, 11)),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-    ]))
-    story.append(findings_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Signatures
-    story.append(Paragraph("Approval", heading_style))
-    signature_data = [
-        [Paragraph('<b>Prepared By:</b>', field_label_style), '_________________________', Paragraph('<b>Date:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Reviewed By:</b>', field_label_style), '_________________________', Paragraph('<b>Date:</b>', field_label_style), '_________________________'],
-        [Paragraph('<b>Approved By:</b>', field_label_style), '_________________________', Paragraph('<b>Date:</b>', field_label_style), '_________________________']
+    return filename, rendered_control_ids
+
+AUDIT_CHECKLIST_ITEMS = [
+    'Policy documented and approved',
+    'Procedures implemented',
+    'Roles and responsibilities defined',
+    'Training conducted',
+    'Evidence available',
+    'Monitoring in place',
+    'Compliance verified',
+    'Documentation complete',
+    'Review conducted',
+    'Improvements identified'
+]
+
+AUDIT_CHECKLIST_TEMPLATE = {
+    'page': {'margins': (75, 45, 50, 45), 'header_footer': 'professional'},
+    'table_style': dict(PROFESSIONAL_TABLE_STYLE, side_padding=None, valign=None, grid_width=1),
+    'styles': TEMPLATE_STYLES,
+    'blocks': [
+        classification_banner(width=7, spacer_after=0.2),
+        {'type': 'title', 'text': "Audit Checklist", 'spacer_after': 0.15},
+        {'type': 'heading', 'text': "Control Information"},
+        {'type': 'field_table', 'col_widths': [1.8, 2.2, 1.8, 2.2], 'label_columns': [0, 2], 'cell_style': 'cell',
+         'table_style': {'font_size': 9}, 'spacer_after': 0.2, 'rows': [
+            ['Control ID:', '{control_id}', 'Domain:', '{domain}'],
+            ['Control Name:', '{control_name}', 'Audit Date:', None],
+            ['Auditor Name:', None, 'Entity Name:', None],
+            ['Audit Type:', '☐ Internal  ☐ External  ☐ Regulatory', 'Audit Scope:', '☐ Full  ☐ Partial']
+        ]},
+        {'type': 'heading', 'text': "Audit Checklist"},
+        # Generic checks, then one unnumbered check per specification
+        {'type': 'checklist', 'col_widths': [0.5, 3, 0.6, 0.6, 0.6, 1.7], 'table_style': {'font_size': 9, 'padding': 8},
+         'items': AUDIT_CHECKLIST_ITEMS, 'extra_items_key': 'spec_items', 'spacer_after': 0.2},
+        {'type': 'heading', 'text': "Audit Findings"},
+        {'type': 'text_area', 'col_widths': [2, 5], 'span': True, 'table_style': {'font_size': 10, 'padding': 12, 'grid_width': 0.5},
+         'areas': [('Findings:', 4), ('Recommendations:', 4)], 'spacer_after': 0.2},
+        {'type': 'heading', 'text': "Signatures"},
+        {'type': 'field_table', 'col_widths': [1.5, 2, 1.5, 2], 'label_columns': [0, 2], 'label_shading': False,
+         'blank': '_________________________', 'table_style': {'font_size': 9}, 'rows': [
+            ['Auditor:', None, 'Date:', None],
+            ['Name:', None, 'Title:', None],
+            ['', '', '', ''],
+            ['Reviewed By:', None, 'Date:', None],
+            ['Approved By:', None, 'Date:', None]
+        ]}
     ]
-    
-    sig_table = Table(signature_data, colWidths=[1.6*inch, 2.1*inch, 1.6*inch, 2.1*inch])
-    sig_table.setStyle(TableStyle([
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10)
-    ]))
-    story.append(sig_table)
-    
-    # Build PDF
-    logo_path = "logo@3x.png"
-    
-    def on_first_page(canvas, doc):
-        add_header_footer(canvas, doc, logo_path, classification)
-    
-    def on_later_pages(canvas, doc):
-        add_header_footer(canvas, doc, logo_path, classification)
-    
-    doc.build(story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
-    return filename
+}
+
+register_template('professional_audit_checklist', AUDIT_CHECKLIST_TEMPLATE)
 
 def create_professional_audit_checklist(control_id, control_name, domain, specifications):
     """Create professional audit checklist with logo and classification"""
-    
-    os.makedirs("templates", exist_ok=True)
-    
     filename = f"templates/Audit_Checklist_{control_id.replace('.', '_')}.pdf"
-    doc = SimpleDocTemplate(
-        filename,
-        pagesize=A4,
-        rightMargin=45,
-        leftMargin=45,
-        topMargin=75,
-        bottomMargin=50
-    )
-    
-    story = []
-    
-    # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'TitleStyle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1f77b4'),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'HeadingStyle',
-        parent=styles['Heading2'],
-        fontSize=13,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=10,
-        spaceBefore=15,
-        fontName='Helvetica-Bold',
-        backColor=colors.HexColor('#ecf0f1'),
-        borderPadding=8
-    )
-    
-    # Normal text style for tables
-    normal_style = ParagraphStyle(
-        'NormalStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.black,
-        alignment=TA_LEFT,
-        leading=14,
-        wordWrap='CJK'
-    )
-    
-    # Classification banner
-    classification = "RESTRICTED - INTERNAL"
-    # Classification style (white text)
-    classification_style = ParagraphStyle(
-        'ClassificationStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.white,
-        alignment=TA_CENTER,
-        leading=14
-    )
-    classification_table = Table(
-        [[Paragraph(f"<b>CLASSIFICATION: {classification}</b>", classification_style)]],
-        colWidths=[7*inch],
-        style=TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#e74c3c')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ])
-    )
-    story.append(classification_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Normal style for tables (redefine for this function)
-    normal_style = ParagraphStyle(
-        'NormalStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.black,
-        alignment=TA_LEFT,
-        leading=14,
-        wordWrap='CJK'
-    )
-    
-    # Title
-    story.append(Paragraph("Audit Checklist", title_style))
-    story.append(Spacer(1, 0.15*inch))
-    
-    # Control Information
-    story.append(Paragraph("Control Information", heading_style))
-    
-    control_data = [
-        [Paragraph('<b>Control ID:</b>', normal_style), Paragraph(control_id, normal_style), Paragraph('<b>Domain:</b>', normal_style), Paragraph(domain, normal_style)],
-        [Paragraph('<b>Control Name:</b>', normal_style), Paragraph(control_name, normal_style), Paragraph('<b>Audit Date:</b>', normal_style), '_________________________________'],
-        [Paragraph('<b>Auditor Name:</b>', normal_style), '_________________________________', Paragraph('<b>Entity Name:</b>', normal_style), '_________________________________'],
-        [Paragraph('<b>Audit Type:</b>', normal_style), '☐ Internal  ☐ External  ☐ Regulatory', Paragraph('<b>Audit Scope:</b>', normal_style), '☐ Full  ☐ Partial']
-    ]
-    
-    control_table = Table(control_data, colWidths=[1.8*inch, 2.2*inch, 1.8*inch, 2.2*inch])
-    control_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-        ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6'))
-    ]))
-    story.append(control_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Audit Checklist Items
-    story.append(Paragraph("Audit Checklist", heading_style))
-    
-    checklist_headers = [Paragraph('<b>#</b>', normal_style), Paragraph('<b>Check Item</b>', normal_style), Paragraph('<b>Yes</b>', normal_style), Paragraph('<b>No</b>', normal_style), Paragraph('<b>N/A</b>', normal_style), Paragraph('<b>Notes</b>', normal_style)]
-    checklist_items = [
-        'Policy documented and approved',
-        'Procedures implemented',
-        'Roles and responsibilities defined',
-        'Training conducted',
-        'Evidence available',
-        'Monitoring in place',
-        'Compliance verified',
-        'Documentation complete',
-        'Review conducted',
-        'Improvements identified'
-    ]
-    
-    checklist_data = [checklist_headers]
-    for i, item in enumerate(checklist_items, 1):
-        checklist_data.append([str(i), item, '☐', '☐', '☐', ''])
-    
-    # Add specification-specific items with better text display
+    spec_items = []
     for spec in specifications[:5]:
-        spec_id = spec.get('spec_id', '')
         spec_text = spec.get('specification_text', '')
         # Truncate long text professionally
-        if len(spec_text) > 60:
-            spec_text_display = spec_text[:57] + '...'
-        else:
-            spec_text_display = spec_text
-        
-        checklist_data.append([
-            '',
-            f"Spec {spec_id}: {spec_text_display}",
-            '☐', '☐', '☐', ''
-        ])
-    
-    checklist_table = Table(checklist_data, colWidths=[0.5*inch, 3*inch, 0.6*inch, 0.6*inch, 0.6*inch, 1.7*inch])
-    checklist_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6'))
-    ]))
-    story.append(checklist_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Audit Findings
-    story.append(Paragraph("Audit Findings", heading_style))
-    
-    findings_data = [
-        [Paragraph('<b>Findings:</b>', normal_style), ''],
-        ['', ''],
-        ['', ''],
-        ['', ''],
-        [Paragraph('<b>Recommendations:</b>', normal_style), ''],
-        ['', ''],
-        ['', ''],
-        ['', '']
-    ]
-    
-    findings_table = Table(findings_data, colWidths=[2*inch, 5*inch])
-    findings_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#f8f9fa')),
-        ('BACKGROUND', (0, 4), (0, 4), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dee2e6')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('SPAN', (1, 0), (1, 3)),   # Span findings
-        ('SPAN', (1, 4), (1, 7))    # Span recommendations
-    ]))
-    story.append(findings_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Signatures
-    story.append(Paragraph("Signatures", heading_style))
-    signature_data = [
-        [Paragraph('<b>Auditor:</b>', normal_style), '_________________________', Paragraph('<b>Date:</b>', normal_style), '_________________________'],
-        [Paragraph('<b>Name:</b>', normal_style), '_________________________', Paragraph('<b>Title:</b>', normal_style), '_________________________'],
-        ['', '', '', ''],
-        [Paragraph('<b>Reviewed By:</b>', normal_style), '_________________________', Paragraph('<b>Date:</b>', normal_style), '_________________________'],
-        [Paragraph('<b>Approved By:</b>', normal_style), '_________________________', Paragraph('<b>Date:</b>', normal_style), '_________________________']
-    ]
-    
-    sig_table = Table(signature_data, colWidths=[1.5*inch, 2*inch, 1.5*inch, 2*inch])
-    sig_table.setStyle(TableStyle([
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6'))
-    ]))
-    story.append(sig_table)
-    
-    # Build PDF
-    logo_path = "logo@3x.png"
-    
-    def on_first_page(canvas, doc):
-        add_header_footer(canvas, doc, logo_path, classification)
-    
-    def on_later_pages(canvas, doc):
-        add_header_footer(canvas, doc, logo_path, classification)
-    
-    doc.build(story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
-    return filename
-
+        spec_text_display = spec_text[:57] + '...' if len(spec_text) > 60 else spec_text
+        spec_items.append(f"Spec {spec.get('spec_id', '')}: {spec_text_display}")
+    
+    return render_template('professional_audit_checklist', filename, {
+        'control_id': control_id,
+        'control_name': control_name,
+        'domain': domain,
+        'spec_items': spec_items
+    })
@@ -0,0 +1,379 @@
+"""
+Quality Checks
+Vectorized accuracy, consistency and validity checks driven by the schema
+analysis. Each frame (or chunk) adds exact per-column counts to an
+accumulator, so in-memory and chunked processing report the same metrics.
+Text checks run on a column's distinct values only.
+"""
+from collections import Counter
+import numpy as np
+import pandas as pd
+from column_name_classifier import ColumnNameClassifier, tokenize_name
+from type_inference import (
+    BOOLEAN_TOKENS, EMAIL_RE, IBAN_RE, PHONE_RE, SAUDI_NATIONAL_ID_RE,
+    iban_valid, luhn_valid
+)
+
+QUALITY_WEIGHTS = {
+    'completeness': 0.25,
+    'accuracy': 0.20,
+    'consistency': 0.15,
+    'uniqueness': 0.20,
+    'validity': 0.20
+}
+
+# Score of a dimension when no column in the data could be checked for it
+UNCHECKED_SCORE = 0.8
+
+# Types with a value-level validity test
+VALIDATED_TYPES = {'Numeric', 'DateTime', 'Boolean', 'Email', 'Phone', 'Saudi National ID', 'IBAN'}
+
+TEXT_FORMATS = {
+    'Email': EMAIL_RE,
+    'Phone': PHONE_RE,
+    'Saudi National ID': SAUDI_NATIONAL_ID_RE,
+    'IBAN': IBAN_RE
+}
+
+# Constraints checked on the text form of values
+TEXT_CONSTRAINTS = {'allowed_values', 'pattern', 'max_length'}
+
+# Plausible calendar range for dates; audit and birth dates must also not be in the future
+MIN_PLAUSIBLE_DATE = pd.Timestamp('1900-01-01')
+MAX_PLAUSIBLE_DATE = pd.Timestamp('2100-12-31')
+PAST_ONLY_TOKENS = {'birth', 'dob'}
+
+# Column name tokens whose values must be ordered (earlier <= later), e.g. start_date/end_date
+ORDERED_TOKEN_PAIRS = [
+    ('start', 'end'),
+    ('begin', 'end'),
+    ('from', 'to'),
+    ('created', 'updated'),
+    ('created', 'modified'),
+    ('issue', 'expiry'),
+    ('birth', 'death')
+]
+
+# Text columns with more distinct values are left out of the spelling-consistency check
+SPELLING_CHECK_MAX_DISTINCT = 1000
+
+_name_classifier = ColumnNameClassifier()
+
+def column_specs(schema_analysis):
+    """Expected type and declared constraints per column name (data dictionary fields take precedence)"""
+    schema_analysis = schema_analysis or {}
+    specs = {}
+    for col_info in schema_analysis.get('column_analysis', []):
+        specs[col_info['column_name']] = {'type': col_info.get('detected_type', 'Text'), 'constraints': []}
+    for field in schema_analysis.get('fields', []):
+        specs[field.get('field_name', '')] = {
+            'type': field.get('detected_type', 'Text'),
+            'constraints': field.get('constraints', [])
+        }
+    return specs
+
+def ordered_column_pairs(columns):
+    """(earlier, later) column pairs whose names differ only by an ordered token pair"""
+    by_tokens = {tokenize_name(column): column for column in columns}
+    pairs = []
+    for tokens, column in by_tokens.items():
+        for earlier, later in ORDERED_TOKEN_PAIRS:
+            if earlier in tokens:
+                partner = by_tokens.get(tuple(later if token == earlier else token for token in tokens))
+                if partner is not None:
+                    pairs.append((column, partner))
+    return pairs
+
+def as_text(values):
+    """Distinct values as stripped strings; integral floats lose their '.0' (IDs read as numbers)"""
+    values = pd.Series(values)
+    if pd.api.types.is_float_dtype(values):
+        floats = values.to_numpy(dtype=np.float64)
+        integral = np.isfinite(floats) & (floats == np.floor(floats)) & (np.abs(floats) < 2.0 ** 53)
+        text = values.astype(str)
+        text[integral] = floats[integral].astype(np.int64).astype(str)
+        return text
+    return values.astype(str).str.strip()
+
+def _expand(unique_mask, codes):
+    """Map a mask over distinct values back to rows; missing values (code -1) are False"""
+    return np.append(unique_mask, False)[codes]
+
+def _naive_datetimes(column):
+    if getattr(column.dt, 'tz', None) is not None:
+        column = column.dt.tz_convert('UTC').dt.tz_localize(None)
+    return column
+
+def _implausible_dates(values, past_only, now):
+    latest = now if past_only else MAX_PLAUSIBLE_DATE
+    return np.asarray(((values < MIN_PLAUSIBLE_DATE) | (values > latest)).fillna(False), dtype=bool)
+
+def _range_violations(numbers, constraints):
+    violations = np.zeros(len(numbers), dtype=bool)
+    with np.errstate(invalid='ignore'):
+        if 'min_value' in constraints:
+            violations |= numbers < constraints['min_value']
+        if 'max_value' in constraints:
+            violations |= numbers > constraints['max_value']
+    return violations
+
+def _check_text(text, expected, constraints, past_only, now, typed=True):
+    """Validity and accuracy of distinct values given as strings; returns (invalid, accuracy_checked, inaccurate)"""
+    invalid = np.zeros(len(text), dtype=bool)
+    accuracy_checked = np.zeros(len(text), dtype=bool)
+    inaccurate = np.zeros(len(text), dtype=bool)
+
+    if typed and expected in TEXT_FORMATS:
+        compact = text.str.replace(' ', '', regex=False).str.upper() if expected == 'IBAN' else text
+        matched = np.array(compact.str.fullmatch(TEXT_FORMATS[expected]).fillna(False), dtype=bool)
+        invalid |= ~matched
+        # Check digits: a well-formed ID or IBAN can still be wrong
+        if expected in ('Saudi National ID', 'IBAN') and matched.any():
+            accuracy_checked |= matched
+            checksum = luhn_valid if expected == 'Saudi National ID' else iban_valid
+            inaccurate[matched] = ~checksum(compact[matched].tolist())
+    elif typed and expected == 'Numeric':
+        numbers = pd.to_numeric(text.str.replace(',', '', regex=False), errors='coerce').to_numpy(dtype=np.float64)
+        invalid |= ~np.isfinite(numbers) | _range_violations(numbers, constraints)
+    elif typed and expected == 'DateTime':
+        dates = pd.to_datetime(text, errors='coerce', format='mixed')
+        parsed = np.asarray(dates.notna(), dtype=bool)
+        invalid |= ~parsed
+        accuracy_checked |= parsed
+        inaccurate |= parsed & _implausible_dates(dates, past_only, now)
+    elif typed and expected == 'Boolean':
+        invalid |= ~text.str.lower().isin(BOOLEAN_TOKENS).to_numpy()
+
+    if 'allowed_values' in constraints:
+        invalid |= ~text.isin(set(constraints['allowed_values'])).to_numpy()
+    if 'pattern' in constraints:
+        invalid |= ~np.array(text.str.fullmatch(constraints['pattern']).fillna(False), dtype=bool)
+    if 'max_length' in constraints:
+        invalid |= (text.str.len() > constraints['max_length']).to_numpy()
+    return invalid, accuracy_checked, inaccurate
+
+def check_column(column, spec, past_only=False, now=None):
+    """Row masks (validity_checked, invalid, accuracy_checked, inaccurate) for one column"""
+    now = now if now is not None else pd.Timestamp.now()
+    expected = spec.get('type', 'Text')
+    constraints = {constraint['type']: constraint['value'] for constraint in spec.get('constraints', [])}
+    present = np.array(column.notna(), dtype=bool)
+    no_rows = np.zeros(len(column), dtype=bool)
+    validated = expected in VALIDATED_TYPES or bool(constraints)
+    invalid = no_rows.copy()
+    accuracy_checked = no_rows.copy()
+    inaccurate = no_rows.copy()
+
+    if pd.api.types.is_datetime64_any_dtype(column):
+        accuracy_checked = present
+        inaccurate = present & _implausible_dates(_naive_datetimes(column), past_only, now)
+        needs_text = False
+    elif pd.api.types.is_bool_dtype(column):
+        needs_text = bool(TEXT_CONSTRAINTS & constraints.keys())
+    elif pd.api.types.is_numeric_dtype(column):
+        numbers = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        if validated:
+            invalid |= present & (~np.isfinite(numbers) | _range_violations(numbers, constraints))
+        needs_text = expected in TEXT_FORMATS or bool(TEXT_CONSTRAINTS & constraints.keys())
+    else:
+        needs_text = validated
+
+    if needs_text:
+        codes, uniques = pd.factorize(column)
+        # Numbers already passed the Numeric test above
+        typed = not (expected == 'Numeric' and pd.api.types.is_numeric_dtype(column))
+        unique_masks = _check_text(as_text(uniques), expected, constraints, past_only, now, typed=typed)
+        invalid |= _expand(unique_masks[0], codes)
+        accuracy_checked |= _expand(unique_masks[1], codes)
+        inaccurate |= _expand(unique_masks[2], codes)
+
+    return (present if validated else no_rows), invalid, accuracy_checked, inaccurate
+
+def _spelling_key(values):
+    """Normalized spelling: case-folded, trimmed, single-spaced"""
+    return values.str.strip().str.casefold().str.replace(r'\s+', ' ', regex=True)
+
+class QualityAccumulator:
+    """Exact, chunk-additive counts behind the quality metrics of one dataset
+
+    update() adds a frame (or chunk); metrics() scores everything seen so far.
+    """
+
+    def __init__(self, schema_analysis=None):
+        self.specs = column_specs(schema_analysis)
+        self.now = pd.Timestamp.now()
+        self.rows = 0
+        self.cells = 0
+        self.non_null_cells = 0
+        self.duplicate_rows = 0
+        self.columns = {}
+        self.spellings = {}
+        self.pairs = {}
+
+    def _new_counts(self, name):
+        return {
+            'type': self.specs.get(name, {}).get('type', 'Text'),
+            'validity_checked': 0,
+            'invalid': 0,
+            'accuracy_checked': 0,
+            'inaccurate': 0,
+            'consistency_checked': 0,
+            'inconsistent': 0
+        }
+
+    def update(self, df, duplicates, conversion_failures=None, violations=None, row_offset=0):
+        """Add a frame's counts; conversion_failures maps columns to values lost to type conversion
+        
+        With a ViolationCollector, invalid and inaccurate values are recorded
+        row by row (row_offset is the frame's first row in the dataset).
+        """
+        self.rows += len(df)
+        self.cells += len(df) * len(df.columns)
+        self.duplicate_rows += int(duplicates.sum())
+
+        names = [str(name) for name in df.columns]
+        for position, name in enumerate(names):
+            column = df.iloc[:, position]
+            # Counted column by column, so no frame-sized boolean matrix is allocated
+            self.non_null_cells += int(column.count())
+
+            spec = self.specs.get(name, {})
+            past_only = bool(PAST_ONLY_TOKENS & set(tokenize_name(name))) or _name_classifier.is_audit_field(name)
+            checked, invalid, accuracy_checked, inaccurate = check_column(column, spec, past_only, self.now)
+            failures = (conversion_failures or {}).get(name, 0)
+            if checked.any() or accuracy_checked.any() or failures:
+                counts = self.columns.setdefault(name, self._new_counts(name))
+                counts['validity_checked'] += int(checked.sum()) + failures
+                counts['invalid'] += int(invalid.sum()) + failures
+                counts['accuracy_checked'] += int(accuracy_checked.sum())
+                counts['inaccurate'] += int(inaccurate.sum())
+                if violations is not None:
+                    violations.record('invalid_format', invalid, row_offset, column=name, values=column)
+                    violations.record('inaccurate_value', inaccurate, row_offset, column=name, values=column)
+
+            if spec.get('type', 'Text') in ('Text', 'Categorical') and not pd.api.types.is_numeric_dtype(column) \
+                    and not pd.api.types.is_datetime64_any_dtype(column):
+                self._count_spellings(name, column)
+
+        for earlier, later in ordered_column_pairs(names):
+            self._count_ordering(earlier, later, df.iloc[:, names.index(earlier)], df.iloc[:, names.index(later)])
+
+    def merge(self, other):
+        """Add another accumulator's counts (e.g. a new batch of the same dataset)"""
+        self.rows += other.rows
+        self.cells += other.cells
+        self.non_null_cells += other.non_null_cells
+        self.duplicate_rows += other.duplicate_rows
+        for name, counts in other.columns.items():
+            merged = self.columns.setdefault(name, self._new_counts(name))
+            for key, value in counts.items():
+                if key != 'type':
+                    merged[key] += value
+        for name, spellings in other.spellings.items():
+            if name not in self.spellings:
+                self.spellings[name] = Counter(spellings) if spellings is not None else None
+            elif self.spellings[name] is not None:
+                if spellings is None:
+                    self.spellings[name] = None
+                else:
+                    self.spellings[name].update(spellings)
+                    if len(self.spellings[name]) > SPELLING_CHECK_MAX_DISTINCT:
+                        self.spellings[name] = None
+        for key, pair in other.pairs.items():
+            merged = self.pairs.setdefault(key, {'checked': 0, 'violations': 0})
+            merged['checked'] += pair['checked']
+            merged['violations'] += pair['violations']
+        return self
+
+    def _count_spellings(self, name, column):
+        spellings = self.spellings.get(name, Counter())
+        if spellings is None:
+            return
+        spellings.update(column.dropna().astype(str).value_counts().to_dict())
+        # Kept for low-cardinality columns only; the check is decided on the whole dataset
+        self.spellings[name] = spellings if len(spellings) <= SPELLING_CHECK_MAX_DISTINCT else None
+
+    def _count_ordering(self, earlier_name, later_name, earlier, later):
+        kinds = {pd.api.types.is_datetime64_any_dtype(earlier), pd.api.types.is_datetime64_any_dtype(later)}
+        if len(kinds) > 1:
+            return
+        if not kinds.pop():
+            if not (pd.api.types.is_numeric_dtype(earlier) and pd.api.types.is_numeric_dtype(later)):
+                return
+        else:
+            earlier, later = _naive_datetimes(earlier), _naive_datetimes(later)
+        both = np.asarray(earlier.notna() & later.notna(), dtype=bool)
+        out_of_order = both & np.asarray((earlier > later).fillna(False), dtype=bool)
+        pair = self.pairs.setdefault(f'{earlier_name} <= {later_name}', {'checked': 0, 'violations': 0})
+        pair['checked'] += int(both.sum())
+        pair['violations'] += int(out_of_order.sum())
+
+    def _spelling_counts(self):
+        """Per column (checked, inconsistent): values not written like the most common spelling of their normalized form"""
+        results = {}
+        for name, spellings in self.spellings.items():
+            if not spellings:
+                continue
+            counts = pd.Series(spellings)
+            keys = _spelling_key(pd.Series(counts.index, index=counts.index))
+            canonical = counts.groupby(keys.to_numpy()).max()
+            results[name] = (int(counts.sum()), int(counts.groupby(keys.to_numpy()).sum().sub(canonical).sum()))
+        return results
+
+    def column_report(self):
+        """Per-column check counts and rates"""
+        report = {name: dict(counts) for name, counts in self.columns.items()}
+        for name, (checked, inconsistent) in self._spelling_counts().items():
+            counts = report.setdefault(name, self._new_counts(name))
+            counts['consistency_checked'] += checked
+            counts['inconsistent'] += inconsistent
+        for counts in report.values():
+            for dimension, checked_key, failed_key in (
+                ('validity', 'validity_checked', 'invalid'),
+                ('accuracy', 'accuracy_checked', 'inaccurate'),
+                ('consistency', 'consistency_checked', 'inconsistent')
+            ):
+                counts[dimension] = 1 - counts[failed_key] / counts[checked_key] if counts[checked_key] else None
+        return report
+
+    def metrics(self):
+        """Quality metrics (0-1) with the overall weighted score"""
+        metrics = {
+            'completeness': 0.0,
+            'accuracy': UNCHECKED_SCORE,
+            'consistency': UNCHECKED_SCORE,
+            'uniqueness': 0.0,
+            'validity': UNCHECKED_SCORE,
+            'overall_score': 0.0
+        }
+
+        if self.cells == 0:
+            return metrics
+
+        # Completeness: percentage of non-null values
+        metrics['completeness'] = self.non_null_cells / self.cells
+
+        # Uniqueness: percentage of unique rows
+        metrics['uniqueness'] = (self.rows - self.duplicate_rows) / self.rows
+
+        # Validity, accuracy and consistency: share of checked values passing, pooled over columns
+        report = self.column_report()
+        consistency_checked = sum(counts['consistency_checked'] for counts in report.values())
+        consistency_failed = sum(counts['inconsistent'] for counts in report.values())
+        consistency_checked += sum(pair['checked'] for pair in self.pairs.values())
+        consistency_failed += sum(pair['violations'] for pair in self.pairs.values())
+        for dimension, checked, failed in (
+            ('validity', sum(c['validity_checked'] for c in report.values()), sum(c['invalid'] for c in report.values())),
+            ('accuracy', sum(c['accuracy_checked'] for c in report.values()), sum(c['inaccurate'] for c in report.values())),
+            ('consistency', consistency_checked, consistency_failed)
+        ):
+            if checked:
+                metrics[dimension] = 1 - failed / checked
+
+        # Calculate overall score (weighted average)
+        metrics['overall_score'] = sum(
+            metrics[key] * QUALITY_WEIGHTS[key]
+            for key in QUALITY_WEIGHTS.keys()
+        )
+
+        return metrics
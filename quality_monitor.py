@@ -0,0 +1,346 @@
+"""
+Quality Monitor
+Incremental data quality monitoring of datasets loaded in batches (e.g.
+daily appends). Each dataset keeps mergeable state: exact quality and
+business-rule counts, the hashes of every row loaded and column sketches, so
+a new batch is scored and compared with the history without rescanning it.
+Every batch adds a run to the dataset's metric time series together with the
+drift flags it raised.
+"""
+import hashlib
+import json
+import os
+import pickle
+import re
+import shutil
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from business_rules import RuleAccumulator, RuleSet
+from column_sketches import ColumnSketch
+from quality_checks import QualityAccumulator
+from smart_data_processor import HashedRowSet
+
+# Directory of the saved monitor state (per dataset: a pickle, a JSON time series and a directory of row hashes)
+DEFAULT_STATE_DIR = 'monitoring'
+
+# Bumped whenever the saved state layout changes; state of another version is rejected
+STATE_FORMAT_VERSION = 3
+
+# Drift is flagged when a batch is worse than the history by more than these (0-1 shares)
+DEFAULT_DRIFT_THRESHOLDS = {
+    'completeness_drop': 0.05,
+    'duplicate_rate': 0.01,
+    'validity_drop': 0.05,
+    'rule_pass_rate_drop': 0.05
+}
+
+DRIFT_CHECKS = {
+    'completeness_drop': 'Share of non-empty values fell',
+    'new_duplicates': 'Rows already loaded before (or repeated within the batch)',
+    'validity_drop': 'Fewer values conform to the schema type',
+    'rule_pass_rate_drop': 'Business rule pass rate fell',
+    'schema_change': 'Columns added or missing compared with earlier batches'
+}
+
+# Metrics of the time series, in display order
+SERIES_METRICS = ['completeness', 'validity', 'accuracy', 'consistency', 'uniqueness', 'business_rules', 'overall_score']
+
+def _share(part, whole):
+    return part / whole if whole else None
+
+class MonitorBatch:
+    """Counts of one incoming batch, filled row block by row block
+
+    Rows are checked against the dataset's history but only added to it when
+    the monitor commits the batch, so a failed load leaves the state intact.
+    """
+
+    def __init__(self, monitor):
+        self.started = time.perf_counter()
+        self.history_rows = monitor.seen_rows
+        self.quality = QualityAccumulator(monitor.schema_analysis)
+        self.rules = RuleAccumulator(RuleSet(monitor.business_rules)) if monitor.business_rules else None
+        self.new_rows = HashedRowSet()
+        self.sketches = {}
+
+    def update(self, df, row_hashes, conversion_failures=None):
+        """Add a converted row block with its row hashes (see SmartDataProcessor._row_hashes)"""
+        duplicates = self.history_rows.contains(row_hashes)
+        # Rows seen before in this batch are duplicates too; new rows are remembered for the commit
+        first_seen = self.new_rows.add(row_hashes[~duplicates])
+        duplicates[~duplicates] = ~first_seen
+        self.quality.update(df, duplicates, conversion_failures)
+        if self.rules:
+            self.rules.update(df)
+        for position, name in enumerate(df.columns):
+            name = str(name)
+            self.sketches.setdefault(name, ColumnSketch(name)).update(df.iloc[:, position])
+
+class DatasetMonitor:
+    """Quality state and metric time series of one dataset
+
+    start_batch() opens a batch, commit() scores it against the history,
+    flags drift and folds it into the state.
+    """
+
+    def __init__(self, dataset, schema_analysis=None, business_rules=None, thresholds=None):
+        if business_rules:
+            RuleSet(business_rules)  # Raises ValueError for invalid rules before any data is read
+        self.dataset = dataset
+        self.schema_analysis = schema_analysis
+        self.business_rules = list(business_rules or [])
+        self.thresholds = dict(DEFAULT_DRIFT_THRESHOLDS, **(thresholds or {}))
+        self.quality = QualityAccumulator(schema_analysis)
+        self.rule_counts = {}
+        self.seen_rows = HashedRowSet()
+        self.unsaved_rows = {}  # Run number -> hashes of the rows it added, until the store writes them
+        self.sketches = {}
+        self.runs = []
+
+    @property
+    def total_rows(self):
+        return self.quality.rows
+
+    def start_batch(self):
+        return MonitorBatch(self)
+
+    def commit(self, batch, source=None):
+        """Score a batch against the history, flag drift, add it to the state and return the run"""
+        metrics = batch.quality.metrics()
+        column_report = batch.quality.column_report()
+        rule_rates = {}
+        if batch.rules:
+            for result in batch.rules.report():
+                if result['pass_rate'] is not None:
+                    rule_rates[result['rule_id']] = result['pass_rate']
+            if batch.rules.pass_rate() is not None:
+                metrics['business_rules'] = batch.rules.pass_rate()
+
+        drift = self._drift(batch, metrics, column_report, rule_rates)
+
+        # Fold the batch into the state
+        self.quality.merge(batch.quality)
+        self.seen_rows.merge(batch.new_rows)
+        for name, sketch in batch.sketches.items():
+            if name in self.sketches:
+                self.sketches[name].merge(sketch)
+            else:
+                self.sketches[name] = sketch
+        if batch.rules:
+            for result in batch.rules.report():
+                counts = self.rule_counts.setdefault(result['rule_id'], {'name': result['name'], 'applicable': 0, 'failed': 0})
+                counts['applicable'] += result['applicable']
+                counts['failed'] += result['failed']
+
+        run = {
+            'run': len(self.runs) + 1,
+            'timestamp': datetime.now().isoformat(),
+            'source': source,
+            'rows': batch.quality.rows,
+            'total_rows': self.total_rows,
+            'new_duplicate_rows': batch.quality.duplicate_rows,
+            'duplicate_rate': _share(batch.quality.duplicate_rows, batch.quality.rows) or 0.0,
+            'metrics': metrics,
+            'cumulative_metrics': self.metrics(),
+            'columns': {
+                name: {
+                    'completeness': _share(sketch.non_null_count, sketch.total_count),
+                    'validity': column_report.get(name, {}).get('validity'),
+                    'distinct_count': sketch.distinct_count
+                }
+                for name, sketch in batch.sketches.items()
+            },
+            'rules': rule_rates,
+            'drift': drift,
+            'duration_s': time.perf_counter() - batch.started
+        }
+        self.runs.append(run)
+        self.unsaved_rows[run['run']] = batch.new_rows
+        return run
+
+    def _flag(self, check, column, baseline, current, threshold):
+        subject = f"'{column}'" if column else 'the batch'
+        return {
+            'check': check,
+            'column': column,
+            'baseline': baseline,
+            'current': current,
+            'threshold': threshold,
+            'message': f"{DRIFT_CHECKS[check]} in {subject}: {baseline:.1%} -> {current:.1%}"
+        }
+
+    def _drift(self, batch, metrics, column_report, rule_rates):
+        """Drift flags of a batch against the history (the first batch only sets the baseline, except for duplicates)"""
+        thresholds = self.thresholds
+        flags = []
+        duplicate_rate = _share(batch.quality.duplicate_rows, batch.quality.rows) or 0.0
+        if duplicate_rate > thresholds['duplicate_rate']:
+            flag = self._flag('new_duplicates', None, 0.0, duplicate_rate, thresholds['duplicate_rate'])
+            flag['message'] = f"{DRIFT_CHECKS['new_duplicates']}: {batch.quality.duplicate_rows:,} rows ({duplicate_rate:.1%})"
+            flags.append(flag)
+        if not self.runs:
+            return flags
+
+        history = self.metrics()
+        if history['completeness'] - metrics['completeness'] > thresholds['completeness_drop']:
+            flags.append(self._flag('completeness_drop', None, history['completeness'], metrics['completeness'], thresholds['completeness_drop']))
+        for name, sketch in batch.sketches.items():
+            known = self.sketches.get(name)
+            if known is None or not known.total_count or not sketch.total_count:
+                continue
+            baseline = known.non_null_count / known.total_count
+            current = sketch.non_null_count / sketch.total_count
+            if baseline - current > thresholds['completeness_drop']:
+                flags.append(self._flag('completeness_drop', name, baseline, current, thresholds['completeness_drop']))
+
+        history_report = self.quality.column_report()
+        for name, counts in column_report.items():
+            baseline, current = history_report.get(name, {}).get('validity'), counts.get('validity')
+            if baseline is not None and current is not None and baseline - current > thresholds['validity_drop']:
+                flags.append(self._flag('validity_drop', name, baseline, current, thresholds['validity_drop']))
+
+        for rule_id, current in rule_rates.items():
+            counts = self.rule_counts.get(rule_id)
+            if counts and counts['applicable']:
+                baseline = 1 - counts['failed'] / counts['applicable']
+                if baseline - current > thresholds['rule_pass_rate_drop']:
+                    flags.append(self._flag('rule_pass_rate_drop', rule_id, baseline, current, thresholds['rule_pass_rate_drop']))
+
+        added = [name for name in batch.sketches if name not in self.sketches]
+        missing = [name for name in self.sketches if name not in batch.sketches]
+        if added or missing:
+            flags.append({
+                'check': 'schema_change',
+                'column': None,
+                'added': added,
+                'missing': missing,
+                'message': f"{DRIFT_CHECKS['schema_change']}: added {added or 'none'}, missing {missing or 'none'}"
+            })
+        return flags
+
+    def metrics(self):
+        """Quality metrics of every row loaded so far"""
+        metrics = self.quality.metrics()
+        rated = [counts for counts in self.rule_counts.values() if counts['applicable']]
+        if rated:
+            # Pooled over rules (per-rule weights apply within a batch only)
+            metrics['business_rules'] = 1 - sum(c['failed'] for c in rated) / sum(c['applicable'] for c in rated)
+        return metrics
+
+    def column_summary(self):
+        """Per-column completeness, distinct count and quantiles of every row loaded so far"""
+        summary = []
+        for name, sketch in self.sketches.items():
+            sketch_summary = sketch.summary(top_n=5)
+            summary.append({
+                'column': name,
+                'completeness': _share(sketch.non_null_count, sketch.total_count),
+                'distinct_count': sketch_summary['distinct_count'],
+                'distinct_is_exact': sketch_summary['distinct_is_exact'],
+                'median': (sketch_summary['quantiles'] or {}).get('p50')
+            })
+        return summary
+
+    def history_frame(self):
+        """The metric time series: one row per run"""
+        rows = []
+        for run in self.runs:
+            row = {
+                'run': run['run'],
+                'timestamp': run['timestamp'],
+                'source': run['source'],
+                'rows': run['rows'],
+                'duplicate_rate': run['duplicate_rate'],
+                'drift_flags': len(run['drift'])
+            }
+            row.update({metric: run['metrics'].get(metric) for metric in SERIES_METRICS})
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+class MonitorStore:
+    """Monitor state saved per dataset
+
+    The pickle holds the state without its row hashes; its size is bounded by
+    the columns and rules, plus a small record per run. The row hashes (8 bytes
+    per distinct row, the part that grows with the history) are written once,
+    as one append-only file per run, so a save only writes the new runs' hashes.
+    A JSON copy of the time series is kept alongside.
+    """
+
+    def __init__(self, directory=DEFAULT_STATE_DIR):
+        self.directory = directory
+
+    def _stem(self, dataset):
+        # Readable and collision-free file name for any dataset name
+        readable = re.sub(r'[^\w.-]+', '_', dataset).strip('_')[:60] or 'dataset'
+        return os.path.join(self.directory, f"{readable}_{hashlib.sha256(dataset.encode('utf-8')).hexdigest()[:10]}")
+
+    def _hash_path(self, stem, run_number):
+        return os.path.join(stem + '.hashes', f'run_{run_number:06d}.npy')
+
+    def load(self, dataset):
+        """The saved monitor of a dataset, or None; raises ValueError for state of another format version"""
+        stem = self._stem(dataset)
+        if not os.path.exists(stem + '.pkl'):
+            return None
+        with open(stem + '.pkl', 'rb') as f:
+            saved = pickle.load(f)
+        version = saved.get('format_version') if isinstance(saved, dict) else None
+        if version != STATE_FORMAT_VERSION:
+            raise ValueError(
+                f"Monitoring state of '{dataset}' has format version {version}, expected {STATE_FORMAT_VERSION}; "
+                f"delete it to start the dataset again"
+            )
+        monitor = DatasetMonitor.__new__(DatasetMonitor)
+        monitor.__dict__.update(saved['state'])
+        monitor.seen_rows = HashedRowSet()
+        monitor.unsaved_rows = {}
+        # Hash files of runs missing from the state (a save interrupted before the pickle) are ignored
+        for run in monitor.runs:
+            part = HashedRowSet()
+            part.levels = [np.load(self._hash_path(stem, run['run']))]
+            monitor.seen_rows.merge(part)
+        return monitor
+
+    def save(self, monitor):
+        stem = self._stem(monitor.dataset)
+        os.makedirs(stem + '.hashes', exist_ok=True)
+        # Written to temporary files first, so a crash never leaves a half-written state
+        for run_number, rows in sorted(monitor.unsaved_rows.items()):
+            path = self._hash_path(stem, run_number)
+            hashes = np.sort(np.concatenate(rows.levels)) if rows.levels else np.array([], dtype=np.uint64)
+            with open(path + '.tmp', 'wb') as f:
+                np.save(f, hashes)
+            os.replace(path + '.tmp', path)
+        state = {name: value for name, value in monitor.__dict__.items() if name not in ('seen_rows', 'unsaved_rows')}
+        for suffix, payload in (
+            ('.pkl', pickle.dumps({'format_version': STATE_FORMAT_VERSION, 'state': state}, protocol=pickle.HIGHEST_PROTOCOL)),
+            ('.json', json.dumps({'dataset': monitor.dataset, 'format_version': STATE_FORMAT_VERSION, 'runs': monitor.runs}, default=str, indent=2).encode('utf-8'))
+        ):
+            with open(stem + suffix + '.tmp', 'wb') as f:
+                f.write(payload)
+            os.replace(stem + suffix + '.tmp', stem + suffix)
+        monitor.unsaved_rows = {}
+
+    def delete(self, dataset):
+        stem = self._stem(dataset)
+        for suffix in ('.pkl', '.json'):
+            if os.path.exists(stem + suffix):
+                os.remove(stem + suffix)
+        shutil.rmtree(stem + '.hashes', ignore_errors=True)
+
+    def datasets(self):
+        """Names of the monitored datasets"""
+        if not os.path.isdir(self.directory):
+            return []
+        names = []
+        for file_name in sorted(os.listdir(self.directory)):
+            if file_name.endswith('.json'):
+                try:
+                    with open(os.path.join(self.directory, file_name), encoding='utf-8') as f:
+                        names.append(json.load(f)['dataset'])
+                except Exception as e:
+                    print(f"Warning: Could not read monitor state {file_name}: {e}")
+        return names
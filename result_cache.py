@@ -0,0 +1,100 @@
+"""
+Result Cache
+Content-addressed, bounded LRU cache for schema analysis and data processing
+results. Entries are keyed by the SHA-256 of the uploaded file plus the
+producer's version and settings, so the same file uploaded again (by any
+session served by this process) is answered without recomputation.
+"""
+import hashlib
+import json
+import pickle
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_MB = 1024
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def file_sha256(file_path):
+    """SHA-256 hex digest of a file, read in 1 MB chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def make_cache_key(namespace, version, content_sha256, **params):
+    """Cache key for one producer (namespace + version) run on one file with the given settings"""
+    settings = json.dumps(params, sort_keys=True, default=str)
+    return f"{namespace}:{version}:{content_sha256}:{hashlib.sha256(settings.encode('utf-8')).hexdigest()}"
+
+class ResultCache:
+    """Thread-safe LRU cache bounded by entry count and total pickled size
+
+    Values are stored pickled, so callers always get an independent copy and
+    can modify results (as the UI does) without corrupting the cache.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_mb=DEFAULT_MAX_MB):
+        self.max_entries = max_entries
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return a copy of the cached value, or None"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(payload)
+
+    def put(self, key, value):
+        """Store a value; least recently used entries are evicted to stay within bounds"""
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Warning: Could not cache result: {e}")
+            return
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            self._entries[key] = payload
+            self._size += len(payload)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_mb': self._size / (1024 * 1024),
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+def get_result_cache():
+    """Process-wide cache shared by every session of the app"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResultCache()
+        return _shared_cache
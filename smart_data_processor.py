@@ -5,75 +5,456 @@ Processes data according to schema requirements and improves data quality
 
 import pandas as pd
 import numpy as np
+import hashlib
+import json
+import os
+import shutil
+import tempfile
 from datetime import datetime
+from result_cache import file_sha256, get_result_cache, make_cache_key
+from data_readers import estimate_table_memory, iter_table_chunks, read_table, schema_dtypes
+from quality_checks import QualityAccumulator
+from business_rules import RuleAccumulator, RuleSet
+from violations import ViolationCollector
+from near_duplicates import find_near_duplicates, summarize_clusters
+from dtype_optimizer import optimize_dtypes
+from stage_metrics import StageProfiler, peak_rss_bytes
+from type_inference import BOOLEAN_TOKENS
+
+# Bump whenever processing logic or output changes so cached results are not reused
+PROCESSOR_VERSION = '1.8'
+
+# Files whose estimated in-memory size exceeds this budget are processed in chunks
+DEFAULT_MEMORY_BUDGET_MB = 512
+
+# Cleaned rows kept in memory for the preview in chunked mode
+CHUNKED_PREVIEW_ROWS = 1000
+
+class HashedRowSet:
+    """Exact set of 64-bit row hashes, kept as a few sorted arrays (log-structured merge)
+    
+    Costs 8 bytes per distinct row; membership is a binary search per level and
+    there are O(log n) levels, so tens of millions of rows stay tractable.
+    """
+    
+    def __init__(self):
+        self.levels = []
+    
+    def __len__(self):
+        return sum(len(level) for level in self.levels)
+    
+    @property
+    def nbytes(self):
+        return sum(level.nbytes for level in self.levels)
+    
+    def add(self, hashes):
+        """Insert a chunk of row hashes; return the mask of rows not seen before (first occurrence wins)"""
+        unique, first_index = np.unique(hashes, return_index=True)
+        new = ~self.contains(unique)
+        mask = np.zeros(len(hashes), dtype=bool)
+        mask[first_index[new]] = True
+        self._push(unique[new])
+        return mask
+
+    def contains(self, hashes):
+        """Mask of the hashes already in the set (the set is not changed)"""
+        seen = np.zeros(len(hashes), dtype=bool)
+        for level in self.levels:
+            positions = np.minimum(np.searchsorted(level, hashes), len(level) - 1)
+            seen |= level[positions] == hashes
+        return seen
+
+    def merge(self, other):
+        """Add the hashes of another set that shares none with this one"""
+        for level in other.levels:
+            self._push(level)
+        return self
+
+    def _push(self, values):
+        if len(values) == 0:
+            return
+        self.levels.append(values)
+        # Merge neighbours of similar size; levels are disjoint, so a sort of the two runs suffices
+        while len(self.levels) > 1 and len(self.levels[-2]) <= 2 * len(self.levels[-1]):
+            top = self.levels.pop()
+            merged = np.concatenate([self.levels.pop(), top])
+            merged.sort(kind='stable')
+            self.levels.append(merged)
+
+class MemoryTracker:
+    """Records the working set of each pipeline stage: the owned frame plus stage-specific buffers"""
+    
+    def __init__(self):
+        self.stages = []
+    
+    def checkpoint(self, stage, df, extra_bytes=0):
+        frame_bytes = int(df.memory_usage(index=True, deep=False).sum())
+        self.stages.append({
+            'stage': stage,
+            'frame_mb': frame_bytes / (1024 * 1024),
+            'working_set_mb': (frame_bytes + extra_bytes) / (1024 * 1024)
+        })
+    
+    def report(self):
+        report = {
+            'stages': self.stages,
+            'peak_working_set_mb': max((stage['working_set_mb'] for stage in self.stages), default=0.0)
+        }
+        peak_rss = peak_rss_bytes()
+        if peak_rss is not None:  # Not available on Windows
+            report['peak_rss_mb'] = peak_rss / (1024 * 1024)
+        return report
 
 class SmartDataProcessor:
     """Smart Data Processor for NDMO Compliance"""
     
-    def __init__(self):
+    def __init__(self, use_cache=True, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB):
         self.processed_data = None
         self.quality_metrics = {}
         self.processing_log = []
+        self.profiler = StageProfiler()
+        self.temp_files = []
+        self.memory_budget_mb = memory_budget_mb
+        # Results are shared across sessions through the process-wide result cache
+        self.result_cache = get_result_cache() if use_cache else None
+    
+    def process_data(self, data_file_path, schema_analysis, output_path=None, chunked=None, business_rules=None, export_violations=False,
+                     blocking_columns=None):
+        """Process data file according to schema analysis
+        
+        A file already processed against the same schema is answered from the cache.
+        Files estimated to exceed the memory budget (or any file, with chunked=True)
+        are processed out of core: cleaned rows are written to output_path (a
+        temporary CSV by default) and only a preview is kept in memory.
+        business_rules is a list of declarative rules (see business_rules.py).
+        Violating rows are counted and sampled per check; with export_violations
+        every violation is also written to a CSV (result['violations_path']).
+        Near-duplicate records are clustered in memory mode only; candidates
+        must agree on blocking_columns when given.
+        """
+        rule_set = None
+        if business_rules:
+            try:
+                rule_set = RuleSet(business_rules)
+            except ValueError as e:
+                return {'success': False, 'error': f'Invalid business rules: {str(e)}', 'processing_log': []}
+        
+        if chunked is None:
+            chunked = self._exceeds_memory_budget(data_file_path)
+        if chunked and not isinstance(data_file_path, pd.DataFrame):
+            # Not cached: the result refers to an output file the caller owns
+            return self._process_data_chunked(data_file_path, schema_analysis, output_path, rule_set, export_violations)
+        
+        cache_key = self._cache_key(data_file_path, schema_analysis, business_rules, export_violations, blocking_columns)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None and self._claim_cached_files(cached):
+                cached['from_cache'] = True
+                self.processed_data = cached['processed_data']
+                self.quality_metrics = cached['quality_metrics']
+                self.processing_log = cached['processing_log']
+                return cached
+        
+        result = self._process_data_uncached(data_file_path, schema_analysis, rule_set, export_violations, blocking_columns)
+        if cache_key is not None and result.get('success'):
+            self.result_cache.put(cache_key, result)
+        return result
+    
+    def _claim_cached_files(self, cached):
+        """Give a cached result its own copy of the violations export; False if the export is gone
+        
+        Every result owns (and its holder deletes) its files, so results served
+        from the cache never share one. A cached entry whose export was already
+        deleted is recomputed.
+        """
+        cached['temp_files'] = []
+        violations_path = cached.get('violations_path')
+        if not violations_path:
+            return True
+        if not os.path.exists(violations_path):
+            return False
+        self.temp_files = []
+        copy_path = self._temp_csv_path('violations_')
+        shutil.copyfile(violations_path, copy_path)
+        cached['violations_path'] = copy_path
+        cached['temp_files'] = [copy_path]
+        return True
+    
+    def _exceeds_memory_budget(self, data_file_path):
+        if isinstance(data_file_path, pd.DataFrame):
+            return False
+        try:
+            return estimate_table_memory(data_file_path) > self.memory_budget_mb * 1024 * 1024
+        except Exception:
+            return False
+    
+    def _cache_key(self, data_file_path, schema_analysis, business_rules=None, export_violations=False, blocking_columns=None):
+        """Key on the data file's content and the schema analysis; DataFrame inputs are not cached"""
+        if self.result_cache is None or isinstance(data_file_path, pd.DataFrame):
+            return None
+        try:
+            content_sha256 = file_sha256(data_file_path)
+        except Exception:
+            return None
+        # Cache lookups of the same schema must not depend on when it was analyzed
+        schema = {key: value for key, value in (schema_analysis or {}).items() if key not in ('timestamp', 'from_cache', 'change_report')}
+        schema_json = json.dumps(schema, sort_keys=True, default=str)
+        rules_json = json.dumps(business_rules or [], sort_keys=True, default=str)
+        return make_cache_key(
+            'data_processing', PROCESSOR_VERSION, content_sha256,
+            schema_sha256=hashlib.sha256(schema_json.encode('utf-8')).hexdigest(),
+            rules_sha256=hashlib.sha256(rules_json.encode('utf-8')).hexdigest(),
+            export_violations=bool(export_violations),
+            blocking_columns=','.join(map(str, blocking_columns or []))
+        )
     
-    def process_data(self, data_file_path, schema_analysis):
-        """Process data file according to schema analysis"""
+    def _process_data_uncached(self, data_file_path, schema_analysis, rule_set=None, export_violations=False, blocking_columns=None):
         try:
-            # Read data file
+            self.processing_log = []
+            self.profiler = StageProfiler()
+            self.temp_files = []
+            memory = MemoryTracker()
+            violations = ViolationCollector(self._temp_csv_path('violations_') if export_violations else None)
+            
+            # Step 1: Load. The pipeline owns this frame and mutates it in place;
+            # a caller's DataFrame is copied once so it is never modified.
+            self._log("Starting data processing...")
+            self._step('load', "Step 1: Loading data file...")
             if not isinstance(data_file_path, pd.DataFrame):
-                df = pd.read_excel(data_file_path)
+                # Read data file (Excel, CSV/TSV or Parquet, detected from its content)
+                df = read_table(data_file_path, dtype=schema_dtypes(schema_analysis))
             else:
                 df = data_file_path.copy()
-            
-            # Initialize processing log
-            self.processing_log = []
-            self._log("Starting data processing...")
-            
-            # Step 1: Load and validate
-            self._log("Step 1: Loading data file...")
-            df_processed = df.copy()
+            self.profiler.count(*df.shape)
+            memory.checkpoint('load', df)
             
             # Step 2: Schema validation
-            self._log("Step 2: Validating against schema...")
-            validation_results = self._validate_against_schema(df_processed, schema_analysis)
+            self._step('validate', "Step 2: Validating against schema...", df)
+            validation_results = self._validate_against_schema(df, schema_analysis)
             
             # Step 3: Data type conversion
-            self._log("Step 3: Converting data types...")
-            df_processed = self._convert_data_types(df_processed, schema_analysis)
+            self._step('convert', "Step 3: Converting data types...", df)
+            conversion_failures = self._convert_data_types(df, schema_analysis, violations)
+            memory.checkpoint('convert', df)
             
-            # Step 4: Quality analysis
-            self._log("Step 4: Analyzing data quality...")
-            quality_metrics = self._analyze_quality(df_processed)
+            # Step 4: Quality analysis. One row-hash pass serves duplicate
+            # detection and both uniqueness measurements.
+            self._step('analyze', "Step 4: Analyzing data quality...", df)
+            row_hashes = self._row_hashes(df)
+            duplicates = pd.Series(row_hashes).duplicated().to_numpy()
+            initial_quality, initial_checks = self._analyze_quality(df, duplicates, schema_analysis, conversion_failures, violations)
+            self._record_row_issues(df, schema_analysis, duplicates, violations)
+            initial_rules = self._evaluate_rules(rule_set, df, initial_quality, violations)
+            cluster_labels, near_duplicates = self._find_near_duplicates(df, schema_analysis, blocking_columns, initial_quality, violations)
+            memory.checkpoint('analyze', df, extra_bytes=row_hashes.nbytes + duplicates.nbytes + cluster_labels.nbytes)
             
             # Step 5: Quality improvements
-            self._log("Step 5: Applying quality improvements...")
-            df_processed = self._improve_quality(df_processed, schema_analysis)
+            self._step('improve', "Step 5: Applying quality improvements...", df)
+            df, row_hashes = self._improve_quality(df, schema_analysis, duplicates, row_hashes)
+            memory.checkpoint('improve', df, extra_bytes=row_hashes.nbytes)
             
             # Step 6: Recalculate quality after improvements
-            self._log("Step 6: Recalculating quality metrics...")
-            final_quality = self._analyze_quality(df_processed)
+            self._step('reanalyze', "Step 6: Recalculating quality metrics...", df)
+            final_quality, final_checks = self._analyze_quality(df, pd.Series(row_hashes).duplicated().to_numpy(), schema_analysis)
+            self._evaluate_rules(rule_set, df, final_quality)
+            if 'entity_uniqueness' in initial_quality:
+                # Removed exact duplicates leave their clusters
+                final_quality['entity_uniqueness'] = 1 - summarize_clusters(cluster_labels, keep=~duplicates)['dedup_rate']
             
-            # Step 7: Finalize
-            self._log("Step 7: Finalizing results...")
+            # Step 7: Finalize. Compact dtypes of the frame callers keep
+            # (after the final analysis, so metrics see the converted values).
+            self._step('report', "Step 7: Finalizing results...", df)
+            dtype_report = optimize_dtypes(df)
+            self._log(
+                f"Optimized column types: {dtype_report['memory_before_bytes'] / 1024 / 1024:.1f} MB -> "
+                f"{dtype_report['memory_after_bytes'] / 1024 / 1024:.1f} MB ({len(dtype_report['converted_columns'])} columns)"
+            )
+            memory.checkpoint('optimize', df)
             
-            self.processed_data = df_processed
+            self.processed_data = df
             self.quality_metrics = final_quality
+            violation_report, violations_path = violations.report(), violations.finish_export()
+            stage_metrics = self._finish_stages()
             
             return {
                 'success': True,
-                'processed_data': df_processed,
+                'processed_data': df,
                 'quality_metrics': final_quality,
+                'initial_quality_metrics': initial_quality,
+                'column_quality': final_checks,
+                'initial_column_quality': initial_checks,
+                'business_rules': initial_rules.report() if initial_rules else [],
+                'near_duplicates': near_duplicates,
+                'dtype_optimization': dtype_report,
+                'violations': violation_report,
+                'violations_path': violations_path,
                 'validation_results': validation_results,
                 'processing_log': self.processing_log,
+                'memory_report': memory.report(),
+                'stage_metrics': stage_metrics,
+                # Temporary files owned by this result (see data_writers.release_result_files)
+                'temp_files': list(self.temp_files),
                 'improvements_applied': len(self.processing_log) > 0
             }
             
         except Exception as e:
+            self._remove_temp_files()
             return {
                 'success': False,
                 'error': f'Error processing data: {str(e)}',
                 'processing_log': self.processing_log
             }
     
+    def _temp_csv_path(self, prefix):
+        """New temporary CSV owned by the result of the running pipeline"""
+        fd, path = tempfile.mkstemp(prefix=prefix, suffix='.csv')
+        os.close(fd)
+        self.temp_files.append(path)
+        return path
+    
+    def _remove_temp_files(self):
+        for path in self.temp_files:
+            if os.path.exists(path):
+                os.remove(path)
+        self.temp_files = []
+    
+    def _process_data_chunked(self, data_file_path, schema_analysis, output_path=None, rule_set=None, export_violations=False):
+        """Out-of-core processing: each row block is converted, de-duplicated, filled and appended to output_path
+        
+        Completeness is counted exactly; duplicates are found across blocks with
+        exact sets of row hashes, so the metrics match in-memory processing.
+        """
+        try:
+            self.processing_log = []
+            self.profiler = StageProfiler()
+            self.temp_files = []
+            memory = MemoryTracker()
+            self._log("Starting data processing (chunked)...")
+            self._step('load', "Step 1: Streaming data file in row blocks...")
+            if output_path is None:
+                output_path = self._temp_csv_path('processed_data_')
+            violations = ViolationCollector(self._temp_csv_path('violations_') if export_violations else None)
+            
+            seen_rows = HashedRowSet()  # Input rows, for duplicate removal and initial uniqueness
+            cleaned_rows = HashedRowSet()  # Output rows, for final uniqueness
+            initial_quality = QualityAccumulator(schema_analysis)
+            final_quality = QualityAccumulator(schema_analysis)
+            initial_rules = RuleAccumulator(rule_set, violations=violations) if rule_set else None
+            final_rules = RuleAccumulator(rule_set) if rule_set else None
+            validation_results = None
+            preview = []
+            preview_rows = 0
+            removed_duplicates = 0
+            chunk_count = 0
+            
+            # Each stage accumulates over the row blocks; messages are logged for the first block
+            for chunk in iter_table_chunks(data_file_path, dtype=schema_dtypes(schema_analysis)):
+                chunk_count += 1
+                first = chunk_count == 1
+                self.profiler.count(*chunk.shape)
+                if validation_results is None:
+                    self._step('validate', "Step 2: Validating against schema...", chunk)
+                    validation_results = self._validate_against_schema(chunk, schema_analysis)
+                
+                row_offset = initial_quality.rows
+                self._step('convert', "Step 3: Converting data types (per row block)..." if first else None, chunk)
+                conversion_failures = self._convert_data_types(chunk, schema_analysis, violations, row_offset)
+                self._step('analyze', "Step 4: Analyzing data quality (per row block)..." if first else None, chunk)
+                row_hashes = self._row_hashes(chunk)
+                duplicates = ~seen_rows.add(row_hashes)
+                initial_quality.update(chunk, duplicates, conversion_failures, violations, row_offset)
+                self._record_row_issues(chunk, schema_analysis, duplicates, violations, row_offset)
+                if initial_rules:
+                    initial_rules.update(chunk)
+                removed_duplicates += int(duplicates.sum())
+                
+                self._step('improve', "Step 5: Applying quality improvements (per row block)..." if first else None, chunk)
+                chunk, row_hashes = self._improve_quality(chunk, schema_analysis, duplicates, row_hashes, log=False)
+                self._step('reanalyze', "Step 6: Recalculating quality metrics (per row block)..." if first else None, chunk)
+                final_quality.update(chunk, ~cleaned_rows.add(row_hashes))
+                if final_rules:
+                    final_rules.update(chunk)
+                
+                self._step('write', "Writing processed row blocks..." if first else None, chunk)
+                chunk.to_csv(output_path, mode='w' if chunk_count == 1 else 'a', header=chunk_count == 1, index=False)
+                if preview_rows < CHUNKED_PREVIEW_ROWS:
+                    preview.append(chunk.head(CHUNKED_PREVIEW_ROWS - preview_rows))
+                    preview_rows += len(preview[-1])
+                memory.checkpoint(f'chunk {chunk_count}', chunk, extra_bytes=row_hashes.nbytes + seen_rows.nbytes + cleaned_rows.nbytes)
+                # Reading the next block counts as loading
+                self._step('load')
+            
+            self._step('report', "Step 7: Finalizing results...")
+            self._log(f"Steps 3-6: Converted, de-duplicated and filled {chunk_count} row blocks")
+            if removed_duplicates > 0:
+                self._log(f"Removed {removed_duplicates} duplicate rows")
+            initial_metrics = initial_quality.metrics()
+            final_metrics = final_quality.metrics()
+            for metrics, rules in ((initial_metrics, initial_rules), (final_metrics, final_rules)):
+                if rules and rules.pass_rate() is not None:
+                    metrics['business_rules'] = rules.pass_rate()
+            
+            processed_preview = pd.concat(preview, ignore_index=True) if len(preview) > 1 else preview[0]
+            self.processed_data = processed_preview
+            self.quality_metrics = final_metrics
+            violation_report, violations_path = violations.report(), violations.finish_export()
+            stage_metrics = self._finish_stages()
+            
+            return {
+                'success': True,
+                'processed_data': processed_preview,
+                'output_path': output_path,
+                'processing_mode': 'chunked',
+                'rows_processed': initial_quality.rows,
+                'rows_written': final_quality.rows,
+                'quality_metrics': final_metrics,
+                'initial_quality_metrics': initial_metrics,
+                'column_quality': final_quality.column_report(),
+                'initial_column_quality': initial_quality.column_report(),
+                'business_rules': initial_rules.report() if initial_rules else [],
+                # Clustering needs all distinct records at once
+                'near_duplicates': None,
+                'dtype_optimization': None,
+                'violations': violation_report,
+                'violations_path': violations_path,
+                'validation_results': validation_results,
+                'processing_log': self.processing_log,
+                'memory_report': memory.report(),
+                'stage_metrics': stage_metrics,
+                # Temporary files owned by this result (see data_writers.release_result_files)
+                'temp_files': list(self.temp_files),
+                'improvements_applied': len(self.processing_log) > 0
+            }
+            
+        except Exception as e:
+            self._remove_temp_files()
+            return {
+                'success': False,
+                'error': f'Error processing data: {str(e)}',
+                'processing_log': self.processing_log
+            }
+
+    def monitor_batch(self, data_file_path, monitor, source=None):
+        """Check a new batch of a monitored dataset (see quality_monitor.DatasetMonitor)
+
+        The batch is streamed in row blocks and converted as in processing,
+        then scored against the monitor's state and added to it; earlier
+        batches are never read again. Returns the run with its drift flags.
+        """
+        try:
+            schema_analysis = monitor.schema_analysis
+            batch = monitor.start_batch()
+            if isinstance(data_file_path, pd.DataFrame):
+                chunks = [data_file_path.copy()]
+            else:
+                chunks = iter_table_chunks(data_file_path, dtype=schema_dtypes(schema_analysis))
+            for chunk in chunks:
+                conversion_failures = self._convert_data_types(chunk, schema_analysis)
+                batch.update(chunk, self._row_hashes(chunk), conversion_failures)
+            return {'success': True, 'run': monitor.commit(batch, source)}
+        except Exception as e:
+            return {'success': False, 'error': f'Error monitoring batch: {str(e)}'}
+
     def _validate_against_schema(self, df, schema_analysis):
         """Validate data against schema"""
         validation_results = {
@@ -97,101 +478,231 @@ class SmartDataProcessor:
         
         return validation_results
     
-    def _convert_data_types(self, df, schema_analysis):
-        """Convert data types according to schema"""
-        df_converted = df.copy()
+    def _convert_data_types(self, df, schema_analysis, violations=None, row_offset=0):
+        """Convert data types according to schema (in place)
         
+        Returns the number of values per column that did not conform to the
+        schema type (coerced to missing, or not a boolean token); with a
+        ViolationCollector they are also recorded with their original values.
+        """
+        conversion_failures = {}
         if not schema_analysis or 'fields' not in schema_analysis:
-            return df_converted
+            return conversion_failures
         
         for field in schema_analysis.get('fields', []):
             field_name = field.get('field_name', '')
             detected_type = field.get('detected_type', 'Text')
             
-            if field_name in df_converted.columns:
+            if field_name in df.columns:
                 try:
+                    original = df[field_name]
+                    present = original.notna()
                     if detected_type == 'Numeric':
-                        df_converted[field_name] = pd.to_numeric(df_converted[field_name], errors='coerce')
+                        df[field_name] = pd.to_numeric(df[field_name], errors='coerce')
+                        failed = present & df[field_name].isna()
                     elif detected_type == 'DateTime':
-                        df_converted[field_name] = pd.to_datetime(df_converted[field_name], errors='coerce')
+                        df[field_name] = pd.to_datetime(df[field_name], errors='coerce')
+                        failed = present & df[field_name].isna()
                     elif detected_type == 'Boolean':
-                        df_converted[field_name] = df_converted[field_name].astype(str).str.lower().isin(['true', 'yes', '1', 'y'])
+                        text = df[field_name].astype(str).str.strip().str.lower()
+                        failed = present & ~text.isin(BOOLEAN_TOKENS | {'1', '0'})
+                        df[field_name] = text.isin(['true', 'yes', '1', 'y'])
+                    else:
+                        continue
+                    if failed.any():
+                        conversion_failures[field_name] = int(failed.sum())
+                        if violations is not None:
+                            violations.record('invalid_format', failed.to_numpy(), row_offset, column=field_name, values=original)
                 except:
                     pass  # Keep original if conversion fails
         
-        return df_converted
-    
-    def _analyze_quality(self, df):
-        """Analyze data quality metrics"""
-        metrics = {
-            'completeness': 0.0,
-            'accuracy': 0.8,  # Default assumption
-            'consistency': 0.8,  # Default assumption
-            'uniqueness': 0.0,
-            'validity': 0.8,  # Default assumption
-            'overall_score': 0.0
-        }
+        return conversion_failures
+    
+    def _row_hashes(self, df):
+        """64-bit hash of every row; equal rows hash equal, so duplicates are found without comparing rows
         
-        if df.empty:
-            return metrics
-        
-        # Completeness: percentage of non-null values
-        total_cells = len(df) * len(df.columns)
-        non_null_cells = df.notna().sum().sum()
-        metrics['completeness'] = non_null_cells / total_cells if total_cells > 0 else 0
-        
-        # Uniqueness: percentage of unique rows
-        total_rows = len(df)
-        unique_rows = len(df.drop_duplicates())
-        metrics['uniqueness'] = unique_rows / total_rows if total_rows > 0 else 0
-        
-        # Calculate overall score (weighted average)
-        weights = {
-            'completeness': 0.25,
-            'accuracy': 0.20,
-            'consistency': 0.15,
-            'uniqueness': 0.20,
-            'validity': 0.20
-        }
+        Columns are folded into one accumulator one at a time, so the extra
+        memory is two 8-byte arrays per row regardless of the column count.
+        Text columns are factorized and only their distinct values are hashed.
+        """
+        hashes = np.full(len(df), 0x345678, dtype=np.uint64)
+        for position in range(len(df.columns)):
+            hashes ^= self._column_hashes(df.iloc[:, position])
+            hashes *= np.uint64(1000003 + 2 * position)
+        return hashes
+    
+    def _column_hashes(self, column):
+        """Value-based hashes of one column
         
-        metrics['overall_score'] = sum(
-            metrics[key] * weights[key]
-            for key in weights.keys()
+        Integral numbers hash by integer value whatever the dtype, so a column
+        read as int64 in one chunk and float64 (with NaN) in another hashes alike.
+        """
+        if pd.api.types.is_datetime64_any_dtype(column):
+            return pd.util.hash_pandas_object(column, index=False).to_numpy()
+        if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+            if pd.api.types.is_integer_dtype(column) and not column.hasnans:
+                return pd.util.hash_array(column.to_numpy(dtype=np.int64))
+            return self._number_hashes(column.to_numpy(dtype=np.float64, na_value=np.nan))
+        codes, uniques = pd.factorize(column)
+        if len(uniques) == 0:
+            return np.zeros(len(column), dtype=np.uint64)
+        values = np.asarray(uniques, dtype=object)
+        if column.dtype != object:
+            unique_hashes = pd.util.hash_array(values)
+        else:
+            unique_hashes = self._object_hashes(values)
+        # Code -1 (missing) picks the extra slot
+        return np.append(unique_hashes, np.uint64(0))[codes]
+    
+    def _number_hashes(self, floats):
+        """Hashes of float values; integral ones hash like the same int64 values"""
+        hashes = pd.util.hash_array(floats)
+        integral = np.isfinite(floats) & (floats == np.floor(floats)) & (np.abs(floats) < 2.0 ** 63)
+        hashes[integral] = pd.util.hash_array(floats[integral].astype(np.int64))
+        return hashes
+    
+    def _object_hashes(self, values):
+        """Hashes of distinct Python objects that keep types apart
+        
+        hash_array hashes the text form of non-strings, so 1, '1' and True
+        would collide and be removed as duplicates. Strings hash as text,
+        numbers by value (as numeric columns do) and other objects by their
+        text mixed with their type name.
+        """
+        hashes = np.empty(len(values), dtype=np.uint64)
+        is_text = np.fromiter((isinstance(value, str) for value in values), dtype=bool, count=len(values))
+        is_number = np.fromiter(
+            (isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_)) for value in values),
+            dtype=bool, count=len(values)
         )
+        other = ~(is_text | is_number)
+        if is_text.any():
+            hashes[is_text] = pd.util.hash_array(values[is_text])
+        if is_number.any():
+            hashes[is_number] = self._number_hashes(values[is_number].astype(np.float64))
+        if other.any():
+            texts = np.array([str(value) for value in values[other]], dtype=object)
+            type_names = np.array([type(value).__name__ for value in values[other]], dtype=object)
+            hashes[other] = pd.util.hash_array(texts) * np.uint64(31) + pd.util.hash_array(type_names)
+        return hashes
+    
+    def _analyze_quality(self, df, duplicates=None, schema_analysis=None, conversion_failures=None, violations=None):
+        """Analyze data quality metrics
         
-        return metrics
+        duplicates is the boolean duplicate-row mask from the shared row-hash
+        pass; it is computed here if not given. Accuracy, consistency and
+        validity are checked against the schema analysis (see quality_checks).
+        Returns (metrics, per-column check report).
+        """
+        if duplicates is None:
+            duplicates = pd.Series(self._row_hashes(df)).duplicated().to_numpy()
+        accumulator = QualityAccumulator(schema_analysis)
+        accumulator.update(df, duplicates, conversion_failures, violations)
+        return accumulator.metrics(), accumulator.column_report()
     
-    def _improve_quality(self, df, schema_analysis):
-        """Apply quality improvements"""
-        df_improved = df.copy()
+    def _evaluate_rules(self, rule_set, df, metrics, violations=None):
+        """Evaluate business rules on df; their weighted pass rate goes into metrics['business_rules']"""
+        if not rule_set:
+            return None
+        rules = RuleAccumulator(rule_set, violations=violations)
+        rules.update(df)
+        if rules.pass_rate() is not None:
+            metrics['business_rules'] = rules.pass_rate()
+        failed = sum(1 for result in rules.report() if result['failed'])
+        self._log(f"Evaluated {len(rule_set)} business rules ({failed} with violations)")
+        return rules
+    
+    def _find_near_duplicates(self, df, schema_analysis, blocking_columns, metrics, violations):
+        """Cluster near-duplicate rows; when key columns exist, the dedup rate goes into metrics['entity_uniqueness']
+        
+        Returns the per-row cluster labels and the cluster summary. Every row after
+        the first of its cluster is recorded as a 'near_duplicate' violation.
+        """
+        labels, stats = find_near_duplicates(df, blocking_columns=blocking_columns or (), schema_analysis=schema_analysis)
+        summary = summarize_clusters(labels, stats)
+        if summary['records']:
+            metrics['entity_uniqueness'] = 1 - summary['dedup_rate']
+        if summary['clusters']:
+            # The value of a violation is the first row of its cluster
+            clusters, first_positions = np.unique(labels, return_index=True)
+            repeated = (labels >= 0) & pd.Series(labels).duplicated().to_numpy()
+            violations.record(
+                'near_duplicate', repeated, subject='row',
+                values=lambda positions: 'row ' + (first_positions[np.searchsorted(clusters, labels[positions])] + 1).astype(str).astype(object)
+            )
+            self._log(f"Found {summary['clusters']} near-duplicate clusters ({summary['near_duplicate_rows']} redundant rows)")
+        return labels, summary
+    
+    def _record_row_issues(self, df, schema_analysis, duplicates, violations, row_offset=0):
+        """Record missing values in required fields and duplicate rows"""
+        for field in (schema_analysis or {}).get('fields', []):
+            field_name = field.get('field_name', '')
+            if field.get('is_required', False) and field_name in df.columns:
+                violations.record('required_missing', df[field_name].isna().to_numpy(), row_offset, column=field_name)
+        violations.record('duplicate_row', duplicates, row_offset, subject='row')
+    
+    def _improve_quality(self, df, schema_analysis, duplicates, row_hashes, log=True):
+        """Apply quality improvements
         
+        Returns the improved frame and its row hashes. Only rows changed by
+        fill rules are re-hashed.
+        """
         # Remove duplicate rows
-        initial_rows = len(df_improved)
-        df_improved = df_improved.drop_duplicates()
-        removed_duplicates = initial_rows - len(df_improved)
+        removed_duplicates = int(duplicates.sum())
         if removed_duplicates > 0:
-            self._log(f"Removed {removed_duplicates} duplicate rows")
+            keep = np.flatnonzero(~duplicates)
+            # take() returns a new owned frame (no chained-assignment copy flag)
+            df = df.take(keep)
+            row_hashes = row_hashes[keep]
+            if log:
+                self._log(f"Removed {removed_duplicates} duplicate rows")
         
         # Fill missing values for required fields (if schema available)
+        filled = np.zeros(len(df), dtype=bool)
         if schema_analysis and 'fields' in schema_analysis:
             for field in schema_analysis.get('fields', []):
                 field_name = field.get('field_name', '')
-                if field.get('is_required', False) and field_name in df_improved.columns:
+                if field.get('is_required', False) and field_name in df.columns:
                     # Fill with appropriate default based on type
                     detected_type = field.get('detected_type', 'Text')
-                    if detected_type == 'Numeric':
-                        df_improved[field_name].fillna(0, inplace=True)
-                    elif detected_type == 'Text':
-                        df_improved[field_name].fillna('', inplace=True)
+                    fill_value = {'Numeric': 0, 'Text': ''}.get(detected_type)
+                    if fill_value is None:
+                        continue
+                    missing = df[field_name].isna().to_numpy()
+                    if missing.any():
+                        df[field_name] = df[field_name].fillna(fill_value)
+                        filled |= missing
         
-        return df_improved
+        if filled.any():
+            row_hashes = row_hashes.copy()
+            row_hashes[filled] = self._row_hashes(df[filled])
+        
+        return df, row_hashes
+    
+    def _step(self, stage, message=None, df=None):
+        """Start timing a pipeline stage (ending the running one), logging message if given"""
+        rows, columns = df.shape if df is not None else (0, 0)
+        self.profiler.begin(stage, rows, columns)
+        if message:
+            self._log(message, stage)
+    
+    def _finish_stages(self):
+        """End the running stage, attach each stage's metrics to its log entry and return the report"""
+        self.profiler.end()
+        for entry in self.processing_log:
+            if entry.get('stage'):
+                entry['metrics'] = self.profiler.record(entry['stage'])
+        return self.profiler.report()
     
-    def _log(self, message):
+    def _log(self, message, stage=None):
         """Add message to processing log"""
-        self.processing_log.append({
+        entry = {
             'timestamp': datetime.now().isoformat(),
             'message': message
-        })
+        }
+        if stage:
+            entry['stage'] = stage
+        self.processing_log.append(entry)
     
     def get_processed_data(self):
         """Get processed data"""
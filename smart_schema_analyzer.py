@@ -5,17 +5,100 @@ Analyzes Excel schema files and detects data types, constraints, and NDMO compli
 
 import pandas as pd
 import os
+import re
 from datetime import datetime
+from type_inference import infer_frame_types, infer_sample_types
+from column_sketches import column_fingerprints
+from column_name_classifier import ColumnNameClassifier
+from result_cache import file_sha256, get_result_cache, make_cache_key
+from data_readers import detect_format, read_table
+
+# Bump whenever analysis logic or output changes so cached results are not reused
+ANALYZER_VERSION = '2.2'
+
+# Sheets whose estimated in-memory size exceeds this budget are profiled in streaming mode
+DEFAULT_MEMORY_BUDGET_MB = 512
+
+# Per-field details kept in streaming mode; totals still cover every row
+STREAMING_FIELD_DETAILS_LIMIT = 1000
+
+# Schema columns that hold each field's name and declared type, in lookup order
+FIELD_NAME_COLUMNS = ['Field Name', 'Column Name', 'Field', 'Column', 'Name']
+FIELD_TYPE_COLUMNS = ['Type', 'Data Type', 'DataType', 'Field Type']
+FIELD_REQUIRED_COLUMNS = ['Required', 'Mandatory', 'Nullable']
+
+# Data dictionary columns declaring value constraints, by constraint type
+FIELD_CONSTRAINT_COLUMNS = {
+    'allowed_values': ['Allowed Values', 'Valid Values', 'Domain', 'Values'],
+    'min_value': ['Min', 'Minimum', 'Min Value'],
+    'max_value': ['Max', 'Maximum', 'Max Value'],
+    'max_length': ['Max Length', 'Length', 'Size'],
+    'pattern': ['Pattern', 'Regex']
+}
+
+# Analysis keys derived from the per-field (row) pass
+FIELD_LEVEL_KEYS = ['fields', 'has_primary_key', 'has_foreign_keys', 'has_audit_trail', 'data_types']
 
 class SmartSchemaAnalyzer:
     """Smart Schema Analyzer for NDMO Compliance"""
     
-    def __init__(self):
+    def __init__(self, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB, name_keywords=None, use_cache=True):
         self.schema_data = None
         self.analysis_results = {}
+        self.workbook_results = {}
+        self.memory_budget_mb = memory_budget_mb
+        # name_keywords overrides or extends the keyword tables in column_name_classifier
+        self.name_keywords = name_keywords
+        self.name_classifier = ColumnNameClassifier(name_keywords)
+        # Results are shared across sessions through the process-wide result cache
+        self.result_cache = get_result_cache() if use_cache else None
     
-    def analyze_schema(self, schema_file_path):
-        """Analyze schema file and return comprehensive analysis"""
+    def analyze_schema(self, schema_file_path, sheet_name=None):
+        """Analyze schema file and return comprehensive analysis
+        
+        sheet_name selects the worksheet to analyze; the active sheet by default.
+        A file already analyzed with the same settings is answered from the cache.
+        """
+        return self._cached(
+            schema_file_path, 'schema_analysis',
+            lambda: self._analyze_schema_uncached(schema_file_path, sheet_name),
+            sheet_name=sheet_name
+        )
+    
+    def _cache_key(self, schema_file_path, namespace, **params):
+        """Content-addressed key for this file and analyzer configuration, or None when not cacheable"""
+        if self.result_cache is None:
+            return None
+        try:
+            content_sha256 = file_sha256(schema_file_path)
+        except Exception:
+            return None
+        return make_cache_key(
+            namespace, ANALYZER_VERSION, content_sha256,
+            memory_budget_mb=self.memory_budget_mb, name_keywords=self.name_keywords, **params
+        )
+    
+    def _cached(self, schema_file_path, namespace, compute, **params):
+        """Return the cached result for this file and params, or call compute() and cache its result"""
+        cache_key = self._cache_key(schema_file_path, namespace, **params)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                cached['from_cache'] = True
+                return self._restore_cached(namespace, cached)
+        result = compute()
+        if cache_key is not None and 'error' not in result:
+            self.result_cache.put(cache_key, result)
+        return result
+    
+    def _restore_cached(self, namespace, result):
+        if namespace == 'schema_workbook':
+            self.workbook_results = result
+        else:
+            self.analysis_results = result
+        return result
+    
+    def _analyze_schema_uncached(self, schema_file_path, sheet_name=None):
         try:
             # Read schema file
             if not os.path.exists(schema_file_path):
@@ -26,224 +109,336 @@ class SmartSchemaAnalyzer:
             if file_size == 0:
                 return {'error': 'Schema file is empty'}
             
-            # CRITICAL: Use openpyxl directly to get ALL columns (including empty ones)
-            import openpyxl
-            df = None
-            actual_column_count = 0
-            column_names = []
+            # Very large sheets are profiled block by block instead of loaded whole
+            if self._exceeds_memory_budget(schema_file_path, sheet_name):
+                return self._analyze_schema_streaming(schema_file_path, sheet_name)
             
+            # Read headers, exact column count (including empty columns) and data in one pass
             try:
-                # Step 1: Read Excel file with openpyxl to get exact column count
-                # Try to load workbook with error handling
-                try:
-                    wb = openpyxl.load_workbook(schema_file_path, read_only=True, data_only=True)
-                except Exception as wb_error:
-                    # Try without read_only if that fails
-                    try:
-                        wb = openpyxl.load_workbook(schema_file_path, data_only=True)
-                    except Exception as wb_error2:
-                        return {'error': f'Cannot read Excel file. File may be corrupted or in wrong format. Error: {str(wb_error)} / {str(wb_error2)}'}
-                ws = wb.active
-                
-                # Get actual maximum column from Excel file
-                max_col = ws.max_column
-                actual_column_count = max_col
-                
-                # Get column names from first row
-                for col_idx in range(1, max_col + 1):
-                    cell_value = ws.cell(row=1, column=col_idx).value
-                    if cell_value and str(cell_value).strip():
-                        column_names.append(str(cell_value).strip())
-                    else:
-                        column_names.append(f'Column_{col_idx}')
-                
-                wb.close()
-                
-                # Step 2: Read with pandas using explicit column range to get ALL columns
-                try:
-                    # CRITICAL: Read with usecols to force reading ALL columns
-                    df = pd.read_excel(
-                        schema_file_path, 
-                        engine='openpyxl', 
-                        header=0,
-                        usecols=range(max_col)  # Force read all columns
-                    )
-                    
-                    # Ensure we have exactly max_col columns
-                    if len(df.columns) < max_col:
-                        # Add missing columns
-                        for i in range(len(df.columns), max_col):
-                            col_name = column_names[i] if i < len(column_names) else f'Column_{i+1}'
-                            df[col_name] = None
-                    
-                    # Rename columns to match what we found
-                    if len(column_names) == len(df.columns):
-                        df.columns = column_names
-                    elif len(column_names) > 0:
-                        # Use column names we found, pad if needed
-                        new_columns = []
-                        for i in range(max_col):
-                            if i < len(column_names):
-                                new_columns.append(column_names[i])
-                            elif i < len(df.columns):
-                                new_columns.append(df.columns[i])
-                            else:
-                                new_columns.append(f'Column_{i+1}')
-                        df.columns = new_columns[:len(df.columns)]
-                        
-                except Exception as e_read:
-                    # Fallback: read without header and manually set columns
-                    try:
-                        df = pd.read_excel(schema_file_path, engine='openpyxl', header=None)
-                        # Check if first row looks like headers
-                        if len(df) > 0:
-                            first_row = df.iloc[0]
-                            non_null_count = first_row.notna().sum()
-                            
-                            if non_null_count > max_col * 0.3:
-                                # First row is headers
-                                new_columns = []
-                                for i in range(max_col):
-                                    if i < len(first_row):
-                                        val = first_row.iloc[i]
-                                        if pd.notna(val):
-                                            new_columns.append(str(val).strip())
-                                        else:
-                                            new_columns.append(column_names[i] if i < len(column_names) else f'Column_{i+1}')
-                                    else:
-                                        new_columns.append(column_names[i] if i < len(column_names) else f'Column_{i+1}')
-                                
-                                df.columns = new_columns[:len(df.columns)]
-                                df = df.iloc[1:].reset_index(drop=True)
-                            else:
-                                # No clear headers, use column names we found
-                                new_columns = column_names[:max_col] if len(column_names) >= max_col else column_names + [f'Column_{i+1}' for i in range(len(column_names), max_col)]
-                                df.columns = new_columns[:len(df.columns)]
-                            
-                            # Ensure we have max_col columns
-                            if len(df.columns) < max_col:
-                                for i in range(len(df.columns), max_col):
-                                    col_name = column_names[i] if i < len(column_names) else f'Column_{i+1}'
-                                    df[col_name] = None
-                        else:
-                            # Empty file, create columns
-                            df = pd.DataFrame(columns=column_names[:max_col] if len(column_names) >= max_col else column_names + [f'Column_{i+1}' for i in range(len(column_names), max_col)])
-                    except Exception as e2:
-                        raise Exception(f"Failed to read Excel: {str(e_read)} / {str(e2)}")
-                
-            except Exception as e1:
-                try:
-                    # Fallback: try reading with pandas default
-                    df = pd.read_excel(schema_file_path, engine='openpyxl')
-                    actual_column_count = len(df.columns)
-                    # Try to get more columns
-                    try:
-                        df_test = pd.read_excel(schema_file_path, header=None, engine='openpyxl', nrows=1)
-                        actual_column_count = max(actual_column_count, len(df_test.columns))
-                    except:
-                        pass
-                except Exception as e2:
-                    return {'error': f'Failed to read schema file: {str(e1)} / {str(e2)}'}
+                df, column_names, actual_column_count = self._read_workbook(schema_file_path, sheet_name)
+            except Exception as e:
+                return {'error': f'Cannot read Excel file. File may be corrupted or in wrong format. Error: {str(e)}'}
             
             if df is None or df.empty:
                 return {'error': 'Schema file is empty or could not be read.'}
             
-            # Ensure we have all columns
-            if len(df.columns) < actual_column_count:
-                # Add missing columns
-                for i in range(len(df.columns), actual_column_count):
-                    col_name = column_names[i] if i < len(column_names) else f'Column_{i+1}'
-                    df[col_name] = None
-            
             # Analyze schema structure
-            analysis = {
-                'timestamp': datetime.now().isoformat(),
-                'file_name': os.path.basename(schema_file_path),
-                'total_fields': len(df),
-                'total_columns': max(len(df.columns), actual_column_count),
-                'columns': list(df.columns),
-                'fields': [],
-                'has_primary_key': False,
-                'has_foreign_keys': False,
-                'has_audit_trail': False,
-                'data_types': {},
-                'constraints': [],
-                'issues': [],
-                'recommendations': [],
-                'ndmo_compliance': {}
-            }
+            analysis = self._new_analysis(schema_file_path, list(df.columns), sheet_name)
+            analysis['total_fields'] = len(df)
             
             # Analyze each column/field
             for idx, row in df.iterrows():
-                field_info = self._analyze_field(row, df.columns)
-                analysis['fields'].append(field_info)
-                
-                # Check for primary key
-                if field_info.get('is_primary_key', False):
-                    analysis['has_primary_key'] = True
-                
-                # Check for foreign keys
-                if field_info.get('is_foreign_key', False):
-                    analysis['has_foreign_keys'] = True
-                
-                # Check for audit trail fields
-                if field_info.get('is_audit_field', False):
-                    analysis['has_audit_trail'] = True
-                
-                # Track data types
-                data_type = field_info.get('detected_type', 'Unknown')
-                analysis['data_types'][data_type] = analysis['data_types'].get(data_type, 0) + 1
+                self._record_field(analysis, self._analyze_field(row, df.columns))
             
             # Analyze each column for NDMO compliance - THIS IS THE KEY PART
             analysis['column_analysis'] = self._analyze_columns(df)
             
-            # CRITICAL: Ensure we analyze ALL columns from Excel file
-            # If we have fewer analyzed columns than actual, analyze remaining columns
-            if len(analysis['column_analysis']) < actual_column_count:
-                # Analyze remaining columns that might have been missed
-                for col_idx in range(len(df.columns), actual_column_count):
-                    col_info = {
-                        'column_name': f'Column_{col_idx + 1}',
-                        'data_type': 'Unknown',
-                        'non_null_count': 0,
-                        'null_count': len(df) if len(df) > 0 else 0,
-                        'unique_count': 0,
-                        'total_count': len(df),
-                        'completeness': 0.0,
-                        'uniqueness': 0.0,
-                        'detected_type': 'Unknown',
-                        'is_primary_key': False,
-                        'is_audit_field': False,
-                        'ndmo_standards': []
-                    }
-                    analysis['column_analysis'].append(col_info)
+            self.schema_data = df
+            return self._finalize_analysis(analysis, actual_column_count)
+            
+        except Exception as e:
+            import traceback
+            return {'error': f'Error analyzing schema: {str(e)}\n{traceback.format_exc()}'}
+    
+    def analyze_schema_incremental(self, schema_file_path, previous_analysis, sheet_name=None):
+        """Re-analyze a new version of a schema, recomputing only added or changed columns
+        
+        Columns are matched to previous_analysis by name and compared by content
+        fingerprint; unchanged columns keep their profile and NDMO score. The
+        per-field pass is reused when the field name and type columns did not
+        change. Schema-level flags, recommendations and issues are re-derived.
+        The result carries a 'change_report' against the previous analysis.
+        """
+        previous_analysis = previous_analysis or {}
+        cache_key = self._cache_key(schema_file_path, 'schema_analysis', sheet_name=sheet_name)
+        analysis = self.result_cache.get(cache_key) if cache_key is not None else None
+        if analysis is not None:
+            analysis['from_cache'] = True
+            self.analysis_results = analysis
+        else:
+            analysis = self._analyze_schema_incremental(schema_file_path, previous_analysis, sheet_name)
+            if cache_key is not None and 'error' not in analysis:
+                self.result_cache.put(cache_key, analysis)
+        
+        if 'error' not in analysis:
+            analysis['change_report'] = build_change_report(previous_analysis, analysis)
+        return analysis
+    
+    def _analyze_schema_incremental(self, schema_file_path, previous_analysis, sheet_name=None):
+        try:
+            if (not previous_analysis.get('column_analysis')
+                    or not os.path.exists(schema_file_path)
+                    or os.path.getsize(schema_file_path) == 0
+                    or self._exceeds_memory_budget(schema_file_path, sheet_name)):
+                # Nothing to reuse, or a streaming profile that needs the full pass anyway
+                return self._analyze_schema_uncached(schema_file_path, sheet_name)
+            
+            try:
+                df, column_names, actual_column_count = self._read_workbook(schema_file_path, sheet_name)
+            except Exception as e:
+                return {'error': f'Cannot read Excel file. File may be corrupted or in wrong format. Error: {str(e)}'}
             
-            # Update total_columns based on actual analysis
-            analysis['total_columns'] = max(len(analysis['column_analysis']), actual_column_count)
+            if df is None or df.empty:
+                return {'error': 'Schema file is empty or could not be read.'}
             
-            # Calculate NDMO compliance per column
-            analysis['ndmo_compliance'] = self._calculate_ndmo_compliance_per_column(analysis)
+            analysis = self._new_analysis(schema_file_path, list(df.columns), sheet_name)
+            analysis['total_fields'] = len(df)
             
-            # Generate recommendations
-            analysis['recommendations'] = self._generate_recommendations(analysis)
+            # Match columns by (name, occurrence) and keep those whose content is unchanged
+            fingerprints = column_fingerprints(df.set_axis(range(len(df.columns)), axis=1))
+            previous_columns = dict(zip(
+                _column_keys(col['column_name'] for col in previous_analysis['column_analysis']),
+                previous_analysis['column_analysis']
+            ))
+            keys = _column_keys(column_names)
+            reused = {}
+            for position, key in enumerate(keys):
+                previous_col = previous_columns.get(key)
+                if previous_col is not None and previous_col.get('fingerprint') == fingerprints[position]:
+                    reused[position] = previous_col
             
-            # Identify issues
-            analysis['issues'] = self._identify_issues(analysis)
+            changed_positions = [position for position in range(len(keys)) if position not in reused]
+            recomputed = iter(self._analyze_columns(df.iloc[:, changed_positions]) if changed_positions else [])
+            analysis['column_analysis'] = [
+                dict(reused[position]) if position in reused else next(recomputed)
+                for position in range(len(keys))
+            ]
             
-            self.schema_data = df
-            self.analysis_results = analysis
+            # Unchanged columns keep their scores; only the others are rescored
+            previous_compliance = previous_analysis.get('ndmo_compliance', {})
+            ndmo_compliance = {}
+            rescore = []
+            for position, col_info in enumerate(analysis['column_analysis']):
+                if position in reused and col_info['column_name'] in previous_compliance:
+                    ndmo_compliance[col_info['column_name']] = previous_compliance[col_info['column_name']]
+                else:
+                    ndmo_compliance[col_info['column_name']] = None
+                    rescore.append(col_info)
+            ndmo_compliance.update(self._calculate_ndmo_compliance_per_column({'column_analysis': rescore}))
             
-            return analysis
+            # Field-level results depend only on the field name and type columns
+            sources = self._field_source_columns(column_names)
+            previous_keys = _column_keys(previous_analysis.get('columns', []))
+            previous_sources = self._field_source_columns(previous_analysis.get('columns', []))
+            reuse_fields = (
+                previous_analysis.get('total_fields') == len(df)
+                and all(key in previous_analysis for key in FIELD_LEVEL_KEYS)
+                and [keys[position] for position in sources] == [previous_keys[position] for position in previous_sources]
+                and all(position in reused for position in sources)
+            )
+            if reuse_fields:
+                for key in FIELD_LEVEL_KEYS:
+                    analysis[key] = previous_analysis[key]
+            else:
+                for idx, row in df.iterrows():
+                    self._record_field(analysis, self._analyze_field(row, df.columns))
             
+            self.schema_data = df
+            return self._finalize_analysis(analysis, actual_column_count, ndmo_compliance)
+        
         except Exception as e:
             import traceback
             return {'error': f'Error analyzing schema: {str(e)}\n{traceback.format_exc()}'}
     
+    def _field_source_columns(self, columns):
+        """Positions of the columns the per-field pass reads (name, declared type, required flag and constraints)"""
+        columns = list(columns)
+        sources = []
+        for candidates in (FIELD_NAME_COLUMNS, FIELD_TYPE_COLUMNS, FIELD_REQUIRED_COLUMNS, *FIELD_CONSTRAINT_COLUMNS.values()):
+            for col_name in candidates:
+                if col_name in columns:
+                    sources.append(columns.index(col_name))
+                    break
+        if columns and not any(col_name in columns for col_name in FIELD_NAME_COLUMNS):
+            sources.insert(0, 0)
+        return sources
+    
+    def _new_analysis(self, schema_file_path, columns, sheet_name=None):
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'file_name': os.path.basename(schema_file_path),
+            'sheet_name': sheet_name,
+            'total_fields': 0,
+            'total_columns': len(columns),
+            'columns': columns,
+            'fields': [],
+            'has_primary_key': False,
+            'has_foreign_keys': False,
+            'has_audit_trail': False,
+            'data_types': {},
+            'constraints': [],
+            'issues': [],
+            'recommendations': [],
+            'ndmo_compliance': {}
+        }
+    
+    def _record_field(self, analysis, field_info, keep_details=True):
+        """Fold one analyzed field into the schema-level flags and type counts"""
+        if keep_details:
+            analysis['fields'].append(field_info)
+        
+        # Check for primary key
+        if field_info.get('is_primary_key', False):
+            analysis['has_primary_key'] = True
+        
+        # Check for foreign keys
+        if field_info.get('is_foreign_key', False):
+            analysis['has_foreign_keys'] = True
+        
+        # Check for audit trail fields
+        if field_info.get('is_audit_field', False):
+            analysis['has_audit_trail'] = True
+        
+        # Track data types
+        data_type = field_info.get('detected_type', 'Unknown')
+        analysis['data_types'][data_type] = analysis['data_types'].get(data_type, 0) + 1
+    
+    def _finalize_analysis(self, analysis, actual_column_count, ndmo_compliance=None):
+        """Score per-column compliance and derive recommendations and issues
+        
+        ndmo_compliance, if given, holds per-column scores already computed
+        (incremental re-analysis).
+        """
+        # Update total_columns based on actual analysis
+        analysis['total_columns'] = max(len(analysis['column_analysis']), actual_column_count)
+        
+        # Calculate NDMO compliance per column
+        if ndmo_compliance is None:
+            ndmo_compliance = self._calculate_ndmo_compliance_per_column(analysis)
+        analysis['ndmo_compliance'] = ndmo_compliance
+        
+        # Generate recommendations
+        analysis['recommendations'] = self._generate_recommendations(analysis)
+        
+        # Identify issues
+        analysis['issues'] = self._identify_issues(analysis)
+        
+        self.analysis_results = analysis
+        return analysis
+    
+    def _exceeds_memory_budget(self, schema_file_path, sheet_name=None):
+        """Check whether loading the sheet as a DataFrame would exceed the memory budget"""
+        if not self.memory_budget_mb:
+            return False
+        try:
+            from streaming_profiler import estimate_sheet_memory
+            return estimate_sheet_memory(schema_file_path, sheet_name) > self.memory_budget_mb * 1024 * 1024
+        except Exception:
+            # Not an .xlsx workbook; the regular reader handles it
+            return False
+    
+    def _analyze_schema_streaming(self, schema_file_path, sheet_name=None):
+        """Analyze a sheet in one read-only pass, keeping memory bounded by the row block size"""
+        from streaming_profiler import profile_excel_streaming
+        
+        analysis = self._new_analysis(schema_file_path, [], sheet_name)
+        analysis['profiling_mode'] = 'streaming'
+        
+        def on_block(column_names, block):
+            block_df = pd.DataFrame.from_records(block, columns=column_names)
+            block_df.index += analysis['total_fields']
+            for idx, row in block_df.iterrows():
+                keep = len(analysis['fields']) < STREAMING_FIELD_DETAILS_LIMIT
+                self._record_field(analysis, self._analyze_field(row, block_df.columns), keep_details=keep)
+            analysis['total_fields'] += len(block)
+        
+        try:
+            column_names, column_stats, row_count = profile_excel_streaming(schema_file_path, on_block=on_block, sheet_name=sheet_name)
+        except Exception as e:
+            return {'error': f'Cannot read Excel file. File may be corrupted or in wrong format. Error: {str(e)}'}
+        
+        if row_count == 0:
+            return {'error': 'Schema file is empty or could not be read.'}
+        
+        analysis['columns'] = column_names
+        analysis['column_analysis'] = []
+        inferences = infer_sample_types([column.sample.values for column in column_stats])
+        for column, inference in zip(column_stats, inferences):
+            inference = inference if column.non_null_count > 0 else None
+            col_info = self._build_column_info(
+                column.name,
+                column.dtype,
+                column.non_null_count,
+                column.null_count,
+                column.distinct_count,
+                column.total_count,
+                self._detect_column_type(column.name, inference),
+                inference
+            )
+            sketch_summary = column.sketch.summary()
+            col_info['min_value'] = column.min_value
+            col_info['max_value'] = column.max_value
+            col_info['unique_count_is_estimate'] = not sketch_summary['distinct_is_exact']
+            col_info['quantiles'] = sketch_summary['quantiles']
+            col_info['top_values'] = sketch_summary['top_values']
+            col_info['fingerprint'] = column.fingerprint.hexdigest() if column.fingerprint is not None else None
+            analysis['column_analysis'].append(col_info)
+        
+        # The sheet is never held in memory in streaming mode
+        self.schema_data = None
+        return self._finalize_analysis(analysis, len(column_names))
+    
+    def _read_workbook(self, schema_file_path, sheet_name=None):
+        """Read one sheet (the active sheet by default) once and return (DataFrame, column names, column count)
+        
+        .xlsx files are streamed with openpyxl in read-only mode; legacy .xls is
+        parsed once by pandas without a header row; CSV/TSV and Parquet schemas
+        go through the data_readers layer.
+        """
+        file_format = detect_format(schema_file_path)
+        if file_format != 'excel':
+            df = read_table(schema_file_path, file_format=file_format)
+            return df, list(df.columns), len(df.columns)
+        
+        try:
+            import openpyxl
+            wb = openpyxl.load_workbook(schema_file_path, read_only=True, data_only=True)
+        except Exception:
+            raw = pd.read_excel(schema_file_path, header=None, sheet_name=sheet_name or 0)
+            rows = raw.astype(object).where(raw.notna(), None).itertuples(index=False, name=None)
+            return self._frame_from_rows(rows, len(raw.columns))
+        
+        try:
+            ws = wb[sheet_name] if sheet_name else wb.active
+            return self._frame_from_rows(ws.iter_rows(values_only=True), ws.max_column or 0)
+        finally:
+            wb.close()
+    
+    def _frame_from_rows(self, rows, max_col):
+        """Build the schema DataFrame from a row iterator whose first row holds the headers"""
+        rows = iter(rows)
+        header = next(rows, None) or ()
+        data = []
+        last_non_empty = 0
+        for row in rows:
+            data.append(row)
+            if any(value is not None and value != '' for value in row):
+                last_non_empty = len(data)
+            if len(row) > max_col:
+                max_col = len(row)
+        # Formatted but empty trailing rows are not fields
+        del data[last_non_empty:]
+        max_col = max(max_col, len(header))
+        
+        column_names = []
+        for col_idx in range(1, max_col + 1):
+            cell_value = header[col_idx - 1] if col_idx <= len(header) else None
+            if cell_value is not None and str(cell_value).strip():
+                column_names.append(str(cell_value).strip())
+            else:
+                column_names.append(f'Column_{col_idx}')
+        
+        padded = [tuple(row) + (None,) * (max_col - len(row)) if len(row) < max_col else row[:max_col] for row in data]
+        df = pd.DataFrame.from_records(padded, columns=range(max_col)) if padded else pd.DataFrame(columns=range(max_col))
+        df = df.infer_objects()
+        df.columns = column_names
+        return df, column_names, max_col
+    
     def _analyze_field(self, row, columns):
         """Analyze individual field"""
         # Try to get field name from common column names
         field_name = None
-        for col_name in ['Field Name', 'Column Name', 'Field', 'Column', 'Name']:
+        for col_name in FIELD_NAME_COLUMNS:
             if col_name in columns:
                 field_name = str(row.get(col_name, ''))
                 break
@@ -265,32 +460,29 @@ class SmartSchemaAnalyzer:
             'compliance_score': 0.0
         }
         
-        # Detect field name
-        field_name_lower = field_name.lower()
+        # Label the field name by its tokens
+        name_labels = self.name_classifier.classify(field_name)
         
         # Check for primary key
-        pk_keywords = ['id', 'key', 'pk', 'primary', '_id', 'identifier']
-        if any(keyword in field_name_lower for keyword in pk_keywords):
+        if 'primary_key' in name_labels:
             field_info['is_primary_key'] = True
             field_info['ndmo_standards'].append('DG001')  # Unique Identifiers
         
         # Check for foreign keys
-        fk_keywords = ['foreign', 'fk', 'reference', 'ref', '_ref', '_fk']
-        if any(keyword in field_name_lower for keyword in fk_keywords):
+        if 'foreign_key' in name_labels:
             field_info['is_foreign_key'] = True
             field_info['ndmo_standards'].append('BR002')  # Data Relationships
         
         # Check for audit trail fields
-        audit_keywords = ['created', 'updated', 'modified', 'deleted', 'timestamp', 'date', 'user', 'audit', 'by', 'at', 'on']
-        if any(keyword in field_name_lower for keyword in audit_keywords):
+        if 'audit' in name_labels:
             field_info['is_audit_field'] = True
             field_info['ndmo_standards'].append('DS004')  # Audit Trail
         
         # Detect data type from field name or row data
-        detected_type = self._detect_data_type_from_name(field_name_lower)
+        detected_type = self._detect_data_type_from_name(field_name)
         
         # Try to get type from columns
-        for type_col_name in ['Type', 'Data Type', 'DataType', 'Field Type']:
+        for type_col_name in FIELD_TYPE_COLUMNS:
             if type_col_name in columns:
                 type_value = str(row.get(type_col_name, '')).lower()
                 if type_value:
@@ -308,7 +500,7 @@ class SmartSchemaAnalyzer:
             field_info['ndmo_standards'].append('DQ006')  # Data Timeliness
         
         # Check if required
-        for req_col_name in ['Required', 'Mandatory', 'Nullable']:
+        for req_col_name in FIELD_REQUIRED_COLUMNS:
             if req_col_name in columns:
                 req_value = str(row.get(req_col_name, '')).lower()
                 if req_value in ['yes', 'true', '1', 'y', 'required', 'mandatory']:
@@ -318,27 +510,45 @@ class SmartSchemaAnalyzer:
                     field_info['is_required'] = False
                 break
         
+        # Declared value constraints (checked against the data by quality_checks)
+        field_info['constraints'] = self._field_constraints(row, columns)
+        
         # Calculate compliance score for this field
         field_info['compliance_score'] = self._calculate_field_compliance_score(field_info)
         
         return field_info
     
+    def _field_constraints(self, row, columns):
+        """Constraints declared in the data dictionary row, as {'type': ..., 'value': ...} entries"""
+        constraints = []
+        for constraint_type, candidates in FIELD_CONSTRAINT_COLUMNS.items():
+            for col_name in candidates:
+                if col_name not in columns:
+                    continue
+                raw_value = row.get(col_name)
+                if raw_value is None or pd.isna(raw_value) or not str(raw_value).strip():
+                    break
+                if constraint_type == 'allowed_values':
+                    value = [item.strip() for item in re.split(r'[,;|]', str(raw_value)) if item.strip()]
+                elif constraint_type == 'pattern':
+                    value = str(raw_value).strip()
+                    try:
+                        re.compile(value)
+                    except re.error:
+                        print(f"Warning: Ignoring invalid pattern {value!r}")
+                        break
+                else:
+                    value = pd.to_numeric(raw_value, errors='coerce')
+                    if pd.isna(value):
+                        break
+                    value = float(value)
+                constraints.append({'type': constraint_type, 'value': value})
+                break
+        return constraints
+    
     def _detect_data_type_from_name(self, field_name):
         """Detect data type from field name"""
-        field_name = field_name.lower()
-        
-        if any(t in field_name for t in ['email', 'mail', 'e-mail']):
-            return 'Email'
-        elif any(t in field_name for t in ['phone', 'mobile', 'tel', 'telephone']):
-            return 'Phone'
-        elif any(t in field_name for t in ['date', 'time', 'datetime', 'timestamp', 'created', 'updated', 'modified']):
-            return 'DateTime'
-        elif any(t in field_name for t in ['id', 'number', 'num', 'count', 'quantity', 'amount', 'price', 'cost']):
-            return 'Numeric'
-        elif any(t in field_name for t in ['flag', 'is_', 'has_', 'active', 'enabled', 'status']):
-            return 'Boolean'
-        else:
-            return 'Text'
+        return self.name_classifier.type_hint(field_name)
     
     def _calculate_field_compliance_score(self, field_info):
         """Calculate NDMO compliance score for a field"""
@@ -368,14 +578,30 @@ class SmartSchemaAnalyzer:
         return score / max_score if max_score > 0 else 0.0
     
     def _analyze_columns(self, df):
-        """Analyze all columns in the dataframe - CRITICAL: Analyze ALL columns"""
+        """Analyze all columns in the dataframe - CRITICAL: Analyze ALL columns
+        
+        Null counts, distinct counts and dtype classes are computed for the whole
+        frame at once; only the per-column entries are built in Python.
+        """
         column_analysis = []
+        if len(df.columns) == 0:
+            return column_analysis
+        
+        # Positional labels so duplicate column names are profiled separately
+        frame = df.set_axis(range(len(df.columns)), axis=1)
+        total_count = len(frame)
         
-        # Get all columns from the dataframe
-        all_columns = list(df.columns)
+        notna = frame.notna().to_numpy()
+        non_null_counts = notna.sum(axis=0)
+        unique_counts = self._distinct_counts(frame, non_null_counts)
         
-        # Analyze each column - iterate through ALL columns
-        for col_idx, col in enumerate(all_columns):
+        dtypes = frame.dtypes.tolist()
+        # Semantic types from a bounded sample of each column
+        inferences = infer_frame_types(frame)
+        # Content hashes let a later upload reuse unchanged columns
+        fingerprints = column_fingerprints(frame)
+        
+        for col_idx, col in enumerate(df.columns):
             try:
                 # Get column name
                 if isinstance(col, (int, float)):
@@ -383,86 +609,23 @@ class SmartSchemaAnalyzer:
                 else:
                     col_name = str(col).strip() if col else f'Column_{col_idx+1}'
                 
-                # Get column data - ensure we get the data
-                try:
-                    if col in df.columns:
-                        col_data = df[col]
-                    elif col_idx < len(df.columns):
-                        col_data = df.iloc[:, col_idx]
-                    else:
-                        # Column doesn't exist - create empty series
-                        col_data = pd.Series([None] * len(df), name=col_name, dtype=object)
-                except Exception as e_col:
-                    # Create empty series if column doesn't exist
-                    col_data = pd.Series([None] * len(df), name=col_name, dtype=object)
-                
-                # Analyze even if column is empty - we still want to record it
-                # Calculate basic stats
-                total_count = len(col_data) if len(col_data) > 0 else len(df)
-                non_null_count = int(col_data.notna().sum()) if len(col_data) > 0 else 0
-                null_count = int(col_data.isna().sum()) if len(col_data) > 0 else total_count
-                unique_count = int(col_data.nunique()) if non_null_count > 0 else 0
-                
-                # Calculate completeness
-                completeness = (non_null_count / total_count * 100) if total_count > 0 else 0.0
-                
-                # Calculate uniqueness
-                uniqueness = (unique_count / non_null_count * 100) if non_null_count > 0 else 0.0
-                
-                # Detect data type
-                detected_type = 'Unknown'
-                if non_null_count > 0:
-                    try:
-                        sample_values = col_data.dropna().head(10)
-                        detected_type = self._detect_data_type_from_name(col_name.lower())
-                        # Try to detect from actual values
-                        if len(sample_values) > 0:
-                            first_val = sample_values.iloc[0] if hasattr(sample_values, 'iloc') else sample_values[0]
-                            if pd.api.types.is_numeric_dtype(col_data):
-                                detected_type = 'Numeric'
-                            elif pd.api.types.is_datetime64_any_dtype(col_data):
-                                detected_type = 'DateTime'
-                            elif isinstance(first_val, str) and '@' in str(first_val):
-                                detected_type = 'Email'
-                            elif isinstance(first_val, str) and any(c.isdigit() for c in str(first_val)) and len(str(first_val)) >= 10:
-                                detected_type = 'Phone'
-                    except:
-                        detected_type = self._detect_data_type_from_name(col_name.lower())
-                else:
-                    # Empty column - detect from name
-                    detected_type = self._detect_data_type_from_name(col_name.lower())
-                
-                # Build column info
-                col_info = {
-                    'column_name': col_name,
-                    'data_type': str(col_data.dtype) if len(col_data) > 0 else 'Unknown',
-                    'non_null_count': non_null_count,
-                    'null_count': null_count,
-                    'unique_count': unique_count,
-                    'total_count': total_count,
-                    'completeness': completeness,
-                    'uniqueness': uniqueness,
-                    'detected_type': detected_type,
-                    'is_primary_key': False,
-                    'is_audit_field': False,
-                    'ndmo_standards': []
-                }
+                non_null_count = int(non_null_counts[col_idx])
                 
-                # Check for primary key
-                col_info['is_primary_key'] = any(kw in col_name.lower() for kw in ['id', 'key', 'pk', 'primary', '_id', 'serial'])
+                # Detect data type (empty columns fall back to the name)
+                inference = inferences[col_idx] if non_null_count > 0 else None
+                detected_type = self._detect_column_type(col_name, inference)
                 
-                # Check for audit fields
-                col_info['is_audit_field'] = any(kw in col_name.lower() for kw in ['created', 'updated', 'modified', 'deleted', 'timestamp', 'date', 'user', 'audit', 'created_by', 'updated_by', 'modified_by'])
-                
-                # NDMO standards applicable
-                if col_info['is_primary_key']:
-                    col_info['ndmo_standards'].append('DG001')
-                if col_info['is_audit_field']:
-                    col_info['ndmo_standards'].append('DS004')
-                if col_info['completeness'] < 100:
-                    col_info['ndmo_standards'].append('DQ001')
-                if col_info['uniqueness'] < 100 and not col_info['is_primary_key']:
-                    col_info['ndmo_standards'].append('DQ004')
+                col_info = self._build_column_info(
+                    col_name,
+                    str(dtypes[col_idx]) if total_count > 0 else 'Unknown',
+                    non_null_count,
+                    total_count - non_null_count,
+                    int(unique_counts[col_idx]) if non_null_count > 0 else 0,
+                    total_count,
+                    detected_type,
+                    inference
+                )
+                col_info['fingerprint'] = fingerprints[col_idx]
                 
                 column_analysis.append(col_info)
             except Exception as e:
@@ -472,6 +635,100 @@ class SmartSchemaAnalyzer:
         
         return column_analysis
     
+    def _distinct_counts(self, frame, non_null_counts):
+        """Count distinct non-null values for every column of a positionally labelled frame
+        
+        Numeric and datetime columns are counted per dtype group with one 2-D sort;
+        other columns fall back to pandas' hash-based nunique.
+        """
+        import numpy as np
+        
+        counts = np.zeros(len(frame.columns), dtype=np.int64)
+        if len(frame) == 0:
+            return counts
+        null_counts = len(frame) - non_null_counts
+        
+        groups = {}
+        for position, dtype in enumerate(frame.dtypes):
+            groups.setdefault(dtype, []).append(position)
+        
+        fallback = []
+        for dtype, positions in groups.items():
+            if not isinstance(dtype, np.dtype) or dtype.kind not in 'biufMm':
+                fallback.extend(positions)
+                continue
+            values = frame.iloc[:, positions].to_numpy(dtype=dtype)
+            if dtype.kind in 'Mm':
+                # NaT becomes the smallest int64 and sorts as one value
+                values = values.view('i8')
+            values = np.sort(values, axis=0)
+            changes = np.count_nonzero(values[1:] != values[:-1], axis=0)
+            nulls = null_counts[positions]
+            if dtype.kind == 'f':
+                # NaNs sort last and compare unequal to each other
+                counts[positions] = 1 + changes - nulls
+            else:
+                counts[positions] = 1 + changes - (nulls > 0)
+        
+        if fallback:
+            counts[fallback] = frame.iloc[:, fallback].nunique(dropna=True).to_numpy()
+        return counts
+    
+    def _detect_column_type(self, col_name, inference):
+        """Pick a column's semantic type from sampled-value inference, falling back to its name"""
+        name_type = self._detect_data_type_from_name(col_name)
+        if not inference or inference.get('type') is None:
+            return name_type
+        if inference['type'] == 'Text' and name_type != 'Text':
+            # Free text values give no type signal; keep the name's hint
+            return name_type
+        return inference['type']
+    
+    def _build_column_info(self, col_name, data_type, non_null_count, null_count, unique_count, total_count, detected_type, inference=None):
+        """Build the column_analysis entry for one column from its statistics"""
+        # Calculate completeness
+        completeness = (non_null_count / total_count * 100) if total_count > 0 else 0.0
+        
+        # Calculate uniqueness
+        uniqueness = (unique_count / non_null_count * 100) if non_null_count > 0 else 0.0
+        
+        col_info = {
+            'column_name': col_name,
+            'data_type': data_type,
+            'non_null_count': non_null_count,
+            'null_count': null_count,
+            'unique_count': unique_count,
+            'total_count': total_count,
+            'completeness': completeness,
+            'uniqueness': uniqueness,
+            'detected_type': detected_type,
+            'type_confidence': inference['confidence'] if inference else 0.0,
+            'type_distribution': inference['distribution'] if inference else {},
+            'is_primary_key': False,
+            'is_audit_field': False,
+            'ndmo_standards': []
+        }
+        
+        name_labels = self.name_classifier.classify(col_name)
+        
+        # Check for primary key
+        col_info['is_primary_key'] = 'primary_key' in name_labels
+        
+        # Check for audit fields
+        col_info['is_audit_field'] = 'audit' in name_labels
+        
+        # NDMO standards applicable
+        if col_info['is_primary_key']:
+            col_info['ndmo_standards'].append('DG001')
+        if col_info['is_audit_field']:
+            col_info['ndmo_standards'].append('DS004')
+        if col_info['completeness'] < 100:
+            col_info['ndmo_standards'].append('DQ001')
+        if col_info['uniqueness'] < 100 and not col_info['is_primary_key']:
+            col_info['ndmo_standards'].append('DQ004')
+        
+        return col_info
+    
     def _calculate_ndmo_compliance_per_column(self, analysis):
         """Calculate NDMO compliance for each column"""
         compliance = {}
@@ -582,7 +839,195 @@ class SmartSchemaAnalyzer:
         
         return issues
     
+    def analyze_workbook(self, schema_file_path, max_workers=None):
+        """Analyze every sheet of a workbook (one table per sheet) concurrently
+        
+        Sheets are profiled in a process pool, largest first, so the total time
+        tracks the largest sheet rather than the sum of all sheets. Returns the
+        per-table analyses plus a workbook-level summary.
+        """
+        return self._cached(
+            schema_file_path, 'schema_workbook',
+            lambda: self._analyze_workbook_uncached(schema_file_path, max_workers)
+        )
+    
+    def _analyze_workbook_uncached(self, schema_file_path, max_workers=None):
+        if not os.path.exists(schema_file_path):
+            return {'error': f'Schema file not found: {schema_file_path}'}
+        if os.path.getsize(schema_file_path) == 0:
+            return {'error': 'Schema file is empty'}
+        if detect_format(schema_file_path) != 'excel':
+            return {'error': 'Only Excel workbooks have multiple sheets; analyze this file as a single schema.'}
+        
+        try:
+            sheets = list_sheets(schema_file_path)
+        except Exception as e:
+            return {'error': f'Cannot read Excel file. File may be corrupted or in wrong format. Error: {str(e)}'}
+        if not sheets:
+            return {'error': 'Workbook has no worksheets.'}
+        
+        # Largest sheets first so the longest task starts immediately
+        sheet_names = [name for name, size in sorted(sheets, key=lambda item: item[1], reverse=True)]
+        workers = min(len(sheet_names), max_workers or os.cpu_count() or 1)
+        tasks = [(schema_file_path, name, self.memory_budget_mb, self.name_keywords) for name in sheet_names]
+        
+        results = None
+        if workers > 1:
+            try:
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = dict(zip(sheet_names, executor.map(_analyze_sheet, tasks)))
+            except Exception as e:
+                print(f"Warning: Parallel sheet analysis failed, analyzing sequentially: {str(e)}")
+        if results is None:
+            results = {name: _analyze_sheet(task) for name, task in zip(sheet_names, tasks)}
+        
+        # Keep the workbook's sheet order
+        tables = {}
+        errors = {}
+        for name, size in sheets:
+            analysis = results[name]
+            if 'error' in analysis:
+                errors[name] = analysis['error']
+            else:
+                tables[name] = analysis
+        
+        workbook = {
+            'timestamp': datetime.now().isoformat(),
+            'file_name': os.path.basename(schema_file_path),
+            'sheet_count': len(sheets),
+            'tables': tables,
+            'errors': errors,
+            'table_summaries': [self._summarize_table(name, analysis) for name, analysis in tables.items()],
+            'summary': self._summarize_workbook(tables)
+        }
+        self.workbook_results = workbook
+        return workbook
+    
+    def _summarize_table(self, sheet_name, analysis):
+        """One row of the workbook summary for a single table"""
+        scores = [info.get('score', 0.0) for info in analysis.get('ndmo_compliance', {}).values()]
+        return {
+            'sheet_name': sheet_name,
+            'total_fields': analysis.get('total_fields', 0),
+            'total_columns': analysis.get('total_columns', 0),
+            'has_primary_key': analysis.get('has_primary_key', False),
+            'has_audit_trail': analysis.get('has_audit_trail', False),
+            'compliance_score': sum(scores) / len(scores) * 100 if scores else 0.0,
+            'issue_count': len(analysis.get('issues', [])),
+            'profiling_mode': analysis.get('profiling_mode', 'in_memory')
+        }
+    
+    def _summarize_workbook(self, tables):
+        """Totals across all analyzed tables"""
+        total_columns = 0
+        compliant_columns = 0
+        for analysis in tables.values():
+            compliance = analysis.get('ndmo_compliance', {})
+            total_columns += len(compliance)
+            compliant_columns += sum(1 for info in compliance.values() if info.get('score', 0) >= 0.7)
+        return {
+            'total_tables': len(tables),
+            'total_fields': sum(analysis.get('total_fields', 0) for analysis in tables.values()),
+            'total_columns': total_columns,
+            'compliant_columns': compliant_columns,
+            'compliance_percentage': compliant_columns / total_columns * 100 if total_columns else 0.0,
+            'tables_without_primary_key': [name for name, analysis in tables.items() if not analysis.get('has_primary_key')],
+            'tables_without_audit_trail': [name for name, analysis in tables.items() if not analysis.get('has_audit_trail')],
+            'total_issues': sum(len(analysis.get('issues', [])) for analysis in tables.values())
+        }
+    
     def get_analysis_results(self):
         """Get stored analysis results"""
         return self.analysis_results
 
+def _column_keys(column_names):
+    """(name, occurrence) keys so duplicate column names are matched in order"""
+    seen = {}
+    keys = []
+    for name in column_names:
+        name = str(name)
+        keys.append((name, seen.get(name, 0)))
+        seen[name] = seen.get(name, 0) + 1
+    return keys
+
+def _average_score(analysis):
+    scores = [info.get('score', 0.0) for info in analysis.get('ndmo_compliance', {}).values()]
+    return sum(scores) / len(scores) * 100 if scores else 0.0
+
+def build_change_report(previous_analysis, analysis):
+    """Compare two analyses of a schema: added, removed and changed columns, score deltas and flag changes"""
+    previous_columns = dict(zip(
+        _column_keys(col['column_name'] for col in previous_analysis.get('column_analysis', [])),
+        previous_analysis.get('column_analysis', [])
+    ))
+    current_columns = dict(zip(
+        _column_keys(col['column_name'] for col in analysis.get('column_analysis', [])),
+        analysis.get('column_analysis', [])
+    ))
+    previous_compliance = previous_analysis.get('ndmo_compliance', {})
+    current_compliance = analysis.get('ndmo_compliance', {})
+    
+    added = [key[0] for key in current_columns if key not in previous_columns]
+    removed = [key[0] for key in previous_columns if key not in current_columns]
+    changed = []
+    score_deltas = []
+    for key, col_info in current_columns.items():
+        previous_col = previous_columns.get(key)
+        if previous_col is None:
+            continue
+        fingerprint = col_info.get('fingerprint')
+        # Columns without fingerprints (older analyses) cannot be shown unchanged
+        if fingerprint is not None and fingerprint == previous_col.get('fingerprint'):
+            continue
+        changed.append(key[0])
+        previous_score = previous_compliance.get(key[0], {}).get('score', 0.0)
+        current_score = current_compliance.get(key[0], {}).get('score', 0.0)
+        score_deltas.append({
+            'column_name': key[0],
+            'previous_score': previous_score,
+            'current_score': current_score,
+            'delta': current_score - previous_score
+        })
+    
+    flag_changes = {}
+    for flag in ('has_primary_key', 'has_foreign_keys', 'has_audit_trail'):
+        if previous_analysis.get(flag) != analysis.get(flag):
+            flag_changes[flag] = {'previous': previous_analysis.get(flag), 'current': analysis.get(flag)}
+    
+    previous_issues = {issue.get('issue') for issue in previous_analysis.get('issues', [])}
+    current_issues = {issue.get('issue') for issue in analysis.get('issues', [])}
+    
+    return {
+        'previous_timestamp': previous_analysis.get('timestamp'),
+        'added_columns': added,
+        'removed_columns': removed,
+        'changed_columns': changed,
+        'unchanged_count': len(current_columns) - len(added) - len(changed),
+        'score_deltas': score_deltas,
+        'compliance_delta': _average_score(analysis) - _average_score(previous_analysis),
+        'flag_changes': flag_changes,
+        'new_issues': sorted(current_issues - previous_issues),
+        'resolved_issues': sorted(previous_issues - current_issues)
+    }
+
+def list_sheets(schema_file_path):
+    """Return [(sheet name, estimated cell count)] for every worksheet, in workbook order"""
+    try:
+        import openpyxl
+        wb = openpyxl.load_workbook(schema_file_path, read_only=True, data_only=True)
+    except Exception:
+        # Legacy formats: pandas lists the sheets, sizes are unknown
+        with pd.ExcelFile(schema_file_path) as excel:
+            return [(name, 0) for name in excel.sheet_names]
+    try:
+        return [(ws.title, (ws.max_row or 0) * (ws.max_column or 0)) for ws in wb.worksheets]
+    finally:
+        wb.close()
+
+def _analyze_sheet(task):
+    """Worker entry point: analyze one sheet in its own analyzer (picklable for process pools)"""
+    schema_file_path, sheet_name, memory_budget_mb, name_keywords = task
+    analyzer = SmartSchemaAnalyzer(memory_budget_mb=memory_budget_mb, name_keywords=name_keywords, use_cache=False)
+    return analyzer.analyze_schema(schema_file_path, sheet_name=sheet_name)
+
@@ -0,0 +1,100 @@
+"""
+Stage Metrics
+Reusable instrumentation for multi-stage pipelines: wall time, CPU time,
+rows and cells per second, and growth of the process peak memory per named
+stage. A stage that runs many times (once per row block in chunked
+processing) accumulates its measurements.
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+BYTES_PER_MB = 1024 * 1024
+
+def peak_rss_bytes():
+    """Peak resident set size of this process in bytes, or None where unavailable (Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class StageProfiler:
+    """Per-stage measurements of a pipeline run
+
+    Mark stage boundaries with begin(name, rows, columns), which ends the
+    running stage, and end() after the last one; or wrap a block in
+    stage(name, rows, columns). count() adds rows a stage only learns as it
+    runs (e.g. loading).
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = {}
+        self._running = None
+
+    def begin(self, name, rows=0, columns=0):
+        self.end()
+        self._running = {
+            'name': name, 'rows': rows, 'columns': columns,
+            'wall': time.perf_counter(), 'cpu': time.process_time(), 'peak': peak_rss_bytes()
+        }
+
+    def count(self, rows, columns):
+        if self._running is not None:
+            self._running['rows'] += rows
+            self._running['columns'] = columns
+
+    def end(self):
+        if self._running is None:
+            return
+        running, self._running = self._running, None
+        name, rows, columns = running['name'], running['rows'], running['columns']
+        wall_start, cpu_start, peak_start = running['wall'], running['cpu'], running['peak']
+        wall = time.perf_counter() - wall_start
+        record = self.stages.get(name)
+        if record is None:
+            record = self.stages[name] = {
+                'stage': name,
+                'start_s': wall_start - self.started,
+                'wall_s': 0.0,
+                'cpu_s': 0.0,
+                'runs': 0,
+                'rows': 0,
+                'cells': 0,
+                'peak_memory_delta_mb': None
+            }
+        record['wall_s'] += wall
+        record['cpu_s'] += time.process_time() - cpu_start
+        record['runs'] += 1
+        record['rows'] += int(rows)
+        record['cells'] += int(rows) * int(columns)
+        peak_end = peak_rss_bytes()
+        if peak_start is not None and peak_end is not None:
+            # Growth of the process high-water mark; 0 when the stage stayed below an earlier peak
+            record['peak_memory_delta_mb'] = (record['peak_memory_delta_mb'] or 0.0) + (peak_end - peak_start) / BYTES_PER_MB
+        record['rows_per_s'] = record['rows'] / record['wall_s'] if record['wall_s'] > 0 else None
+        record['cells_per_s'] = record['cells'] / record['wall_s'] if record['wall_s'] > 0 else None
+
+    @contextmanager
+    def stage(self, name, rows=0, columns=0):
+        self.begin(name, rows, columns)
+        try:
+            yield
+        finally:
+            self.end()
+
+    def record(self, name):
+        record = self.stages.get(name)
+        return dict(record) if record else None
+
+    def report(self):
+        """Stage records in start order with the run's total wall and CPU time"""
+        stages = sorted((dict(record) for record in self.stages.values()), key=lambda record: record['start_s'])
+        return {
+            'stages': stages,
+            'total_wall_s': sum(record['wall_s'] for record in stages),
+            'total_cpu_s': sum(record['cpu_s'] for record in stages)
+        }
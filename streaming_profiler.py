@@ -0,0 +1,214 @@
+"""
+Streaming Column Profiler
+Profiles very large Excel sheets row block by row block with openpyxl read-only
+mode, keeping per-column statistics instead of materializing a DataFrame
+"""
+import pandas as pd
+from datetime import date, datetime, time
+from column_sketches import ColumnFingerprint, ColumnSketch
+from type_inference import Reservoir
+
+DEFAULT_BLOCK_SIZE = 5000
+
+# Rough in-memory cost of one cell in an object-dtype DataFrame (pointer + boxed value)
+BYTES_PER_CELL = 80
+
+# Uncompressed-to-file size ratio assumed when a sheet has no dimension record
+XLSX_EXPANSION_RATIO = 10
+
+# dtype name pandas gives all-text columns ('object', or 'str' with the string dtype)
+TEXT_DTYPE = str(pd.Series(['']).dtype)
+
+def _value_kind(value):
+    """Classify a cell value the way pandas would infer its column dtype"""
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, int):
+        return 'int'
+    if isinstance(value, float):
+        return 'float'
+    if isinstance(value, (datetime, date)):
+        return 'datetime'
+    if isinstance(value, time):
+        return 'time'
+    return 'text'
+
+class ColumnStats:
+    """Running statistics for one column"""
+
+    def __init__(self, name):
+        self.name = name
+        self.total_count = 0
+        self.non_null_count = 0
+        self.type_votes = {}
+        self.min_value = None
+        self.max_value = None
+        self.sample = Reservoir()
+        self.sketch = ColumnSketch(name)
+        self.fingerprint = ColumnFingerprint()
+
+    def update(self, values):
+        """Fold one block of cell values into the running statistics"""
+        self.total_count += len(values)
+        mask = [v is not None and v != '' for v in values]
+        present = [v for v, is_present in zip(values, mask) if is_present]
+        if not present:
+            if self.fingerprint is not None:
+                self.fingerprint.update(mask, [])
+            return
+        self.non_null_count += len(present)
+        self.sample.update(present)
+
+        votes = self.type_votes
+        for value in present:
+            kind = _value_kind(value)
+            votes[kind] = votes.get(kind, 0) + 1
+
+        numbers = [v for v in present if isinstance(v, (int, float)) and not isinstance(v, bool)]
+        self.update_bounds(numbers or [v for v in present if isinstance(v, datetime)], numbers=bool(numbers))
+
+        hashes = self.sketch.update(values, present=present)
+        if self.fingerprint is not None:
+            self.fingerprint.update(mask, hashes)
+
+    def update_bounds(self, candidates, numbers):
+        """Min/max track numbers, or datetimes for columns without any numbers"""
+        if not candidates:
+            return
+        block_min, block_max = min(candidates), max(candidates)
+        if self.min_value is None or (numbers and isinstance(self.min_value, datetime)):
+            self.min_value, self.max_value = block_min, block_max
+        elif isinstance(self.min_value, datetime) == isinstance(block_min, datetime):
+            self.min_value = min(self.min_value, block_min)
+            self.max_value = max(self.max_value, block_max)
+
+    def merge(self, other):
+        """Combine statistics profiled separately (other chunks, sheets or processes)"""
+        self.total_count += other.total_count
+        self.non_null_count += other.non_null_count
+        self.sample.merge(other.sample)
+        for kind, votes in other.type_votes.items():
+            self.type_votes[kind] = self.type_votes.get(kind, 0) + votes
+        for value in (other.min_value, other.max_value):
+            if value is not None:
+                self.update_bounds([value], numbers=not isinstance(value, datetime))
+        self.sketch.merge(other.sketch)
+        # Content fingerprints are order-sensitive and cannot be merged
+        self.fingerprint = None
+        return self
+
+    @property
+    def null_count(self):
+        return self.total_count - self.non_null_count
+
+    @property
+    def distinct_count(self):
+        return self.sketch.distinct_count
+
+    @property
+    def dtype(self):
+        """pandas-style dtype name the column would get if fully loaded"""
+        kinds = set(self.type_votes)
+        if not kinds:
+            return 'object'
+        if kinds <= {'int', 'float'}:
+            if kinds == {'int'} and self.null_count == 0:
+                return 'int64'
+            return 'float64'
+        if kinds == {'datetime'}:
+            return 'datetime64[ns]'
+        if kinds == {'bool'} and self.null_count == 0:
+            return 'bool'
+        if kinds == {'text'}:
+            return TEXT_DTYPE
+        return 'object'
+
+def estimate_sheet_memory(file_path, sheet_name=None):
+    """Estimate the in-memory DataFrame size of a sheet (the active one by default) in bytes"""
+    import os
+    import openpyxl
+
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.active
+        rows, cols = ws.max_row, ws.max_column
+    finally:
+        wb.close()
+    if rows and cols:
+        return rows * cols * BYTES_PER_CELL
+    return os.path.getsize(file_path) * XLSX_EXPANSION_RATIO
+
+def iter_row_blocks(rows, block_size=DEFAULT_BLOCK_SIZE):
+    """Group a row iterator into lists of at most block_size rows"""
+    block = []
+    for row in rows:
+        block.append(row)
+        if len(block) >= block_size:
+            yield block
+            block = []
+    if block:
+        yield block
+
+def profile_excel_streaming(file_path, block_size=DEFAULT_BLOCK_SIZE, on_block=None, sheet_name=None):
+    """Profile a sheet (the active one by default) without loading it into memory
+
+    Returns (column_names, column_stats, row_count). on_block, if given, is
+    called with (column_names, block) for every block of data rows so callers
+    can derive additional per-row results from the same pass.
+    """
+    import openpyxl
+
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.active
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        width = max(ws.max_column or 0, len(header))
+        column_names = []
+        stats = []
+
+        def grow(new_width):
+            for col_idx in range(len(column_names) + 1, new_width + 1):
+                cell_value = header[col_idx - 1] if col_idx <= len(header) else None
+                if cell_value is not None and str(cell_value).strip():
+                    name = str(cell_value).strip()
+                else:
+                    name = f'Column_{col_idx}'
+                column_names.append(name)
+                column = ColumnStats(name)
+                # Rows seen before the column appeared were empty in it
+                if stats and stats[0].total_count:
+                    column.update((None,) * stats[0].total_count)
+                stats.append(column)
+
+        grow(width)
+        row_count = 0
+        pending_empty = 0
+        for block in iter_row_blocks(rows, block_size):
+            block_width = max(len(row) for row in block)
+            if block_width > len(column_names):
+                grow(block_width)
+            width = len(column_names)
+            block = [tuple(row) + (None,) * (width - len(row)) for row in block]
+
+            # Trailing empty rows (formatting only) are not data; hold them back
+            # until a later non-empty row proves they were inside the data range
+            non_empty = [i for i, row in enumerate(block) if any(v is not None and v != '' for v in row)]
+            if not non_empty:
+                pending_empty += len(block)
+                continue
+            last = non_empty[-1] + 1
+            if pending_empty:
+                block = [(None,) * width] * pending_empty + block
+                last += pending_empty
+            pending_empty = len(block) - last
+            block = block[:last]
+
+            for column, values in zip(stats, zip(*block)):
+                column.update(values)
+            row_count += len(block)
+            if on_block is not None:
+                on_block(column_names, block)
+        return column_names, stats, row_count
+    finally:
+        wb.close()
@@ -0,0 +1,441 @@
+"""
+Declarative Template Engine
+Compiles declarative template definitions (sections, field tables, checklists,
+signature blocks) into reusable ReportLab layouts that are filled with data at
+render time
+"""
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from datetime import datetime
+import os
+
+# Registered template definitions by name
+TEMPLATE_DEFINITIONS = {}
+
+# Compiled templates by name, built once per process
+_COMPILED_TEMPLATES = {}
+
+DEFAULT_BLANK = '_________________________________'
+
+ALIGNMENTS = {
+    'center': TA_CENTER,
+    'left': TA_LEFT,
+    'right': TA_RIGHT
+}
+
+DEFAULT_PAGE = {
+    'pagesize': A4,
+    'margins': None,  # None keeps ReportLab's default margins
+    'header_footer': None,  # 'unified', 'professional' or a callable(canvas, doc, logo_path, classification)
+    'classification': "RESTRICTED - INTERNAL",
+    'logo_path': "logo@3x.png",
+    'page_numbers': True  # 'professional' footers only
+}
+
+DEFAULT_STYLES = {
+    'title': {'parent': 'Heading1', 'fontSize': 16, 'textColor': '#1f77b4', 'spaceAfter': 30, 'alignment': 'center'},
+    'heading': {'parent': 'Heading2', 'fontSize': 12, 'textColor': '#2c3e50', 'spaceAfter': 12, 'spaceBefore': 12},
+    'normal': {'parent': 'Normal'}
+}
+
+DEFAULT_TABLE_STYLE = {
+    'font_size': 10,
+    'padding': 8,
+    'grid_width': 1,
+    'grid_color': 'grey',
+    'label_background': '#ecf0f1',
+    'header_background': '#34495e',
+    'header_text_color': 'whitesmoke',
+    'side_padding': None,  # None keeps ReportLab's default left/right padding
+    'valign': None
+}
+
+# House look of the NDMO forms: light grid, shaded label cells, white-on-slate header rows
+FORM_TABLE_STYLE = {
+    'font_size': 11,
+    'padding': 10,
+    'side_padding': 8,
+    'valign': 'MIDDLE',
+    'grid_width': 0.5,
+    'grid_color': '#dee2e6',
+    'label_background': '#f8f9fa',
+    'header_background': '#34495e',
+    'header_text_color': 'white'
+}
+
+# Paragraph styles of the filled-in form PDFs
+FORM_STYLES = {
+    'title': {'fontSize': 18, 'spaceAfter': 15, 'leading': 20, 'fontName': 'Helvetica-Bold'},
+    'heading': {'fontSize': 13, 'spaceAfter': 8, 'spaceBefore': 12, 'fontName': 'Helvetica-Bold',
+                'backColor': '#ecf0f1', 'borderPadding': 8},
+    'cell': {'parent': 'Normal', 'fontSize': 11, 'leading': 14, 'wordWrap': 'CJK'}
+}
+
+# Paragraph styles of the blank templates
+TEMPLATE_STYLES = {
+    'title': {'fontSize': 18, 'spaceAfter': 20, 'fontName': 'Helvetica-Bold'},
+    'heading': {'fontSize': 13, 'spaceAfter': 10, 'spaceBefore': 15, 'fontName': 'Helvetica-Bold',
+                'backColor': '#ecf0f1', 'borderPadding': 8},
+    'cell': {'parent': 'Normal', 'fontSize': 10, 'leading': 14, 'wordWrap': 'CJK'}
+}
+
+def sentences(text, limit):
+    """First sentences of a text, one string each, for a 'paragraphs' block"""
+    return [part.strip() + ('.' if not part.endswith('.') else '') for part in (text or '').split('. ')[:limit] if part.strip()]
+
+def classification_banner(width=7.1, font_size=11, padding=8, spacer_after=0.15):
+    """Banner block stating the document classification"""
+    return {'type': 'banner', 'text': "CLASSIFICATION: {classification}", 'col_widths': [width],
+            'table_style': {'font_size': font_size, 'padding': padding}, 'spacer_after': spacer_after}
+
+class _FormatDict(dict):
+    """Format mapping that renders unknown placeholders as empty strings"""
+
+    def __missing__(self, key):
+        return ''
+
+def _color(value):
+    if value is None or not isinstance(value, str):
+        return value
+    if value.startswith('#'):
+        return colors.HexColor(value)
+    return getattr(colors, value)
+
+def _fill(text, data):
+    if not isinstance(text, str) or '{' not in text:
+        return text
+    return text.format_map(data)
+
+def register_template(name, definition):
+    """Register (or replace) a declarative template definition"""
+    TEMPLATE_DEFINITIONS[name] = definition
+    _COMPILED_TEMPLATES.pop(name, None)
+
+def get_compiled_template(name):
+    """Return the compiled layout for a registered template, compiling it on first use"""
+    compiled = _COMPILED_TEMPLATES.get(name)
+    if compiled is None:
+        if name not in TEMPLATE_DEFINITIONS:
+            raise KeyError(f"Unknown template: {name}")
+        compiled = CompiledTemplate(name, TEMPLATE_DEFINITIONS[name])
+        _COMPILED_TEMPLATES[name] = compiled
+    return compiled
+
+def render_template(name, filename, data=None):
+    """Render a registered template to a PDF file and return the filename"""
+    return get_compiled_template(name).render(filename, data)
+
+class CompiledTemplate:
+    """A template definition compiled into reusable styles and table layouts"""
+
+    def __init__(self, name, definition):
+        self.name = name
+        self.page = dict(DEFAULT_PAGE, **definition.get('page', {}))
+        self.table_defaults = dict(DEFAULT_TABLE_STYLE, **definition.get('table_style', {}))
+        self.styles = self._compile_styles(definition.get('styles', {}))
+        self.blocks = [self._compile_block(block) for block in definition.get('blocks', [])]
+
+    def _compile_styles(self, overrides):
+        base = getSampleStyleSheet()
+        compiled = {}
+        for style_name in set(DEFAULT_STYLES) | set(overrides):
+            spec = dict(DEFAULT_STYLES.get(style_name, {'parent': 'Normal'}), **overrides.get(style_name, {}))
+            parent = base[spec.pop('parent', 'Normal')]
+            if 'alignment' in spec:
+                spec['alignment'] = ALIGNMENTS.get(spec['alignment'], spec['alignment'])
+            for color_key in ('textColor', 'backColor'):
+                if color_key in spec:
+                    spec[color_key] = _color(spec[color_key])
+            compiled[style_name] = ParagraphStyle(f"{self.name}_{style_name}", parent=parent, **spec)
+        return compiled
+
+    def _table_commands(self, block, header=False, label_rows=None):
+        """Precompute the TableStyle commands for a table block
+
+        label_rows lists the rows whose first cell is a label; None means the
+        block's label_columns (default: the first) are label columns, unless the
+        table has a header row.
+        """
+        opts = dict(self.table_defaults, **block.get('table_style', {}))
+        commands = []
+        if header:
+            commands += [
+                ('BACKGROUND', (0, 0), (-1, 0), _color(opts['header_background'])),
+                ('TEXTCOLOR', (0, 0), (-1, 0), _color(opts['header_text_color'])),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold')
+            ]
+            label_cells = []
+        elif label_rows is None:
+            label_cells = [((column, 0), (column, -1)) for column in block.get('label_columns', [0])]
+        else:
+            label_cells = [((0, row), (0, row)) for row in label_rows]
+
+        if block.get('label_shading', True):
+            commands += [('BACKGROUND', start, end, _color(opts['label_background'])) for start, end in label_cells]
+        if not header:
+            commands.append(('TEXTCOLOR', (0, 0), (-1, -1), colors.black))
+        commands.append(('ALIGN', (0, 0), (-1, -1), block.get('align', 'LEFT')))
+        commands += [('FONTNAME', start, end, 'Helvetica-Bold') for start, end in label_cells]
+        commands += [
+            ('FONTSIZE', (0, 0), (-1, -1), opts['font_size']),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), opts['padding']),
+            ('TOPPADDING', (0, 0), (-1, -1), opts['padding']),
+            ('GRID', (0, 0), (-1, -1), opts['grid_width'], _color(opts['grid_color']))
+        ]
+        if opts['side_padding'] is not None:
+            commands += [
+                ('LEFTPADDING', (0, 0), (-1, -1), opts['side_padding']),
+                ('RIGHTPADDING', (0, 0), (-1, -1), opts['side_padding'])
+            ]
+        if opts['valign']:
+            commands.append(('VALIGN', (0, 0), (-1, -1), opts['valign']))
+        commands += [tuple(cmd) for cmd in block.get('extra_style', [])]
+        return commands
+
+    def _compile_block(self, block):
+        kind = block['type']
+        # Blocks with 'when' are only rendered when data[when] is set
+        compiled = {'type': kind, 'when': block.get('when'), 'spacer_after': block.get('spacer_after', 0.3) * inch}
+        widths = block.get('col_widths')
+        if widths:
+            compiled['col_widths'] = [w * inch for w in widths]
+
+        if kind in ('title', 'heading', 'paragraph'):
+            compiled['text'] = block['text']
+            compiled['style'] = self.styles[block.get('style', 'normal' if kind == 'paragraph' else kind)]
+            compiled['spacer_after'] = block.get('spacer_after', 0.2 if kind == 'title' else 0) * inch
+        elif kind == 'spacer':
+            compiled['spacer_after'] = block.get('height', 0.2) * inch
+        elif kind == 'page_break':
+            compiled['spacer_after'] = 0
+        elif kind == 'banner':
+            # One bold, centred cell on a coloured band (e.g. the classification)
+            opts = dict(self.table_defaults, **block.get('table_style', {}))
+            compiled['text'] = block['text']
+            compiled['commands'] = [
+                ('BACKGROUND', (0, 0), (-1, -1), _color(block.get('background', '#e74c3c'))),
+                ('TEXTCOLOR', (0, 0), (-1, -1), _color(block.get('text_color', 'white'))),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), opts['font_size']),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('TOPPADDING', (0, 0), (-1, -1), opts['padding']),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), opts['padding'])
+            ]
+        elif kind == 'field_table':
+            # Rows of label and value cells; values are format strings, None is a blank line.
+            # A row may be {'when': key, 'cells': [...]} to show it only when data[key] is set,
+            # or the label/value pairs may come from data[rows_key] at render time.
+            compiled['rows'] = [
+                (row.get('when'), list(row['cells'])) if isinstance(row, dict) else (None, list(row))
+                for row in block.get('rows', [])
+            ]
+            compiled['rows_key'] = block.get('rows_key')
+            compiled['blank'] = block.get('blank', DEFAULT_BLANK)
+            compiled['label_columns'] = set(block.get('label_columns', [0]))
+            # Values filled from data wrap within their cell in this style
+            compiled['cell_style'] = self.styles[block['cell_style']] if block.get('cell_style') else None
+            compiled['commands'] = self._table_commands(block)
+        elif kind == 'grid_table':
+            # Header row plus static rows, or rows taken from data[rows_key] at render time
+            compiled['header'] = list(block['header'])
+            compiled['rows'] = [list(row) for row in block.get('rows', [])]
+            compiled['rows_key'] = block.get('rows_key')
+            compiled['row_fields'] = block.get('row_fields')
+            compiled['cell_style'] = self.styles[block['cell_style']] if block.get('cell_style') else None
+            compiled['commands'] = self._table_commands(block, header=True)
+        elif kind == 'checklist':
+            compiled['header'] = list(block.get('header', ['#', 'Check Item', 'Yes', 'No', 'N/A', 'Notes']))
+            compiled['items'] = list(block.get('items', []))
+            compiled['items_key'] = block.get('items_key')
+            # Unnumbered items appended after the numbered ones (e.g. per-specification checks)
+            compiled['extra_items_key'] = block.get('extra_items_key')
+            compiled['commands'] = self._table_commands(dict(block, align='CENTER'), header=True) + [
+                ('ALIGN', (1, 0), (1, -1), 'LEFT')
+            ]
+        elif kind == 'text_area':
+            # Labelled free-text areas, each spanning a number of blank lines
+            rows, label_rows = [], []
+            line = block.get('line', '')
+            for label, lines in block['areas']:
+                label_rows.append(len(rows))
+                rows.append([label, line])
+                rows.extend([['', line] for _ in range(max(lines, 1) - 1)])
+            compiled['rows'] = rows
+            commands = self._table_commands(block, label_rows=label_rows)
+            if block.get('span', False):
+                bounds = label_rows + [len(rows)]
+                commands += [('SPAN', (1, start), (1, end - 1)) for start, end in zip(bounds, bounds[1:])]
+            commands.append(('VALIGN', (0, 0), (-1, -1), 'TOP'))
+            compiled['commands'] = commands
+        elif kind == 'signature_block':
+            # Two label/value pairs per row: role and date
+            blank = block.get('blank', '_________________________')
+            compiled['rows'] = [[f"{role}:", blank, 'Date:', blank] for role in block['roles']]
+            compiled['commands'] = self._table_commands(dict(block, label_shading=block.get('label_shading', False)))
+        elif kind == 'paragraphs':
+            # One paragraph per string in data[key]; 'empty' is shown when there are none
+            compiled['key'] = block['key']
+            compiled['empty'] = block.get('empty')
+            compiled['style'] = self.styles[block.get('style', 'normal')]
+            compiled['spacer_after'] = block.get('spacer_after', 0) * inch
+        elif kind == 'repeat':
+            # Nested blocks rendered once per item of data[key], with the item's values in scope
+            compiled['key'] = block['key']
+            compiled['blocks'] = [self._compile_block(nested) for nested in block['blocks']]
+            compiled['spacer_after'] = block.get('spacer_after', 0) * inch
+        elif kind == 'image':
+            # Picture at the path in data[key] with a caption, or the 'missing' text without one
+            compiled['key'] = block['key']
+            compiled['width'] = block.get('width', 4) * inch
+            compiled['height'] = block.get('height', 3) * inch
+            compiled['caption'] = block.get('caption')
+            compiled['missing'] = block.get('missing', '')
+            compiled['style'] = self.styles[block.get('style', 'normal')]
+        else:
+            raise ValueError(f"Unknown template block type: {kind}")
+
+        return compiled
+
+    def _table(self, rows, block):
+        table = Table(rows, colWidths=block.get('col_widths'))
+        table.setStyle(TableStyle(block['commands']))
+        return table
+
+    def _cell(self, value, style):
+        return Paragraph(str(value), style) if style else str(value)
+
+    def _image(self, block, data):
+        path = data.get(block['key'])
+        if not path or not os.path.exists(path):
+            return [Paragraph(_fill(block['missing'], data), block['style'])]
+        try:
+            # Embed the normalized print variant rather than the raw upload
+            from image_pipeline import get_image_variant
+            image = Image(get_image_variant(path), width=block['width'], height=block['height'])
+        except Exception as e:
+            return [Paragraph(f"<i>Error loading image: {str(e)}</i>", block['style'])]
+        image.hAlign = 'CENTER'
+        flowables = [image]
+        if block['caption']:
+            flowables += [Spacer(1, 0.1 * inch), Paragraph(_fill(block['caption'], data), block['style'])]
+        return flowables
+
+    def _build_blocks(self, blocks, data):
+        story = []
+        for block in blocks:
+            if block['when'] and not data.get(block['when']):
+                continue
+            kind = block['type']
+            if kind in ('title', 'heading', 'paragraph'):
+                story.append(Paragraph(_fill(block['text'], data), block['style']))
+            elif kind == 'page_break':
+                story.append(PageBreak())
+            elif kind == 'banner':
+                story.append(self._table([[_fill(block['text'], data)]], block))
+            elif kind == 'field_table':
+                if block['rows_key']:
+                    # Label/value pairs supplied with the data are taken as they are
+                    rows = [[label, self._cell(value, block['cell_style'])] for label, value in data.get(block['rows_key']) or []]
+                else:
+                    rows = []
+                    for when, row in block['rows']:
+                        if when and not data.get(when):
+                            continue
+                        filled = []
+                        for column, cell in enumerate(row):
+                            if cell is None:
+                                filled.append(block['blank'])
+                            elif block['cell_style'] and column not in block['label_columns'] and isinstance(cell, str) and '{' in cell:
+                                filled.append(Paragraph(_fill(cell, data), block['cell_style']))
+                            else:
+                                filled.append(_fill(cell, data))
+                        rows.append(filled)
+                if not rows:
+                    continue
+                story.append(self._table(rows, block))
+            elif kind == 'grid_table':
+                rows = block['rows']
+                if block['rows_key']:
+                    fields = block['row_fields'] or []
+                    rows = [[self._cell(item.get(f, ''), block['cell_style']) for f in fields] for item in data.get(block['rows_key']) or []]
+                story.append(self._table([block['header']] + rows, block))
+            elif kind == 'checklist':
+                items = data.get(block['items_key']) if block['items_key'] else None
+                items = items or block['items']
+                rows = [[str(idx), item, '☐', '☐', '☐', ''] for idx, item in enumerate(items, 1)]
+                if block['extra_items_key']:
+                    rows += [['', item, '☐', '☐', '☐', ''] for item in data.get(block['extra_items_key']) or []]
+                story.append(self._table([block['header']] + rows, block))
+            elif kind in ('text_area', 'signature_block'):
+                story.append(self._table(block['rows'], block))
+            elif kind == 'paragraphs':
+                texts = data.get(block['key']) or ([block['empty']] if block['empty'] else [])
+                if not texts:
+                    continue
+                story += [Paragraph(text, block['style']) for text in texts]
+            elif kind == 'repeat':
+                for item in data.get(block['key']) or []:
+                    story += self._build_blocks(block['blocks'], _FormatDict(data, **item))
+            elif kind == 'image':
+                story += self._image(block, data)
+
+            if block['spacer_after']:
+                story.append(Spacer(1, block['spacer_after']))
+        return story
+
+    def build_story(self, data=None):
+        """Fill the compiled layout with data and return the flowables"""
+        data = _FormatDict(data or {})
+        data.setdefault('today', datetime.now().strftime("%Y-%m-%d"))
+        data.setdefault('classification', self.page['classification'])
+        story = self._build_blocks(self.blocks, data)
+
+        # Drop the trailing spacer so the last block ends the document
+        if story and isinstance(story[-1], Spacer):
+            story.pop()
+        return story
+
+    def render(self, filename, data=None):
+        """Render the template to a PDF file and return the filename"""
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        doc_kwargs = {'pagesize': self.page['pagesize']}
+        if self.page['margins']:
+            for side, value in zip(('topMargin', 'rightMargin', 'bottomMargin', 'leftMargin'), self.page['margins']):
+                doc_kwargs[side] = value
+        doc = SimpleDocTemplate(filename, **doc_kwargs)
+        story = self.build_story(data)
+
+        if self.page['header_footer'] == 'unified':
+            from unified_templates import add_unified_header_footer
+            logo_path = self.page['logo_path'] if self.page['logo_path'] and os.path.exists(self.page['logo_path']) else None
+            classification = self.page['classification']
+
+            def on_page(canvas_obj, doc):
+                add_unified_header_footer(canvas_obj, doc, logo_path, classification)
+
+            doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
+        elif self.page['header_footer'] == 'professional':
+            from professional_templates import add_header_footer
+
+            def on_page(canvas_obj, doc):
+                add_header_footer(canvas_obj, doc, self.page['logo_path'], self.page['classification'], show_page_number=self.page['page_numbers'])
+
+            doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
+        elif callable(self.page['header_footer']):
+            draw = self.page['header_footer']
+
+            def on_page(canvas_obj, doc):
+                draw(canvas_obj, doc, self.page['logo_path'], self.page['classification'])
+
+            doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
+        else:
+            doc.build(story)
+        return filename
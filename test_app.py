@@ -90,7 +90,30 @@ def test_templates_generator():
         )
         assert os.path.exists(checklist_file), f"Checklist file not created: {checklist_file}"
         print(f"✓ Audit checklist created: {checklist_file}")
-        
+
+        # Professional compliance report (exported by the app) renders through the template engine
+        from professional_templates import create_professional_compliance_report
+        professional_file = create_professional_compliance_report(
+            "DG.1.1",
+            "Test Control",
+            "Data Governance",
+            [{'spec_id': 'DG.1.1.1', 'priority': 'P1'}],
+            {'status': 'Compliant', 'score': 90}
+        )
+        assert os.path.exists(professional_file), f"Report file not created: {professional_file}"
+        print(f"✓ Professional compliance report created: {professional_file}")
+
+        # Filled forms and data share templates share the engine
+        from fillable_forms import generate_pdf_from_form
+        from data_share_templates import create_data_share_agreement_template
+        filled_file = generate_pdf_from_form("evidence", {'notes': "Reviewed"}, "DG-001", "Test Control")
+        assert os.path.exists(filled_file), f"Filled form not created: {filled_file}"
+        os.remove(filled_file)
+        print(f"✓ Filled evidence form created: {filled_file}")
+        agreement_file = create_data_share_agreement_template()
+        assert os.path.exists(agreement_file), f"Agreement file not created: {agreement_file}"
+        print(f"✓ Data share agreement created: {agreement_file}")
+
         return True
     except Exception as e:
         print(f"✗ Templates generator error: {e}")
@@ -129,6 +152,250 @@ def test_ndmo_structure():
         traceback.print_exc()
         return False
 
+def test_smart_schema_analyzer():
+    """Test schema analysis in regular, streaming, incremental, multi-sheet and CSV mode"""
+    print("\nTesting smart schema analyzer...")
+    try:
+        import tempfile
+        import openpyxl
+        from smart_schema_analyzer import SmartSchemaAnalyzer
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            schema_path = os.path.join(tmp_dir, "schema.xlsx")
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.append(['customer_id', 'Email', None, 'created_date'])
+            for i in range(20):
+                ws.append([i, f'user{i}@example.com', None, '2024-01-01' if i % 2 else None])
+            wb.save(schema_path)
+            
+            analysis = SmartSchemaAnalyzer().analyze_schema(schema_path)
+            assert 'error' not in analysis, analysis.get('error')
+            assert analysis['total_columns'] == 4, "Empty columns should be counted"
+            assert analysis['column_analysis'][2]['column_name'] == 'Column_3'
+            assert analysis['column_analysis'][1]['detected_type'] == 'Email', "Email values should be detected"
+            print(f"✓ Schema analyzed: {analysis['total_columns']} columns, {analysis['total_fields']} rows")
+            
+            cached = SmartSchemaAnalyzer().analyze_schema(schema_path)
+            assert cached.get('from_cache'), "Re-analysis of the same file should hit the cache"
+            assert cached['column_analysis'] == analysis['column_analysis']
+            print("✓ Re-analysis served from the result cache")
+            
+            streaming = SmartSchemaAnalyzer(memory_budget_mb=0.001).analyze_schema(schema_path)
+            assert streaming.get('profiling_mode') == 'streaming', "Streaming mode should be used over budget"
+            for regular_col, streaming_col in zip(analysis['column_analysis'], streaming['column_analysis']):
+                for key in ('non_null_count', 'unique_count', 'completeness', 'detected_type'):
+                    assert regular_col[key] == streaming_col[key], f"{key} differs for {regular_col['column_name']}"
+            print("✓ Streaming profile matches in-memory profile")
+
+            import pandas as pd
+            from column_sketches import ColumnSketch, hash_values
+            ids = pd.Series([2 ** 60 + i for i in range(1000)])
+            assert len(set(hash_values(ids))) == len(set(hash_values(list(ids)))) == 1000
+            assert (hash_values(pd.Series([1, 2])) == hash_values(pd.Series([1.0, 2.0]))).all()
+            sketch = ColumnSketch('id')
+            sketch.update(ids)
+            assert sketch.distinct_count == 1000, sketch.distinct_count
+            print("✓ 64-bit IDs keep distinct hashes")
+
+            for row in ws.iter_rows(min_row=2, min_col=2, max_col=2):
+                row[0].value = row[0].value.replace('example.com', 'example.org')
+            ws['E1'] = 'notes'
+            wb.save(schema_path)
+            incremental = SmartSchemaAnalyzer(use_cache=False).analyze_schema_incremental(schema_path, analysis)
+            report = incremental['change_report']
+            assert report['changed_columns'] == ['Email'] and report['added_columns'] == ['notes'], report
+            assert incremental['column_analysis'][1]['fingerprint'] != analysis['column_analysis'][1]['fingerprint']
+            print("✓ Incremental re-analysis reports changed columns")
+            
+            orders = wb.create_sheet("orders")
+            orders.append(['order_id', 'amount'])
+            for i in range(5):
+                orders.append([i, i * 10.5])
+            wb.create_sheet("empty")
+            wb.save(schema_path)
+            
+            workbook = SmartSchemaAnalyzer().analyze_workbook(schema_path, max_workers=1)
+            assert list(workbook['tables']) == [ws.title, 'orders'], "Every non-empty sheet should be analyzed"
+            assert 'empty' in workbook['errors']
+            assert workbook['tables']['orders']['sheet_name'] == 'orders'
+            assert workbook['tables']['orders']['total_columns'] == 2
+            assert workbook['summary']['total_columns'] == 7
+            print(f"✓ Workbook analyzed: {workbook['summary']['total_tables']} tables")
+            
+            csv_path = os.path.join(tmp_dir, "schema.csv")
+            with open(csv_path, 'w') as f:
+                f.write("customer_id,Email,\n1,a@example.com,\n2,b@example.com,\n")
+            csv_analysis = SmartSchemaAnalyzer().analyze_schema(csv_path)
+            assert csv_analysis['columns'] == ['customer_id', 'Email', 'Column_3'], csv_analysis.get('columns')
+            print("✓ CSV schema analyzed through the reader layer")
+        
+        return True
+    except Exception as e:
+        print(f"✗ Smart schema analyzer error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_smart_data_processor():
+    """Test the data processing pipeline"""
+    print("\nTesting smart data processor...")
+    try:
+        import pandas as pd
+        from smart_data_processor import SmartDataProcessor
+        
+        df = pd.DataFrame({
+            'id': [1, 2, 2, 3, None],
+            'amount': [10.0, None, None, 5.0, 7.5]
+        })
+        schema = {'fields': [{'field_name': 'amount', 'detected_type': 'Numeric', 'is_required': True}]}
+        result = SmartDataProcessor(use_cache=False).process_data(df, schema)
+        assert result['success'], result.get('error')
+        assert df['amount'].isna().sum() == 2, "Input DataFrame should not be modified"
+        processed = result['processed_data']
+        assert len(processed) == 4, "Duplicate row should be removed"
+        assert processed['amount'].isna().sum() == 0, "Required numeric field should be filled"
+        assert result['initial_quality_metrics']['uniqueness'] == 0.8
+        assert result['memory_report']['peak_working_set_mb'] > 0
+        dtype_report = result['dtype_optimization']
+        assert dtype_report['memory_after_bytes'] < dtype_report['memory_before_bytes']
+        assert processed['amount'].sum() == 22.5, "Compacted dtypes must keep the values"
+        stages = result['stage_metrics']['stages']
+        assert [stage['stage'] for stage in stages] == ['load', 'validate', 'convert', 'analyze', 'improve', 'reanalyze', 'report']
+        assert stages[0]['rows'] == 5 and all(stage['wall_s'] >= 0 for stage in stages)
+        assert sum(1 for entry in result['processing_log'] if entry.get('metrics')) == len(stages)
+        print(f"✓ Processed {len(processed)} rows, overall score {result['quality_metrics']['overall_score']:.2f}")
+
+        mixed = SmartDataProcessor(use_cache=False).process_data(pd.DataFrame({'a': [1, '1', 1.0]}), {})
+        assert mixed['processed_data']['a'].tolist() == [1, '1'], "1 and '1' are different values"
+        print("✓ Mixed-type values are not removed as duplicates")
+
+        checked = SmartDataProcessor(use_cache=False).process_data(pd.DataFrame({
+            'email': ['a@example.com', 'not-an-email', 'b@example.com', None],
+            'status': ['Active', 'active', 'Active', 'Closed'],
+            'start_date': pd.to_datetime(['2024-01-01', '2024-02-01', '2024-03-01', '2024-04-01']),
+            'end_date': pd.to_datetime(['2024-01-31', '2024-01-15', '2024-03-31', None])
+        }), {'fields': [
+            {'field_name': 'email', 'detected_type': 'Email'},
+            {'field_name': 'status', 'detected_type': 'Text', 'constraints': [{'type': 'allowed_values', 'value': ['Active', 'Closed']}]}
+        ]})
+        column_quality = checked['initial_column_quality']
+        assert column_quality['email']['invalid'] == 1 and column_quality['status']['invalid'] == 1
+        assert column_quality['status']['inconsistent'] == 1, "'active' should be flagged as a spelling variant"
+        assert checked['initial_quality_metrics']['validity'] == 5 / 7
+        # 1 of 3 ordered date pairs plus 1 of 4 status spellings
+        assert checked['initial_quality_metrics']['consistency'] == 5 / 7
+        print("✓ Validity and consistency measured from the data")
+
+        from business_rules import load_rules
+        from ndmo_quality_standards import NDMOQualityStandards
+        rules = load_rules('{"rules": ['
+                           '{"id": "R1", "type": "range", "column": "amount", "min": 6},'
+                           '{"id": "R2", "type": "conditional", "when": {"type": "range", "column": "amount", "min": 7},'
+                           ' "then": {"type": "not_null", "column": "id"}}]}')
+        ruled = SmartDataProcessor(use_cache=False).process_data(df, schema, business_rules=rules)
+        rule_results = {rule['rule_id']: rule for rule in ruled['business_rules']}
+        assert rule_results['R1']['applicable'] == 3 and rule_results['R1']['failed'] == 1
+        assert rule_results['R2']['violations'][0]['row'] == 5, "Row 5 has amount 7.5 and no id"
+        compliance = NDMOQualityStandards().calculate_compliance_score({}, ruled['initial_quality_metrics'])
+        assert compliance['standard_scores']['BR001']['score'] == ruled['initial_quality_metrics']['business_rules']
+        print(f"✓ Business rules evaluated, pass rate {ruled['initial_quality_metrics']['business_rules']:.2f}")
+
+        exported = SmartDataProcessor(use_cache=False).process_data(df, schema, business_rules=rules, export_violations=True)
+        issues = {(check['check'], check['subject']): check for check in exported['violations']}
+        assert issues[('required_missing', 'amount')]['count'] == 2
+        assert [sample['row'] for sample in issues[('duplicate_row', 'row')]['sample']] == [3]
+        issue_rows = pd.read_csv(exported['violations_path'])
+        os.remove(exported['violations_path'])
+        assert len(issue_rows) == sum(check['count'] for check in exported['violations'])
+        print(f"✓ {len(issue_rows)} row-level issues sampled and exported")
+
+        near = SmartDataProcessor(use_cache=False).process_data(pd.DataFrame({
+            'name': ['Ahmed  Ali', 'ahmed ali.', 'أحمد علي', 'احمد على', 'Mohammed Al Otaibi', 'Mohammed Al-Otaibi', 'Sara Khalid'],
+            'phone': ['0551234567', '+966 55 123 4567', '0551234567', '٠٥٥١٢٣٤٥٦٧', '0551234567', '0551243567', '0559876543']
+        }), {'fields': [{'field_name': 'phone', 'detected_type': 'Phone'}]})
+        clusters = sorted(cluster['rows'] for cluster in near['near_duplicates']['sample_clusters'])
+        assert clusters == [[1, 2], [3, 4], [5, 6]], clusters
+        assert near['initial_quality_metrics']['entity_uniqueness'] == 4 / 7
+        compliance = NDMOQualityStandards().calculate_compliance_score({}, near['initial_quality_metrics'])
+        assert compliance['standard_scores']['DQ004']['score'] == 4 / 7
+        import numpy as np
+        from near_duplicates import _candidate_pairs
+        pairs, _ = _candidate_pairs(np.zeros((3, 32), dtype=np.uint64), np.zeros(3, dtype=np.int64))
+        assert pairs.tolist() == [[0, 1], [0, 2], [1, 2]], "Every pair in a bucket is a candidate"
+        print(f"✓ {near['near_duplicates']['clusters']} near-duplicate clusters found")
+
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_path = os.path.join(tmp_dir, "data.csv")
+            df.to_csv(data_path, index=False)
+            output_path = os.path.join(tmp_dir, "processed.csv")
+            in_memory = SmartDataProcessor(use_cache=False).process_data(data_path, schema, chunked=False)
+            chunked = SmartDataProcessor(use_cache=False).process_data(data_path, schema, output_path=output_path, chunked=True)
+            assert chunked['success'] and chunked['processing_mode'] == 'chunked', chunked.get('error')
+            assert chunked['quality_metrics'] == in_memory['quality_metrics']
+            assert chunked['initial_quality_metrics'] == in_memory['initial_quality_metrics']
+            assert len(pd.read_csv(output_path)) == len(in_memory['processed_data'])
+            print("✓ Chunked processing matches in-memory metrics")
+
+            from data_writers import export_processed_data
+            excel_path = export_processed_data(in_memory, 'xlsx')
+            assert export_processed_data(in_memory, 'xlsx') == excel_path, "Export should be built once per result"
+            assert pd.read_excel(excel_path).shape == in_memory['processed_data'].shape
+            parquet_path = export_processed_data(chunked, 'parquet')
+            assert len(pd.read_parquet(parquet_path)) == chunked['rows_written']
+            assert export_processed_data(chunked, 'csv') == output_path
+            from data_writers import release_result_files
+            release_result_files(in_memory)
+            release_result_files(chunked)
+            assert not os.path.exists(excel_path) and not os.path.exists(parquet_path)
+            assert os.path.exists(output_path), "A caller's output path is not a temporary file"
+            print("✓ Processed data exported as Excel, Parquet and CSV")
+
+            import openpyxl
+            from data_readers import iter_table_chunks, read_table, schema_dtypes
+            excel_path = os.path.join(tmp_dir, "contacts.xlsx")
+            wb = openpyxl.Workbook()
+            wb.active.append(['phone', 'national_id'])
+            wb.active.append([551234567, 1012345678])
+            wb.active.append([966501234567.0, None])
+            wb.save(excel_path)
+            dtypes = schema_dtypes({'fields': [
+                {'field_name': 'phone', 'detected_type': 'Phone'},
+                {'field_name': 'national_id', 'detected_type': 'Saudi National ID'}
+            ]})
+            for frame in (read_table(excel_path, dtype=dtypes), next(iter_table_chunks(excel_path, dtype=dtypes))):
+                assert frame['phone'].tolist() == ['551234567', '966501234567'], frame['phone'].tolist()
+                assert frame['national_id'].iloc[0] == '1012345678'
+            print("✓ Numeric phone and ID cells read from Excel as text")
+
+            from quality_monitor import DatasetMonitor, MonitorStore
+            monitor = DatasetMonitor('daily', schema)
+            processor = SmartDataProcessor(use_cache=False)
+            first = processor.monitor_batch(data_path, monitor)['run']
+            assert first['rows'] == 5 and first['new_duplicate_rows'] == 1
+            second = processor.monitor_batch(pd.DataFrame({'id': [3, 4], 'amount': [5.0, None]}), monitor)['run']
+            checks = {(flag['check'], flag['column']) for flag in second['drift']}
+            assert {('new_duplicates', None), ('completeness_drop', 'amount')} <= checks, checks
+            store = MonitorStore(os.path.join(tmp_dir, "monitoring"))
+            store.save(monitor)
+            loaded = store.load('daily')
+            assert store.datasets() == ['daily'] and loaded.total_rows == 7
+            # Rows of saved runs are still known after a reload; each save only writes its own runs' hashes
+            third = processor.monitor_batch(pd.DataFrame({'id': [3], 'amount': [5.0]}), loaded)['run']
+            assert third['new_duplicate_rows'] == 1, third
+            store.save(loaded)
+            hash_files = sorted(os.listdir(store._stem('daily') + '.hashes'))
+            assert hash_files == ['run_000001.npy', 'run_000002.npy', 'run_000003.npy'], hash_files
+            print(f"✓ Batch monitoring flagged {len(second['drift'])} drifts")
+
+        return True
+    except Exception as e:
+        print(f"✗ Smart data processor error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def test_file_structure():
     """Test file structure"""
     print("\nTesting file structure...")
@@ -177,6 +444,8 @@ def main():
     results.append(("Data Models", test_data_models()))
     results.append(("Templates Generator", test_templates_generator()))
     results.append(("NDMO Structure", test_ndmo_structure()))
+    results.append(("Smart Schema Analyzer", test_smart_schema_analyzer()))
+    results.append(("Smart Data Processor", test_smart_data_processor()))
     results.append(("Templates Directory", test_templates_directory()))
     
     print("\n" + "=" * 60)
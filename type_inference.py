@@ -0,0 +1,264 @@
+"""
+Type Inference
+Infers each column's semantic type from a bounded random sample of its values
+using compiled regex and parse tests, returning a type distribution and a
+confidence score instead of trusting the first value
+"""
+import re
+import numpy as np
+import pandas as pd
+
+DEFAULT_SAMPLE_SIZE = 500
+
+# Columns with at least this many values get a dedicated sample when the
+# shared row sample caught too few of them (sparse columns)
+MIN_COLUMN_SAMPLE = 50
+
+# Text columns with few distinct values are reported as Categorical
+CATEGORICAL_MAX_DISTINCT = 50
+CATEGORICAL_MAX_RATIO = 0.2
+
+# Two-sided 95% z-score for the Wilson lower bound used as confidence
+CONFIDENCE_Z = 1.96
+
+TYPE_NAMES = ['Boolean', 'Saudi National ID', 'IBAN', 'Email', 'DateTime', 'Phone', 'Numeric', 'Text']
+_TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+
+BOOLEAN_TOKENS = {'true', 'false', 'yes', 'no', 'y', 'n', 't', 'f', 'نعم', 'لا'}
+
+SAUDI_NATIONAL_ID_RE = re.compile(r'[12]\d{9}')
+IBAN_RE = re.compile(r'[A-Z]{2}\d{2}[A-Z0-9]{11,30}')
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+'-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+# Saudi mobile/landline numbers, international numbers with a +/00 prefix,
+# or digit groups separated by spaces, dashes or parentheses
+PHONE_RE = re.compile(
+    r'(?:(?:\+|00)966|0)\s?(?:5\d|1[1-7]|[2-4]\d|6\d|7\d)\d{7}'
+    r'|(?:\+|00)\d{7,14}'
+    r'|\+?\(?\d{1,4}\)?(?:[\s-]\(?\d{2,4}\)?){2,4}'
+)
+DATE_RE = re.compile(
+    r'(?:\d{4}[-/.]\d{1,2}[-/.]\d{1,2}|\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4})'
+    r'(?:[ T]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?'
+)
+
+def luhn_valid(digit_strings):
+    """Vectorized Luhn check for equal-length digit strings (Saudi ID checksum)"""
+    if len(digit_strings) == 0:
+        return np.zeros(0, dtype=bool)
+    digits = np.frombuffer(''.join(digit_strings).encode('ascii'), dtype=np.uint8).reshape(len(digit_strings), -1) - 48
+    digits = digits.astype(np.int64)
+    # Double every second digit from the right, ending with the leftmost digit
+    doubled = digits[:, -2::-2] * 2
+    digits[:, -2::-2] = np.where(doubled > 9, doubled - 9, doubled)
+    return digits.sum(axis=1) % 10 == 0
+
+def iban_valid(values):
+    """ISO 13616 mod-97 check"""
+    valid = []
+    for value in values:
+        rearranged = value[4:] + value[:4]
+        number = ''.join(str(int(ch, 36)) for ch in rearranged)
+        valid.append(int(number) % 97 == 1)
+    return np.array(valid, dtype=bool)
+
+def _match(text, pattern):
+    return np.array(text.str.fullmatch(pattern).fillna(False), dtype=bool)
+
+def _test_boolean(text):
+    return text.str.lower().isin(BOOLEAN_TOKENS).to_numpy()
+
+def _test_national_id(text):
+    result = _match(text, SAUDI_NATIONAL_ID_RE)
+    if result.any():
+        result[result] = luhn_valid(text[result].tolist())
+    return result
+
+def _test_iban(text):
+    compact = text.str.replace(' ', '', regex=False).str.upper()
+    result = _match(compact, IBAN_RE)
+    if result.any():
+        result[result] = iban_valid(compact[result].tolist())
+    return result
+
+def _test_email(text):
+    return _match(text, EMAIL_RE)
+
+def _test_phone(text):
+    return _match(text, PHONE_RE)
+
+def _test_datetime(text):
+    result = _match(text, DATE_RE)
+    if result.any():
+        parsed = pd.to_datetime(text[result], errors='coerce', format='mixed')
+        result[result] = np.array(parsed.notna(), dtype=bool)
+    return result
+
+def _test_numeric(text):
+    return pd.to_numeric(text.str.replace(',', '', regex=False), errors='coerce').notna().to_numpy()
+
+# Tests run in priority order; each value takes the first type whose test passes
+_VALUE_TESTS = [
+    ('Boolean', _test_boolean),
+    ('Saudi National ID', _test_national_id),
+    ('IBAN', _test_iban),
+    ('Email', _test_email),
+    # Dates before phones: '2024-01-05' is also a dash-separated digit group
+    ('DateTime', _test_datetime),
+    ('Phone', _test_phone),
+    ('Numeric', _test_numeric)
+]
+
+def _to_text(value):
+    if isinstance(value, (float, np.floating)) and float(value).is_integer() and abs(value) < 2 ** 53:
+        return str(int(value))
+    return str(value).strip()
+
+def classify_values(text):
+    """Return the type code of every value in a Series of strings"""
+    codes = np.full(len(text), _TYPE_CODES['Text'], dtype=np.int64)
+    pending = np.ones(len(text), dtype=bool)
+    for type_name, test in _VALUE_TESTS:
+        if not pending.any():
+            break
+        positions = np.flatnonzero(pending)
+        passed = test(text.iloc[positions])
+        codes[positions[passed]] = _TYPE_CODES[type_name]
+        pending[positions[passed]] = False
+    return codes
+
+def _wilson_lower_bound(successes, n, z=CONFIDENCE_Z):
+    if n == 0:
+        return 0.0
+    p = successes / n
+    denominator = 1 + z * z / n
+    centre = p + z * z / (2 * n)
+    margin = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+    return float((centre - margin) / denominator)
+
+def _summarize(type_counts, distinct_count):
+    """Turn per-type sample counts into the inferred type, confidence and distribution"""
+    n = int(type_counts.sum())
+    if n == 0:
+        return {'type': None, 'confidence': 0.0, 'distribution': {}, 'sample_size': 0}
+    distribution = {TYPE_NAMES[code]: round(int(count) / n, 4) for code, count in enumerate(type_counts) if count}
+    top_code = int(np.argmax(type_counts))
+    inferred = TYPE_NAMES[top_code]
+    if inferred == 'Text' and distinct_count <= CATEGORICAL_MAX_DISTINCT and distinct_count <= CATEGORICAL_MAX_RATIO * n:
+        inferred = 'Categorical'
+        distribution['Categorical'] = distribution.pop('Text')
+    return {
+        'type': inferred,
+        'confidence': round(_wilson_lower_bound(int(type_counts[top_code]), n), 4),
+        'distribution': distribution,
+        'sample_size': n
+    }
+
+def infer_sample_types(samples):
+    """Infer types for a list of per-column value samples (raw, non-null values)"""
+    column_ids = np.repeat(np.arange(len(samples)), [len(sample) for sample in samples])
+    text = pd.Series([_to_text(value) for sample in samples for value in sample], dtype=object)
+    # Each distinct string is classified once; categorical samples repeat heavily
+    value_ids, uniques = pd.factorize(text)
+    codes = classify_values(pd.Series(uniques, dtype=object))[value_ids]
+
+    counts = np.zeros((len(samples), len(TYPE_NAMES)), dtype=np.int64)
+    np.add.at(counts, (column_ids, codes), 1)
+    pairs = np.unique(column_ids * (len(uniques) + 1) + value_ids)
+    distinct = np.bincount(pairs // (len(uniques) + 1), minlength=len(samples))
+    return [_summarize(counts[i], int(distinct[i])) for i in range(len(samples))]
+
+def _sample_positions(length, size, rng):
+    if length <= size:
+        return np.arange(length)
+    return np.sort(rng.choice(length, size=size, replace=False))
+
+def infer_frame_types(df, sample_size=DEFAULT_SAMPLE_SIZE, random_state=0):
+    """Infer the semantic type of every DataFrame column (by position)
+
+    One random row sample is shared by all columns; sparse columns that are
+    under-represented in it get their own sample of non-null values. Numeric,
+    datetime and boolean dtypes are classified without string parsing.
+    """
+    rng = np.random.default_rng(random_state)
+    rows = df.iloc[_sample_positions(len(df), sample_size, rng)]
+    dtypes = df.dtypes.tolist()
+    sampled_counts = rows.notna().to_numpy().sum(axis=0)
+    samples = []
+    for position, dtype in enumerate(dtypes):
+        if sampled_counts[position] == 0 and len(rows) == len(df):
+            # Empty column; nothing to classify
+            samples.append(('Text', 0))
+            continue
+        column = rows.iloc[:, position].dropna()
+        if len(column) < MIN_COLUMN_SAMPLE and len(rows) < len(df):
+            full = df.iloc[:, position].dropna()
+            if len(full) > len(column):
+                column = full.iloc[_sample_positions(len(full), sample_size, rng)]
+
+        if pd.api.types.is_bool_dtype(dtype):
+            samples.append(('Boolean', len(column)))
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            samples.append(('DateTime', len(column)))
+        elif pd.api.types.is_numeric_dtype(dtype):
+            numbers = column.to_numpy(dtype=np.float64)
+            # Integral 10-digit values starting with 1 or 2 may be Saudi national IDs
+            candidates = (numbers == np.floor(numbers)) & (numbers >= 1e9) & (numbers < 3e9)
+            if candidates.any():
+                samples.append(column.tolist())
+            else:
+                samples.append(('Numeric', len(column)))
+        else:
+            samples.append(column.tolist())
+
+    inferred = [None] * len(samples)
+    text_positions = [i for i, sample in enumerate(samples) if isinstance(sample, list)]
+    for position, result in zip(text_positions, infer_sample_types([samples[i] for i in text_positions])):
+        inferred[position] = result
+    for position, sample in enumerate(samples):
+        if not isinstance(sample, list):
+            type_name, n = sample
+            counts = np.zeros(len(TYPE_NAMES), dtype=np.int64)
+            counts[_TYPE_CODES[type_name]] = n
+            inferred[position] = _summarize(counts, n)
+    return inferred
+
+class Reservoir:
+    """Fixed-size uniform random sample of a stream (Algorithm R), mergeable"""
+
+    def __init__(self, size=DEFAULT_SAMPLE_SIZE, random_state=0):
+        self.size = size
+        self.values = []
+        self.seen = 0
+        self.rng = np.random.default_rng(random_state)
+
+    def update(self, values):
+        values = list(values)
+        free = self.size - len(self.values)
+        if free > 0:
+            self.values.extend(values[:free])
+            self.seen += min(free, len(values))
+            values = values[free:]
+        if not values:
+            return
+        # Item i of the stream (1-based) replaces a random slot with probability size / i
+        positions = self.seen + 1 + np.arange(len(values))
+        slots = (self.rng.random(len(values)) * positions).astype(np.int64)
+        for value, slot in zip(values, slots):
+            if slot < self.size:
+                self.values[slot] = value
+        self.seen += len(values)
+
+    def merge(self, other):
+        """Combine two reservoirs into a uniform sample of both streams"""
+        total = self.seen + other.seen
+        if total == 0:
+            return self
+        take = min(self.size, len(self.values) + len(other.values))
+        from_self = int(self.rng.hypergeometric(self.seen, other.seen, take)) if self.seen and other.seen else (take if self.seen else 0)
+        from_self = min(from_self, len(self.values))
+        from_other = min(take - from_self, len(other.values))
+        picked = [self.values[i] for i in self.rng.choice(len(self.values), from_self, replace=False)]
+        picked += [other.values[i] for i in self.rng.choice(len(other.values), from_other, replace=False)]
+        self.values = picked
+        self.seen = total
+        return self
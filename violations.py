@@ -0,0 +1,133 @@
+"""
+Violations
+Row-level issue collection with bounded memory: every check (missing
+required values, duplicate rows, invalid formats, rule failures) keeps an
+exact count and a fixed-size reservoir sample of violating rows, however
+many rows fail. The full violation list can be streamed to a CSV file as
+checks run, one block at a time.
+"""
+import numpy as np
+import pandas as pd
+
+# Violating rows sampled per check
+VIOLATION_SAMPLE_SIZE = 100
+
+EXPORT_COLUMNS = ['check', 'subject', 'column', 'row', 'value']
+
+CHECK_DESCRIPTIONS = {
+    'required_missing': 'Required field is empty',
+    'duplicate_row': 'Exact duplicate of an earlier row',
+    'near_duplicate': 'Likely the same entity as an earlier row',
+    'invalid_format': 'Value does not match the expected type or constraints',
+    'inaccurate_value': 'Failed check digits or implausible date',
+    'rule_violation': 'Business rule not satisfied'
+}
+
+def _value_strings(values, positions):
+    """String form of values at positions; missing values become ''
+
+    values is a Series or array aligned with the rows, or a function of the positions.
+    """
+    if values is None:
+        return np.full(len(positions), '', dtype=object)
+    if callable(values):
+        return np.asarray(values(positions), dtype=object)
+    selected = values.iloc[positions] if isinstance(values, pd.Series) else pd.Series(np.asarray(values, dtype=object)[positions])
+    return np.asarray(selected.astype(object).where(selected.notna(), '').astype(str), dtype=object)
+
+class ViolationCollector:
+    """Exact counts and reservoir samples of violating rows per (check, subject)
+
+    Row numbers are 1-based data rows of the input (the header is not counted).
+    With export_path set, every violation is appended to that CSV as it is recorded.
+    """
+
+    def __init__(self, export_path=None, sample_size=VIOLATION_SAMPLE_SIZE, seed=0):
+        self.export_path = export_path
+        self.sample_size = sample_size
+        self.rng = np.random.default_rng(seed)
+        self.checks = {}
+        self._exported = False
+
+    def record(self, check, mask, row_offset=0, subject=None, column=None, values=None):
+        """Record violations given as a boolean row mask of a frame (or chunk) starting at row_offset
+
+        values supplies the offending values (see _value_strings); only sampled
+        and exported rows are converted to strings.
+        """
+        positions = np.flatnonzero(mask)
+        if len(positions) == 0:
+            return
+        subject = subject if subject is not None else (column or '')
+        key = (check, subject)
+        entry = self.checks.get(key)
+        if entry is None:
+            entry = self.checks[key] = {
+                'check': check,
+                'subject': subject,
+                'column': column or '',
+                'count': 0,
+                'rows': np.empty(0, dtype=np.int64),
+                'values': np.empty(0, dtype=object)
+            }
+        self._sample(entry, positions, row_offset, values)
+        entry['count'] += len(positions)
+        if self.export_path:
+            self._export(entry, positions, row_offset, values)
+
+    def _sample(self, entry, positions, row_offset, values):
+        """Algorithm R over a block: item t (0-based, over all blocks) replaces a random slot with probability k/(t+1)"""
+        k = self.sample_size
+        fill = min(max(k - len(entry['rows']), 0), len(positions))
+        if fill:
+            entry['rows'] = np.concatenate([entry['rows'], positions[:fill] + row_offset + 1])
+            entry['values'] = np.concatenate([entry['values'], _value_strings(values, positions[:fill])])
+        rest = positions[fill:]
+        if len(rest) == 0:
+            return
+        seen = entry['count'] + fill + np.arange(len(rest))
+        slots = self.rng.integers(0, seen + 1)
+        keep = slots < k
+        if keep.any():
+            # Fancy assignment keeps the last write per slot, as the sequential algorithm would
+            entry['rows'][slots[keep]] = rest[keep] + row_offset + 1
+            entry['values'][slots[keep]] = _value_strings(values, rest[keep])
+
+    def _export(self, entry, positions, row_offset, values):
+        block = pd.DataFrame({
+            'check': entry['check'],
+            'subject': entry['subject'],
+            'column': entry['column'],
+            'row': positions + row_offset + 1,
+            'value': _value_strings(values, positions)
+        }, columns=EXPORT_COLUMNS)
+        block.to_csv(self.export_path, mode='a' if self._exported else 'w', header=not self._exported, index=False)
+        self._exported = True
+
+    def finish_export(self):
+        """Make sure the export file exists (with just a header when nothing failed); returns its path"""
+        if self.export_path and not self._exported:
+            pd.DataFrame(columns=EXPORT_COLUMNS).to_csv(self.export_path, index=False)
+            self._exported = True
+        return self.export_path
+
+    def total(self):
+        return sum(entry['count'] for entry in self.checks.values())
+
+    def report(self):
+        """Per-check counts with the sampled rows in row order"""
+        report = []
+        for entry in self.checks.values():
+            order = np.argsort(entry['rows'], kind='stable')
+            report.append({
+                'check': entry['check'],
+                'description': CHECK_DESCRIPTIONS.get(entry['check'], ''),
+                'subject': entry['subject'],
+                'column': entry['column'],
+                'count': entry['count'],
+                'sample': [
+                    {'row': int(row), 'value': value}
+                    for row, value in zip(entry['rows'][order], entry['values'][order])
+                ]
+            })
+        return report